@@ -2,7 +2,13 @@
 CachyOS Multi-Updater GUI Package
 """
 
-# Re-export main entry point for backward compatibility
-from .core.main import main
-
 __all__ = ["main"]
+
+
+def __getattr__(name):
+    """Re-export main entry point for backward compatibility (imported lazily)"""
+    if name == "main":
+        from .core.main import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
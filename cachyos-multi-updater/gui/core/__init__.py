@@ -2,10 +2,8 @@
 Core functionality for CachyOS Multi-Updater GUI
 """
 
-from .main import main
-from .window import MainWindow
 from .config_manager import ConfigManager
-from .i18n import init_i18n, t, GUIi18n
+from .i18n import init_i18n, t, t_many, current_language, GUIi18n
 from . import constants
 
 __all__ = [
@@ -14,6 +12,21 @@ __all__ = [
     "ConfigManager",
     "init_i18n",
     "t",
+    "t_many",
+    "current_language",
     "GUIi18n",
     "constants",
 ]
+
+
+def __getattr__(name):
+    """Import the Qt entry points lazily (keeps core.i18n etc. cheap to import)"""
+    if name == "main":
+        from .main import main
+
+        return main
+    if name == "MainWindow":
+        from .window import MainWindow
+
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,10 +4,38 @@ CachyOS Multi-Updater - Config Manager
 Handles reading and writing config.conf file
 """
 
+import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import Dict, Optional
 
 
+def write_file_atomic(path: Path, data: bytes) -> None:
+    """Replace a file's contents in one step (temp file + fsync + os.replace)
+
+    Keeps the existing file mode; readers never see a partial file.
+    """
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 class ConfigManager:
     """Manages config.conf file reading and writing.
 
@@ -227,6 +255,67 @@ class ConfigManager:
         config[key] = value
         return self.save_config(config)
 
+    def update(self, values: Dict[str, Optional[str]]) -> bool:
+        """Apply several config changes with a single atomic write.
+
+        Only the given keys are touched; all other lines and comments are
+        kept as they are. A value of None removes the key from the file.
+        Nothing is written if the file already matches.
+
+        Args:
+            values: Dictionary of config keys to set (None to remove)
+
+        Returns:
+            True if config.conf is up to date, False otherwise
+        """
+        try:
+            lines = []
+            if self.config_file.exists():
+                with open(self.config_file, "r", encoding="utf-8") as f:
+                    lines = f.readlines()
+
+            new_lines = []
+            seen_keys = set()
+            changed = False
+
+            for line in lines:
+                stripped = line.strip()
+                if stripped and not stripped.startswith("#") and "=" in stripped:
+                    key = stripped.split("=", 1)[0].strip()
+                    if key in values:
+                        seen_keys.add(key)
+                        value = values[key]
+                        if value is None:
+                            changed = True
+                            continue
+                        new_line = f"{key}={value}\n"
+                        changed = changed or new_line != line
+                        new_lines.append(new_line)
+                        continue
+                new_lines.append(line)
+
+            # Add new keys
+            for key, value in sorted(values.items()):
+                if key not in seen_keys and value is not None:
+                    if new_lines and not new_lines[-1].endswith("\n"):
+                        new_lines[-1] += "\n"
+                    new_lines.append(f"{key}={value}\n")
+                    changed = True
+
+            if not changed:
+                return True
+
+            write_file_atomic(self.config_file, "".join(new_lines).encode("utf-8"))
+
+            # Invalidate cache after save
+            self._config_cache = None
+            self._config_file_mtime = None
+
+            return True
+        except Exception as e:
+            print(f"Error updating config: {e}")
+            return False
+
     def get_password(self) -> Optional[str]:
         """
         Get stored sudo password (from secure storage, not config)
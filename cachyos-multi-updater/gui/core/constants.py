@@ -40,6 +40,9 @@ NETWORK_CHECK_HOST = "8.8.8.8"
 NETWORK_CHECK_PORT = 53
 NETWORK_CHECK_TIMEOUT = 3
 
+# Reuse GitHub version check results for this long (seconds)
+VERSION_CHECK_CACHE_TTL_SECONDS = 60
+
 # UI constants
 SPINNER_UPDATE_INTERVAL_MS = 100
 SPINNER_FRAME_COUNT = 10
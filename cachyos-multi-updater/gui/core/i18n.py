@@ -7,7 +7,7 @@ Handles translations for the GUI
 import os
 import re
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 
 class GUIi18n:
@@ -117,6 +117,18 @@ class GUIi18n:
         """
         return self.translations.get(key, default or key)
 
+    def t_many(self, pairs: Iterable[Tuple[str, Optional[str]]]) -> Tuple[str, ...]:
+        """Get translations for several keys at once.
+
+        Args:
+            pairs: (key, default) pairs, as passed to t()
+
+        Returns:
+            Tuple of translated strings in the same order
+        """
+        translations = self.translations
+        return tuple(translations.get(key, default or key) for key, default in pairs)
+
     def set_language(self, lang: str) -> None:
         """Set current language and reload translations.
 
@@ -142,6 +154,20 @@ def init_i18n(script_dir: str) -> None:
     _i18n_instance = GUIi18n(script_dir)
 
 
+def t_many(pairs: Iterable[Tuple[str, Optional[str]]]) -> Tuple[str, ...]:
+    """Get translations for several (key, default) pairs"""
+    if _i18n_instance:
+        return _i18n_instance.t_many(pairs)
+    return tuple(default or key for key, default in pairs)
+
+
+def current_language() -> Optional[str]:
+    """Get active language code (None before init_i18n)"""
+    if _i18n_instance:
+        return _i18n_instance.current_lang
+    return None
+
+
 def t(key: str, default: Optional[str] = None) -> str:
     """Get translation"""
     if _i18n_instance:
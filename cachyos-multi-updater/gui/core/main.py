@@ -6,6 +6,7 @@ Qt-based GUI wrapper for update-all.sh
 
 import sys
 import os
+import re
 from pathlib import Path
 
 # Suppress Qt QDBus warnings (harmless but annoying)
@@ -17,13 +18,28 @@ if str(gui_dir) not in sys.path:
     sys.path.insert(0, str(gui_dir))
 
 from PyQt6.QtWidgets import QApplication, QMessageBox  # noqa: E402
-from PyQt6.QtCore import Qt, qInstallMessageHandler  # noqa: E402
+from PyQt6.QtCore import Qt, QTimer, qInstallMessageHandler  # noqa: E402
 
 # Initialize i18n before importing window
 from .i18n import init_i18n, t  # noqa: E402
-from .window import MainWindow  # noqa: E402
-from .config_manager import ConfigManager  # noqa: E402
-from ..ui.theme_manager import ThemeManager  # noqa: E402
+
+# Qt messages to drop (QDBus warnings and portal errors), matched in one pass
+_QT_MESSAGE_FILTER = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            (
+                "QDBusError",
+                "qt.qpa.services",
+                "Failed to register with host portal",
+                "org.freedesktop.portal",
+                "org.kde.kioclient",
+                "Could not register app ID",
+                "App info not found",
+            ),
+        )
+    )
+)
 
 
 def get_script_dir() -> str:
@@ -40,8 +56,8 @@ def get_script_dir() -> str:
     if script_dir and Path(script_dir).exists():
         return script_dir
 
-    # Try to find update-all.sh in parent directory (gui/ -> cachyos-multi-updater/)
-    current_dir = Path(__file__).parent.parent.absolute()
+    # Try to find update-all.sh above the gui package (gui/core/ -> project root)
+    current_dir = Path(__file__).resolve().parent.parent.parent
     if (current_dir / "update-all.sh").exists():
         return str(current_dir)
 
@@ -65,16 +81,7 @@ def main() -> None:
     # Suppress Qt QDBus warnings and other Qt messages
     def qt_message_handler(msg_type, context, message):
         # Filter out QDBus warnings and portal errors
-        message_str = str(message) if message else ""
-        if (
-            "QDBusError" in message_str
-            or "qt.qpa.services" in message_str
-            or "Failed to register with host portal" in message_str
-            or "org.freedesktop.portal" in message_str
-            or "org.kde.kioclient" in message_str
-            or "Could not register app ID" in message_str
-            or "App info not found" in message_str
-        ):
+        if message and _QT_MESSAGE_FILTER.search(str(message)):
             return
         # Print other messages normally (optional, can be removed)
         # print(message)
@@ -109,6 +116,16 @@ def main() -> None:
         )
         sys.exit(1)
 
+    # Window, theme and config modules are imported once the QApplication
+    # exists and the script directory has been validated
+    from .window import MainWindow
+    from .config_manager import ConfigManager
+    from ..ui.theme_manager import ThemeManager
+    from ..utils.debug_logger import DebugLogger
+
+    # Log to logs/gui/ from the first message on (the theme manager logs too)
+    DebugLogger.set_script_dir(script_dir)
+
     # Apply theme
     config_manager = ConfigManager(script_dir)
     theme_mode = config_manager.get("GUI_THEME", "auto")
@@ -117,6 +134,7 @@ def main() -> None:
     # Create and show main window
     window = MainWindow(script_dir)
     window.show()
+    QTimer.singleShot(0, window.finish_init)
 
     sys.exit(app.exec())
 
@@ -10,7 +10,6 @@ from PyQt6.QtWidgets import QMessageBox, QDialog
 from PyQt6.QtCore import QProcess, QThread, pyqtSignal
 
 from ..utils import UpdateRunner, UpdateCheckResult, get_logger
-from ..dialogs import UpdateConfirmationDialog, SudoDialog
 from .i18n import t
 
 
@@ -561,6 +560,8 @@ class UpdateHandler:
             except Exception:
                 pass
             try:
+                from ..dialogs import UpdateConfirmationDialog
+
                 dialog = UpdateConfirmationDialog(self.window)
                 result = dialog.exec()
                 try:
@@ -592,6 +593,8 @@ class UpdateHandler:
                 pass
 
         # Ask for sudo password if needed
+        from ..dialogs import SudoDialog
+
         sudo_dialog = SudoDialog(self.window)
         if sudo_dialog.exec() != QDialog.DialogCode.Accepted:
             return
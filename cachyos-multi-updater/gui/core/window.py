@@ -34,7 +34,6 @@ from PyQt6.QtGui import QTextCharFormat, QColor, QFont, QTextCursor, QResizeEven
 # Import from new structure
 from ..widgets import ClickableLabel
 from ..ui import animate_dialog_show
-from ..dialogs import ConfigDialog, SudoDialog
 from ..utils import UpdateRunner, get_logger, DebugLogger
 from .config_manager import ConfigManager
 from .i18n import t
@@ -141,6 +140,18 @@ class MainWindow(WindowUIMixin, WindowHandlersMixin, QMainWindow):
         # KRITISCH: Fenstergröße laden und speichern
         self._load_window_geometry()
 
+        # Background work (version check, spinner) starts in finish_init()
+        # once the event loop runs, so the window paints first
+
+    def finish_init(self) -> None:
+        """Start background work after the window is shown
+
+        Scheduled by main() with QTimer.singleShot(0, ...) so it runs on the
+        first event loop iteration. Safe to call more than once.
+        """
+        if self.spinner_timer is not None:
+            return
+
         # Check for updates in background
         self.check_version_async()
 
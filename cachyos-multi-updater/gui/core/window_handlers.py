@@ -21,7 +21,6 @@ from PyQt6.QtGui import QTextCharFormat, QColor, QFont, QTextCursor, QFontDataba
 
 from ..widgets import get_fa_icon, apply_fa_font, FA_ICONS, ClickableLabel
 from ..ui import animate_dialog_show
-from ..dialogs import ConfigDialog, SudoDialog, UpdateDialog, UpdateConfirmationDialog
 from ..utils import UpdateRunner, get_logger, VersionChecker
 from .i18n import t
 
@@ -71,6 +70,8 @@ class WindowHandlersMixin:
 
     def show_settings(self: "MainWindow") -> None:
         """Show settings dialog"""
+        from ..dialogs import ConfigDialog
+
         dialog = ConfigDialog(str(self.script_dir), self)
         # Animate dialog appearance
         if animate_dialog_show is not None:
@@ -698,26 +699,8 @@ class WindowHandlersMixin:
             message += f": v{self.latest_github_version}"
         message += f"\n{t('gui_version_click_to_update', 'Click to update')}"
 
-        toast = show_toast(self, message, duration=5000)
-
-        # Make toast clickable
-        def on_toast_clicked():
-            self._on_version_label_clicked_update()
-
-        if hasattr(toast.label, "clicked"):
-            toast.label.clicked.connect(on_toast_clicked)
-        else:
-            from ..widgets import ClickableLabel
-
-            clickable_label = ClickableLabel(toast.label.text(), toast.label.parent())
-            clickable_label.setStyleSheet(toast.label.styleSheet())
-            clickable_label.setFont(toast.label.font())
-            clickable_label.clicked.connect(on_toast_clicked)
-            layout = toast.label.parent().layout()
-            if layout:
-                layout.replaceWidget(toast.label, clickable_label)
-                toast.label.deleteLater()
-                toast.label = clickable_label
+        toast = show_toast(self, message, duration=5000, clickable=True)
+        toast.clicked.connect(self._on_version_label_clicked_update)
 
     def check_version_manual(self: "MainWindow"):
         """Manually check for version updates"""
@@ -787,6 +770,8 @@ class WindowHandlersMixin:
                     self.status_label.setText("100%")
                 # Show UpdateConfirmationDialog
                 try:
+                    from ..dialogs import UpdateConfirmationDialog
+
                     dialog = UpdateConfirmationDialog(self)
                     QApplication.processEvents()
                     result = dialog.exec()
@@ -954,7 +939,8 @@ class WindowHandlersMixin:
 
     def _on_version_label_clicked_update(self: "MainWindow"):
         """Handle version label click when update is available - open update dialog"""
-        # UpdateDialog ist bereits in Zeile 24 importiert
+        from ..dialogs import UpdateDialog
+
         dialog = UpdateDialog(
             self.script_dir,
             self.script_version,
@@ -10,7 +10,6 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QCheckBox,
     QSpinBox,
     QPushButton,
     QGroupBox,
@@ -18,6 +17,7 @@ from PyQt6.QtWidgets import (
     QFileDialog,
     QComboBox,
     QTextEdit,
+    QPlainTextEdit,
     QWidget,
     QFormLayout,
     QMessageBox,
@@ -27,22 +27,247 @@ from PyQt6.QtWidgets import (
     QListWidgetItem,
 )
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap, QFont
+import functools
+import json
 import os
+import platform
+import re
 import shlex
+import shutil
 import subprocess
+import time
+from datetime import datetime
+from typing import Optional, Tuple
 
 # Import from new structure
-from ..core.config_manager import ConfigManager
-from ..core.i18n import t
-from ..widgets import get_fa_icon, apply_fa_font
-from ..utils import get_logger
+from ..core.config_manager import ConfigManager, write_file_atomic
+from ..core.constants import (
+    EXECUTABLE_PERMISSIONS,
+    VERSION_CHECK_CACHE_TTL_SECONDS,
+)
+from ..core.i18n import t, t_many, current_language
+from ..ui.theme_manager import ThemeManager
+from ..widgets import FACheckBox, create_fa_button
+from ..utils import get_logger, PasswordManager, VersionChecker
+
+_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+$")
+_SCRIPT_VERSION_RE = re.compile(r'["\']([0-9.]+)["\']')
+_SCRIPT_VERSION_MARKER = "readonly SCRIPT_VERSION="
+# Config file spelling of a bool, indexed by the bool itself
+_BOOL_STR = ("false", "true")
+
+
+@functools.lru_cache(maxsize=8)
+def _read_version_file(path: str, mtime_ns: int) -> str:
+    """Read version from a VERSION file (cached per path and mtime)"""
+    version = Path(path).read_text(encoding="utf-8").strip()
+    return version if _VERSION_RE.match(version) else "unknown"
+
+
+@functools.lru_cache(maxsize=8)
+def _read_script_version(path: str, mtime_ns: int) -> str:
+    """Read SCRIPT_VERSION from update-all.sh (cached per path and mtime)"""
+    content = Path(path).read_text(encoding="utf-8", errors="ignore")
+    idx = content.find(_SCRIPT_VERSION_MARKER)
+    while idx >= 0:
+        # Only look at the rest of the assignment line
+        end = content.find("\n", idx)
+        if end < 0:
+            end = len(content)
+        match = _SCRIPT_VERSION_RE.search(content, idx, end)
+        if match:
+            return match.group(1)
+        idx = content.find(_SCRIPT_VERSION_MARKER, end)
+    return "unknown"
+
+
+@functools.lru_cache(maxsize=32)
+def _icon_variations(icon_name: str) -> Tuple[str, ...]:
+    """Theme icon names to try for icon_name, in order and without duplicates"""
+    return tuple(
+        dict.fromkeys(
+            (
+                icon_name,
+                icon_name.replace("-", "_"),
+                icon_name.replace("_", "-"),
+                f"applications-{icon_name}",
+                f"system-{icon_name}",
+            )
+        )
+    )
+
+
+_ICON_PREVIEW_SIZES = ("64x64", "48x48", "32x32", "scalable")
+_ICON_PREVIEW_FILES = ("icon.png", "icon.svg", "icon.xpm")
+
+
+def _list_dir_names(path: str) -> frozenset:
+    """Names in a directory, or an empty set if it cannot be listed"""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+_VERSION_TAG_RE = re.compile(r"^v\d+(\.\d+)*$")
+
+
+def _list_version_tags(git_dir: Path) -> set:
+    """List vX.Y.Z tags by reading the git ref store directly
+
+    Reads loose refs from refs/tags and packed refs from packed-refs,
+    which avoids spawning a git process.
+    """
+    tags = set()
+    tags_dir = git_dir / "refs" / "tags"
+    if tags_dir.is_dir():
+        tags.update(path.name for path in tags_dir.iterdir())
+    packed_refs = git_dir / "packed-refs"
+    if packed_refs.is_file():
+        for line in packed_refs.read_text(encoding="utf-8").splitlines():
+            _, _, ref = line.partition(" refs/tags/")
+            if ref:
+                tags.add(ref)
+    return {tag for tag in tags if _VERSION_TAG_RE.match(tag)}
+
+
+# Desktop Entry Specification escapes (single pass, so no ordering issues)
+_DESKTOP_ENTRY_ESCAPES = str.maketrans(
+    {
+        "\\": "\\\\",
+        "\n": "\\n",
+        "\r": "\\r",
+        "=": "\\=",
+        "[": "\\[",
+        "]": "\\]",
+        ";": "\\;",
+    }
+)
+
+# Cleanup option checkboxes on the advanced tab:
+# (attribute, label key, label default, tooltip key, tooltip default)
+_CLEANUP_CHECKS = (
+    (
+        "cleanup_orphans",
+        "gui_cleanup_orphans",
+        "Remove Orphan Packages",
+        "gui_cleanup_orphans_tooltip",
+        "Remove packages that are no longer needed",
+    ),
+    (
+        "cleanup_cache",
+        "gui_cleanup_cache",
+        "Clean Package Cache",
+        "gui_cleanup_cache_tooltip",
+        "Clean package manager cache",
+    ),
+    (
+        "cleanup_temp",
+        "gui_cleanup_temp",
+        "Remove Temporary Files",
+        "gui_cleanup_temp_tooltip",
+        "Remove temporary files from /tmp",
+    ),
+)
+
+
+class ConfigSaveThread(QThread):
+    """Thread for writing config.conf off the UI thread"""
+
+    finished = pyqtSignal(bool)  # success
+
+    def __init__(self, config_manager: ConfigManager, config: dict, parent=None):
+        super().__init__(parent)
+        self.config_manager = config_manager
+        self.config = config
+
+    def run(self):
+        """Write config file"""
+        self.finished.emit(self.config_manager.save_config(self.config))
 
 
 class ConfigDialog(QDialog):
     """Configuration dialog"""
 
+    # Checkbox attribute -> boolean config key and its default
+    _CHECKBOX_KEYS = (
+        ("enable_system", "ENABLE_SYSTEM_UPDATE", "true"),
+        ("enable_aur", "ENABLE_AUR_UPDATE", "true"),
+        ("enable_cursor", "ENABLE_CURSOR_UPDATE", "true"),
+        ("enable_adguard", "ENABLE_ADGUARD_UPDATE", "true"),
+        ("enable_flatpak", "ENABLE_FLATPAK_UPDATE", "true"),
+        ("enable_notifications", "ENABLE_NOTIFICATIONS", "true"),
+        ("enable_colors", "ENABLE_COLORS", "true"),
+        ("dry_run", "DRY_RUN", "false"),
+        ("enable_auto_update", "ENABLE_AUTO_UPDATE", "false"),
+        ("pacman_sync", "PACMAN_SYNC", "true"),
+        ("pacman_refresh", "PACMAN_REFRESH", "true"),
+        ("pacman_upgrade", "PACMAN_UPGRADE", "true"),
+        ("pacman_noconfirm", "PACMAN_NOCONFIRM", "true"),
+        ("cleanup_orphans", "CLEANUP_ORPHANS", "true"),
+        ("cleanup_cache", "CLEANUP_CACHE", "true"),
+        ("cleanup_temp", "CLEANUP_TEMP_FILES", "true"),
+    )
+
+    # Combo box attribute -> config key, value per item index, default value
+    _COMBO_KEYS = (
+        (
+            "cleanup_aggressiveness",
+            "CLEANUP_AGGRESSIVENESS",
+            ("safe", "moderate", "aggressive"),
+            "moderate",
+        ),
+        (
+            "cleanup_timing",
+            "CLEANUP_TIMING",
+            ("after_updates", "manual", "never"),
+            "after_updates",
+        ),
+        (
+            "icon_cache_update",
+            "ICON_CACHE_UPDATE",
+            ("both", "after_shortcut", "after_updates", "manual"),
+            "both",
+        ),
+    )
+
+    # Icon preview stylesheet, indexed by "is dark theme"
+    _PREVIEW_STYLES = (
+        "border: 1px solid #cccccc; border-radius: 4px; background-color: #f0f0f0;",
+        "border: 1px solid #555555; border-radius: 4px; background-color: #2b2b2b;",
+    )
+
+    # Translated strings shared by the error paths and the update tab:
+    # name -> (key, default), translated once per language by _strings()
+    _STRING_KEYS = {
+        "error": ("gui_error", "Error"),
+        "update_failed": ("gui_update_failed", "Update Failed"),
+        "version_check_failed": ("gui_version_check_failed", "Version check failed"),
+        "update_available": ("gui_update_available", "Update available!"),
+        "version_up_to_date": ("gui_version_up_to_date", "Up to date"),
+        "version_dev": ("gui_version_dev", "Development version (local is newer)"),
+    }
+    _STRINGS = None
+    _STRINGS_LANG = None
+
+    @classmethod
+    def _strings(cls) -> dict:
+        """Return the shared dialog strings for the current language
+
+        The language is checked on every call, so the table is rebuilt if it
+        changes while the dialog is open.
+        """
+        lang = current_language()
+        if cls._STRINGS is None or cls._STRINGS_LANG != lang:
+            cls._STRINGS = dict(
+                zip(cls._STRING_KEYS, t_many(cls._STRING_KEYS.values()))
+            )
+            cls._STRINGS_LANG = lang
+        return cls._STRINGS
+
     def __init__(self, script_dir: str, parent=None):
         super().__init__(parent)
         self.logger = get_logger()
@@ -50,7 +275,41 @@ class ConfigDialog(QDialog):
         try:
             self.script_dir = script_dir
             self.config_manager = ConfigManager(script_dir)
-            self.config = self.config_manager.load_config()
+            self.config = self._read_config()
+            # (repo, script_dir), monotonic timestamp, latest version, error
+            self._version_cache = None
+            # Shared VersionChecker (keeps its HTTP session alive between checks)
+            self._version_checker = None
+            # Background config write started by save_and_close()
+            self._save_thread = None
+            # Reused for set_version / save results (see _show_message)
+            self._msgbox = QMessageBox(self)
+            self._msgbox.setStandardButtons(QMessageBox.StandardButton.Ok)
+            # Resolved system icon previews (icon name -> QPixmap or None),
+            # valid for the theme stored in _icon_cache_theme
+            self._icon_pixmap_cache = {}
+            self._icon_cache_theme = None
+            # Theme the icon preview stylesheet was last set for
+            self._preview_style_theme = None
+            # Shortcut creation paths (resolved once per dialog)
+            script_dir_path = Path(script_dir)
+            self._script_abs = (script_dir_path / "update-all.sh").absolute()
+            self._gui_script_abs = (script_dir_path / "gui" / "main.py").absolute()
+            self._gui_script_exists = self._gui_script_abs.exists()
+            self._desktop_dir = next(
+                (
+                    path
+                    for path in (
+                        Path.home() / "Desktop",
+                        Path.home() / "Schreibtisch",
+                        Path.home() / "desktop",
+                    )
+                    if path.is_dir()
+                ),
+                None,
+            )
+            # Icon theme directories searched for on-disk icon previews
+            self._icon_search_paths = QIcon.themeSearchPaths()
             self.setWindowTitle(t("gui_settings", "Settings"))
             self.setMinimumWidth(600)
             self.setMinimumHeight(500)
@@ -148,31 +407,25 @@ class ConfigDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.setContentsMargins(12, 12, 12, 12)
 
-        icon, text = get_fa_icon(
-            "undo", t("gui_reset_to_defaults", "Reset to Defaults")
+        reset_btn = create_fa_button(
+            "undo",
+            t("gui_reset_to_defaults", "Reset to Defaults"),
+            self.reset_to_defaults,
         )
-        reset_btn = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(reset_btn)
-        reset_btn.clicked.connect(self.reset_to_defaults)
         button_layout.addWidget(reset_btn)
 
         button_layout.addStretch()
 
-        icon, text = get_fa_icon("times", t("gui_cancel", "Cancel"))
-        cancel_btn = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(cancel_btn)
-        cancel_btn.clicked.connect(self.reject)
+        cancel_btn = create_fa_button("times", t("gui_cancel", "Cancel"), self.reject)
         button_layout.addWidget(cancel_btn)
 
-        icon, text = get_fa_icon("save", t("gui_save", "Save"))
-        save_btn = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(save_btn)
-        save_btn.clicked.connect(self.save_and_close)
-        save_btn.setDefault(True)
-        button_layout.addWidget(save_btn)
+        self.save_btn = create_fa_button(
+            "save",
+            t("gui_save", "Save"),
+            self.save_and_close,
+            default=True,
+        )
+        button_layout.addWidget(self.save_btn)
 
         layout.addLayout(button_layout)
         self.setLayout(layout)
@@ -190,15 +443,6 @@ class ConfigDialog(QDialog):
         group = QGroupBox(t("gui_update_components", "Update Components"))
         group_layout = QVBoxLayout()
 
-        # Use Font Awesome checkboxes for consistency
-        try:
-            from ..widgets import FACheckBox
-        except ImportError:
-            try:
-                from gui.widgets import FACheckBox
-            except ImportError:
-                FACheckBox = QCheckBox  # Fallback
-
         self.enable_system = FACheckBox(t("system_updates", "System Updates (pacman)"))
         self.enable_aur = FACheckBox(t("aur_updates", "AUR Updates (yay/paru)"))
         self.enable_cursor = FACheckBox(t("cursor_editor_update", "Cursor Editor Update"))
@@ -382,15 +626,6 @@ class ConfigDialog(QDialog):
         location_layout = QVBoxLayout()
         location_layout.setSpacing(8)
 
-        # Use Font Awesome checkboxes for consistency
-        try:
-            from ..widgets import FACheckBox
-        except ImportError:
-            try:
-                from gui.widgets import FACheckBox
-            except ImportError:
-                FACheckBox = QCheckBox  # Fallback
-
         self.shortcut_app_menu = FACheckBox(
             t("gui_shortcut_app_menu", "Application Menu")
         )
@@ -463,15 +698,6 @@ class ConfigDialog(QDialog):
         options_info.setWordWrap(True)
         options_layout.addWidget(options_info)
 
-        # Use Font Awesome checkboxes for consistency
-        try:
-            from ..widgets import FACheckBox
-        except ImportError:
-            try:
-                from gui.widgets import FACheckBox
-            except ImportError:
-                FACheckBox = QCheckBox  # Fallback
-
         self.enable_notifications = FACheckBox(
             t("gui_enable_notifications", "Enable Notifications")
         )
@@ -537,11 +763,11 @@ class ConfigDialog(QDialog):
         self.log_dir.setToolTip(
             t("gui_log_dir_tooltip", "Directory where log files are stored")
         )
-        icon, text = get_fa_icon("folder-open", t("gui_browse", "Browse..."))
-        log_browse = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(log_browse)
-        log_browse.clicked.connect(lambda: self.browse_directory(self.log_dir))
+        log_browse = create_fa_button(
+            "folder-open",
+            t("gui_browse", "Browse..."),
+            lambda: self.browse_directory(self.log_dir),
+        )
         log_layout.addWidget(self.log_dir)
         log_layout.addWidget(log_browse)
         form.addRow(t("gui_log_directory", "Log Directory:"), log_layout)
@@ -552,11 +778,11 @@ class ConfigDialog(QDialog):
         self.stats_dir.setToolTip(
             t("gui_stats_dir_tooltip", "Directory where statistics files are stored")
         )
-        icon, text = get_fa_icon("folder-open", t("gui_browse", "Browse..."))
-        stats_browse = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(stats_browse)
-        stats_browse.clicked.connect(lambda: self.browse_directory(self.stats_dir))
+        stats_browse = create_fa_button(
+            "folder-open",
+            t("gui_browse", "Browse..."),
+            lambda: self.browse_directory(self.stats_dir),
+        )
         stats_layout.addWidget(self.stats_dir)
         stats_layout.addWidget(stats_browse)
         form.addRow(t("gui_stats_directory", "Stats Directory:"), stats_layout)
@@ -585,15 +811,6 @@ class ConfigDialog(QDialog):
         pacman_info.setWordWrap(True)
         pacman_layout.addWidget(pacman_info)
 
-        # Use Font Awesome checkboxes for consistency
-        try:
-            from ..widgets import FACheckBox
-        except ImportError:
-            try:
-                from gui.widgets import FACheckBox
-            except ImportError:
-                FACheckBox = QCheckBox  # Fallback
-
         self.pacman_sync = FACheckBox(t("gui_pacman_sync", "Sync (-S)"))
         self.pacman_refresh = FACheckBox(t("gui_pacman_refresh", "Refresh (-y)"))
         self.pacman_upgrade = FACheckBox(t("gui_pacman_upgrade", "Upgrade (-u)"))
@@ -676,15 +893,6 @@ class ConfigDialog(QDialog):
         sudo_password_layout.addWidget(self.sudo_password)
         sudo_layout.addLayout(sudo_password_layout)
 
-        # Use Font Awesome checkboxes for consistency
-        try:
-            from ..widgets import FACheckBox
-        except ImportError:
-            try:
-                from gui.widgets import FACheckBox
-            except ImportError:
-                FACheckBox = QCheckBox  # Fallback
-
         self.save_sudo_password = FACheckBox(
             t("gui_save_password", "Save password (encrypted)")
         )
@@ -766,11 +974,11 @@ class ConfigDialog(QDialog):
         self.script_path.setToolTip(
             t("gui_script_path_tooltip", "Path to the update-all.sh script")
         )
-        icon, text = get_fa_icon("folder-open", t("gui_browse", "Browse..."))
-        script_browse = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(script_browse)
-        script_browse.clicked.connect(lambda: self.browse_file(self.script_path))
+        script_browse = create_fa_button(
+            "folder-open",
+            t("gui_browse", "Browse..."),
+            lambda: self.browse_file(self.script_path),
+        )
         script_layout.addWidget(self.script_path)
         script_layout.addWidget(script_browse)
         form.addRow(t("gui_script_path", "Script Path:"), script_layout)
@@ -825,39 +1033,11 @@ class ConfigDialog(QDialog):
             t("gui_cleanup_timing", "Cleanup Timing:"), self.cleanup_timing
         )
 
-        # Cleanup Options - Use FACheckBox for consistency
-        try:
-            from ..widgets import FACheckBox
-        except ImportError:
-            try:
-                from gui.widgets import FACheckBox
-            except ImportError:
-                FACheckBox = (
-                    QCheckBox  # Fallback to QCheckBox if FACheckBox not available
-                )
-
-        self.cleanup_orphans = FACheckBox(
-            t("gui_cleanup_orphans", "Remove Orphan Packages")
-        )
-        self.cleanup_orphans.setToolTip(
-            t(
-                "gui_cleanup_orphans_tooltip",
-                "Remove packages that are no longer needed",
-            )
-        )
-        cleanup_form.addRow("", self.cleanup_orphans)
-
-        self.cleanup_cache = FACheckBox(t("gui_cleanup_cache", "Clean Package Cache"))
-        self.cleanup_cache.setToolTip(
-            t("gui_cleanup_cache_tooltip", "Clean package manager cache")
-        )
-        cleanup_form.addRow("", self.cleanup_cache)
-
-        self.cleanup_temp = FACheckBox(t("gui_cleanup_temp", "Remove Temporary Files"))
-        self.cleanup_temp.setToolTip(
-            t("gui_cleanup_temp_tooltip", "Remove temporary files from /tmp")
-        )
-        cleanup_form.addRow("", self.cleanup_temp)
+        for attr, key, default, tooltip_key, tooltip_default in _CLEANUP_CHECKS:
+            checkbox = FACheckBox(t(key, default))
+            checkbox.setToolTip(t(tooltip_key, tooltip_default))
+            setattr(self, attr, checkbox)
+            cleanup_form.addRow("", checkbox)
 
         # Icon Cache Update
         self.icon_cache_update = QComboBox()
@@ -893,59 +1073,17 @@ class ConfigDialog(QDialog):
         widget = QWidget()
         layout = QVBoxLayout()
 
-        import platform
-        import subprocess
-
         # Tool Information
         tool_group = QGroupBox(t("gui_info_tool", "Tool Information"))
         tool_layout = QVBoxLayout()
 
         # Read script version from VERSION file (root), fallback to update-all.sh
-        import re
-
-        root_dir = Path(self.script_dir).parent
-        version_file = root_dir / "VERSION"
-        local_version = "unknown"
-        if version_file.exists():
-            try:
-                with open(version_file, "r", encoding="utf-8") as f:
-                    version = f.read().strip()
-                    # Validate version format (should be like "1.0.15")
-                    if re.match(r"^\d+\.\d+\.\d+$", version):
-                        local_version = version
-            except Exception as e:
-                self.logger.debug(f"Failed to read version from VERSION file: {e}")
-
-        # Fallback: Read from update-all.sh
-        if local_version == "unknown":
-            script_path = Path(self.script_dir) / "update-all.sh"
-            if script_path.exists():
-                try:
-                    with open(script_path, "r", encoding="utf-8") as f:
-                        for line in f:
-                            if "readonly SCRIPT_VERSION=" in line:
-                                match = re.search(r'["\']([0-9.]+)["\']', line)
-                                if match:
-                                    local_version = match.group(1)
-                                    break
-                except (OSError, IOError) as e:
-                    self.logger.debug(
-                        f"Failed to read script version from update-all.sh: {e}"
-                    )
-                except (ValueError, IndexError) as e:
-                    self.logger.debug(f"Failed to parse script version: {e}")
-                except Exception as e:
-                    self.logger.warning(f"Unexpected error reading script version: {e}")
+        local_version = self.get_local_version()
 
         # Get GitHub version
         github_version = "checking..."
         try:
-            from ..utils.version_checker import VersionChecker
-            github_repo = self.config.get(
-                "GITHUB_REPO", "benjarogit/sc-cachyos-multi-updater"
-            )
-            checker = VersionChecker(str(self.script_dir), github_repo)
-            latest, error = checker.check_latest_version()
+            latest, error = self.get_latest_version()
             if latest and not error:
                 github_version = latest
             elif error:
@@ -973,9 +1111,7 @@ class ConfigDialog(QDialog):
         except Exception as e:
             self.logger.warning(f"Unexpected error comparing versions: {e}")
 
-        tool_info = QTextEdit()
-        tool_info.setReadOnly(True)
-        tool_info.setMaximumHeight(150)
+        tool_info = self._create_info_panel(max_height=150)
         tool_info_text = f"""{t("gui_info_tool_name", "Tool Name")}: CachyOS Multi-Updater
 {t("gui_info_version_local", "Local Version")}: {local_version}
 {t("gui_info_version_github", "GitHub Version")}: {github_version}{version_status}
@@ -993,8 +1129,7 @@ class ConfigDialog(QDialog):
         system_group = QGroupBox(t("gui_info_system", "System Information"))
         system_layout = QVBoxLayout()
 
-        system_info = QTextEdit()
-        system_info.setReadOnly(True)
+        system_info = self._create_info_panel()
         system_info.setFont(QFont("Monospace", 9))
 
         # Get system info
@@ -1118,8 +1253,8 @@ class ConfigDialog(QDialog):
         try:
             with open("/proc/uptime", "r") as f:
                 uptime_seconds = float(f.read().split()[0])
-                hours = int(uptime_seconds // 3600)
-                minutes = int((uptime_seconds % 3600) // 60)
+                hours, remainder = divmod(int(uptime_seconds), 3600)
+                minutes = remainder // 60
                 system_info_text += (
                     f"{t('gui_info_uptime', 'Uptime')}: {hours}h {minutes}m\n"
                 )
@@ -1138,17 +1273,12 @@ class ConfigDialog(QDialog):
         gaming_group = QGroupBox(t("gui_info_gaming", "Gaming Software"))
         gaming_layout = QVBoxLayout()
 
-        gaming_info = QTextEdit()
-        gaming_info.setReadOnly(True)
-        gaming_info.setMaximumHeight(100)
+        gaming_info = self._create_info_panel(max_height=100)
         gaming_info_text = ""
 
         # Check for Wine
         try:
-            result = subprocess.run(
-                ["which", "wine"], capture_output=True, text=True, timeout=1
-            )
-            if result.returncode == 0:
+            if shutil.which("wine"):
                 wine_version = subprocess.run(
                     ["wine", "--version"], capture_output=True, text=True, timeout=1
                 )
@@ -1186,10 +1316,7 @@ class ConfigDialog(QDialog):
 
         # Check for Steam
         try:
-            result = subprocess.run(
-                ["which", "steam"], capture_output=True, text=True, timeout=1
-            )
-            if result.returncode == 0:
+            if shutil.which("steam"):
                 gaming_info_text += "Steam: Installed\n"
             else:
                 gaming_info_text += "Steam: Not installed\n"
@@ -1205,9 +1332,7 @@ class ConfigDialog(QDialog):
         stats_group = QGroupBox(t("gui_info_statistics", "Update Statistics"))
         stats_layout = QVBoxLayout()
 
-        stats_info = QTextEdit()
-        stats_info.setReadOnly(True)
-        stats_info.setMaximumHeight(150)
+        stats_info = self._create_info_panel(max_height=150)
         stats_info_text = ""
 
         # Load statistics from JSON file
@@ -1220,8 +1345,6 @@ class ConfigDialog(QDialog):
 
         try:
             if stats_file.exists():
-                import json
-
                 with open(stats_file, "r", encoding="utf-8") as f:
                     stats_data = json.load(f)
 
@@ -1238,23 +1361,19 @@ class ConfigDialog(QDialog):
                     success_rate = (successful * 100) // total_updates
 
                 # Format average duration
-                avg_minutes = avg_duration // 60
-                avg_seconds = avg_duration % 60
+                avg_minutes, avg_seconds = divmod(avg_duration, 60)
 
                 # Format last update date
                 last_update_formatted = "Never"
                 if last_update:
                     try:
-                        from datetime import datetime
-
                         dt = datetime.fromisoformat(last_update.replace("Z", "+00:00"))
                         last_update_formatted = dt.strftime("%d.%m.%Y %H:%M")
                     except Exception:
                         last_update_formatted = last_update
 
                 # Format last duration
-                last_minutes = last_duration // 60
-                last_seconds = last_duration % 60
+                last_minutes, last_seconds = divmod(last_duration, 60)
 
                 stats_info_text = f"{t('gui_stats_total_updates', 'Total Updates')}: {total_updates}\n"
                 stats_info_text += (
@@ -1287,6 +1406,21 @@ class ConfigDialog(QDialog):
         widget.setLayout(layout)
         return widget
 
+    def _create_info_panel(self, max_height: int = 0) -> QPlainTextEdit:
+        """Create a read-only plain text panel for the info tab
+
+        QPlainTextEdit uses a line-based layout without rich-text parsing,
+        which is all these static panels need.
+        """
+        panel = QPlainTextEdit()
+        panel.setReadOnly(True)
+        panel.setUndoRedoEnabled(False)
+        panel.setMaximumBlockCount(200)
+        panel.document().setDocumentMargin(2)
+        if max_height:
+            panel.setMaximumHeight(max_height)
+        return panel
+
     def browse_directory(self, line_edit: QLineEdit):
         """Browse for directory"""
         directory = QFileDialog.getExistingDirectory(
@@ -1324,58 +1458,38 @@ class ConfigDialog(QDialog):
 
     def load_config(self):
         """Load config into UI"""
-        # Components
-        self.enable_system.setChecked(
-            self.config.get("ENABLE_SYSTEM_UPDATE", "true") == "true"
-        )
-        self.enable_aur.setChecked(
-            self.config.get("ENABLE_AUR_UPDATE", "true") == "true"
-        )
-        self.enable_cursor.setChecked(
-            self.config.get("ENABLE_CURSOR_UPDATE", "true") == "true"
-        )
-        self.enable_adguard.setChecked(
-            self.config.get("ENABLE_ADGUARD_UPDATE", "true") == "true"
-        )
-        self.enable_flatpak.setChecked(
-            self.config.get("ENABLE_FLATPAK_UPDATE", "true") == "true"
-        )
+        # Checkboxes (components, general options, pacman, cleanup)
+        # Block the pacman toggled signals so the preview is rebuilt once at
+        # the end instead of once per checkbox
+        pacman_checkboxes = (
+            self.pacman_sync,
+            self.pacman_refresh,
+            self.pacman_upgrade,
+            self.pacman_noconfirm,
+        )
+        for checkbox in pacman_checkboxes:
+            checkbox.blockSignals(True)
+        try:
+            for attr, key, default in self._CHECKBOX_KEYS:
+                checkbox = getattr(self, attr, None)
+                if checkbox is not None:
+                    checkbox.setChecked(self.config.get(key, default) == "true")
+        finally:
+            for checkbox in pacman_checkboxes:
+                checkbox.blockSignals(False)
 
         # General
         self.max_log_files.setValue(int(self.config.get("MAX_LOG_FILES", "3")))
         self.download_retries.setValue(int(self.config.get("DOWNLOAD_RETRIES", "3")))
         self.cache_max_age.setValue(int(self.config.get("CACHE_MAX_AGE", "3600")))
-        self.enable_notifications.setChecked(
-            self.config.get("ENABLE_NOTIFICATIONS", "true") == "true"
-        )
-        self.enable_colors.setChecked(
-            self.config.get("ENABLE_COLORS", "true") == "true"
-        )
-        self.dry_run.setChecked(self.config.get("DRY_RUN", "false") == "true")
-        self.enable_auto_update.setChecked(
-            self.config.get("ENABLE_AUTO_UPDATE", "false") == "true"
-        )
 
         # Sudo password (don't show actual password, just indicate if stored)
         # Check if password is stored securely
-        try:
-            from .password_manager import PasswordManager
-        except ImportError:
-            try:
-                from password_manager import PasswordManager
-            except ImportError:
-                PasswordManager = None
-
-        has_stored_password = False
-        if PasswordManager:
-            password_manager = PasswordManager(str(self.script_dir))
-            stored_password = password_manager.get_password()
-            has_stored_password = bool(stored_password)
-            # Also check config marker for backward compatibility
-            if not has_stored_password:
-                has_stored_password = bool(
-                    self.config.get("SUDO_PASSWORD_STORED") == "true"
-                )
+        password_manager = PasswordManager(str(self.script_dir))
+        has_stored_password = bool(password_manager.get_password())
+        # Also check config marker for backward compatibility
+        if not has_stored_password:
+            has_stored_password = self.config.get("SUDO_PASSWORD_STORED") == "true"
 
         self.save_sudo_password.setChecked(has_stored_password)
         if has_stored_password:
@@ -1387,18 +1501,6 @@ class ConfigDialog(QDialog):
                 )
             )
 
-        # System - Pacman (set defaults if not in config)
-        self.pacman_sync.setChecked(self.config.get("PACMAN_SYNC", "true") == "true")
-        self.pacman_refresh.setChecked(
-            self.config.get("PACMAN_REFRESH", "true") == "true"
-        )
-        self.pacman_upgrade.setChecked(
-            self.config.get("PACMAN_UPGRADE", "true") == "true"
-        )
-        self.pacman_noconfirm.setChecked(
-            self.config.get("PACMAN_NOCONFIRM", "true") == "true"
-        )
-
         # Desktop shortcut name/comment
         if hasattr(self, "shortcut_name"):
             self.shortcut_name.setText(self.config.get("SHORTCUT_NAME", "Update All"))
@@ -1424,90 +1526,74 @@ class ConfigDialog(QDialog):
             self.config.get("SCRIPT_PATH", str(Path(self.script_dir) / "update-all.sh"))
         )
 
-        # Cleanup Settings
-        if hasattr(self, "cleanup_aggressiveness"):
-            aggressiveness = self.config.get("CLEANUP_AGGRESSIVENESS", "moderate")
-            index_map = {"safe": 0, "moderate": 1, "aggressive": 2}
-            self.cleanup_aggressiveness.setCurrentIndex(
-                index_map.get(aggressiveness, 1)
-            )
-
-        if hasattr(self, "cleanup_timing"):
-            timing = self.config.get("CLEANUP_TIMING", "after_updates")
-            index_map = {"after_updates": 0, "manual": 1, "never": 2}
-            self.cleanup_timing.setCurrentIndex(index_map.get(timing, 0))
-
-        if hasattr(self, "cleanup_orphans"):
-            self.cleanup_orphans.setChecked(
-                self.config.get("CLEANUP_ORPHANS", "true") == "true"
-            )
-
-        if hasattr(self, "cleanup_cache"):
-            self.cleanup_cache.setChecked(
-                self.config.get("CLEANUP_CACHE", "true") == "true"
-            )
-
-        if hasattr(self, "cleanup_temp"):
-            self.cleanup_temp.setChecked(
-                self.config.get("CLEANUP_TEMP_FILES", "true") == "true"
-            )
-
-        if hasattr(self, "icon_cache_update"):
-            icon_cache = self.config.get("ICON_CACHE_UPDATE", "both")
-            index_map = {
-                "both": 0,
-                "after_shortcut": 1,
-                "after_updates": 2,
-                "manual": 3,
-            }
-            self.icon_cache_update.setCurrentIndex(index_map.get(icon_cache, 0))
+        # Cleanup Settings (combo boxes)
+        for attr, key, values, default in self._COMBO_KEYS:
+            combo = getattr(self, attr, None)
+            if combo is not None:
+                value = self.config.get(key, default)
+                combo.setCurrentIndex(
+                    values.index(value if value in values else default)
+                )
 
         self.update_command_preview()
 
     def save_config(self):
-        """Save config from UI"""
-        # Components
-        self.config["ENABLE_SYSTEM_UPDATE"] = str(
-            self.enable_system.isChecked()
-        ).lower()
-        self.config["ENABLE_AUR_UPDATE"] = str(self.enable_aur.isChecked()).lower()
-        self.config["ENABLE_CURSOR_UPDATE"] = str(
-            self.enable_cursor.isChecked()
-        ).lower()
-        self.config["ENABLE_ADGUARD_UPDATE"] = str(
-            self.enable_adguard.isChecked()
-        ).lower()
-        self.config["ENABLE_FLATPAK_UPDATE"] = str(
-            self.enable_flatpak.isChecked()
-        ).lower()
+        """Save config from UI
+
+        Changes are collected into a copy of the loaded config; the file is
+        only rewritten when something actually changed (or does not exist yet).
+        """
+        new_config = self._collect_config()
+        if not self._config_needs_write(new_config):
+            return True
+
+        if not self.config_manager.save_config(new_config):
+            return False
+        self.config = new_config
+        return True
+
+    def _config_needs_write(self, new_config: dict) -> bool:
+        """Check whether new_config differs from what is on disk"""
+        return (
+            new_config != self.config or not self.config_manager.config_file.exists()
+        )
+
+    def _collect_config(self) -> dict:
+        """Build the new config dict from the UI
+
+        Also stores or deletes the sudo password via PasswordManager.
+        """
+        new_config = dict(self.config)
+
+        # Checkboxes (components, general options, pacman, cleanup)
+        checkboxes = (
+            (key, getattr(self, attr, None)) for attr, key, _ in self._CHECKBOX_KEYS
+        )
+        new_config.update(
+            {
+                key: _BOOL_STR[checkbox.isChecked()]
+                for key, checkbox in checkboxes
+                if checkbox is not None
+            }
+        )
+
+        # Combo boxes (cleanup settings)
+        for attr, key, values, default in self._COMBO_KEYS:
+            combo = getattr(self, attr, None)
+            if combo is not None:
+                index = combo.currentIndex()
+                new_config[key] = values[index] if 0 <= index < len(values) else default
 
         # General
-        self.config["MAX_LOG_FILES"] = str(self.max_log_files.value())
-        self.config["DOWNLOAD_RETRIES"] = str(self.download_retries.value())
-        self.config["CACHE_MAX_AGE"] = str(self.cache_max_age.value())
-        self.config["ENABLE_NOTIFICATIONS"] = str(
-            self.enable_notifications.isChecked()
-        ).lower()
-        self.config["ENABLE_COLORS"] = str(self.enable_colors.isChecked()).lower()
-        self.config["DRY_RUN"] = str(self.dry_run.isChecked()).lower()
-        self.config["ENABLE_AUTO_UPDATE"] = str(
-            self.enable_auto_update.isChecked()
-        ).lower()
+        new_config["MAX_LOG_FILES"] = str(self.max_log_files.value())
+        new_config["DOWNLOAD_RETRIES"] = str(self.download_retries.value())
+        new_config["CACHE_MAX_AGE"] = str(self.cache_max_age.value())
 
         # Sudo password (save securely using PasswordManager)
-        try:
-            from .password_manager import PasswordManager
-        except ImportError:
-            try:
-                from password_manager import PasswordManager
-            except ImportError:
-                PasswordManager = None
-
-        # Handle sudo password saving
-        if PasswordManager and hasattr(self, "sudo_password"):
+        if hasattr(self, "sudo_password"):
             password_text = self.sudo_password.text()
             password_manager = PasswordManager(str(self.script_dir))
-            had_stored_password = self.config.get("SUDO_PASSWORD_STORED") == "true"
+            had_stored_password = new_config.get("SUDO_PASSWORD_STORED") == "true"
 
             if (
                 hasattr(self, "save_sudo_password")
@@ -1519,17 +1605,15 @@ class ConfigDialog(QDialog):
                     if password_manager.is_available():
                         if password_manager.save_password(password_text):
                             # Store marker in config (not the password itself)
-                            self.config["SUDO_PASSWORD_STORED"] = "true"
-                            self.config["SUDO_PASSWORD_METHOD"] = (
+                            new_config["SUDO_PASSWORD_STORED"] = "true"
+                            new_config["SUDO_PASSWORD_METHOD"] = (
                                 password_manager.get_storage_method()
                             )
                         else:
                             # Fallback: warn user
-                            from PyQt6.QtWidgets import QMessageBox
-
                             QMessageBox.warning(
                                 self,
-                                t("gui_error", "Error"),
+                                self._strings()["error"],
                                 t(
                                     "gui_password_save_failed",
                                     "Failed to save password securely. Please install python-keyring or cryptography.",
@@ -1537,11 +1621,9 @@ class ConfigDialog(QDialog):
                             )
                     else:
                         # No secure storage available
-                        from PyQt6.QtWidgets import QMessageBox
-
                         QMessageBox.warning(
                             self,
-                            t("gui_error", "Error"),
+                            self._strings()["error"],
                             t(
                                 "gui_password_storage_unavailable",
                                 "Secure password storage not available. Please install python-keyring or cryptography.",
@@ -1563,84 +1645,57 @@ class ConfigDialog(QDialog):
                     # User had stored password, checkbox is unchecked, and field is empty
                     # This indicates explicit intent to remove stored password
                     password_manager.delete_password()
-                    self.config.pop("SUDO_PASSWORD_STORED", None)
-                    self.config.pop("SUDO_PASSWORD_METHOD", None)
+                    # save_config() keeps lines for keys missing from the dict,
+                    # so the markers have to be removed from the file directly
+                    self.config_manager.update(
+                        {"SUDO_PASSWORD_STORED": None, "SUDO_PASSWORD_METHOD": None}
+                    )
+                    new_config.pop("SUDO_PASSWORD_STORED", None)
+                    new_config.pop("SUDO_PASSWORD_METHOD", None)
                 # Otherwise: checkbox unchecked but password field has text -> don't save new, but keep old
                 # Or: checkbox unchecked, no stored password -> nothing to do
 
-        # Advanced
-        if self.github_repo.text():
-            self.config["GITHUB_REPO"] = self.github_repo.text()
-        if self.log_dir.text():
-            self.config["LOG_DIR"] = self.log_dir.text()
-        if self.stats_dir.text():
-            self.config["STATS_DIR"] = self.stats_dir.text()
-        if self.script_path.text():
-            self.config["SCRIPT_PATH"] = self.script_path.text()
+        # Advanced (empty fields keep the current value)
+        path_updates = {
+            "GITHUB_REPO": self.github_repo.text(),
+            "LOG_DIR": self.log_dir.text(),
+            "STATS_DIR": self.stats_dir.text(),
+            "SCRIPT_PATH": self.script_path.text(),
+        }
+        new_config.update({key: value for key, value in path_updates.items() if value})
 
         # Desktop shortcut name/comment
         if hasattr(self, "shortcut_name"):
-            self.config["SHORTCUT_NAME"] = self.shortcut_name.text() or "Update All"
+            new_config["SHORTCUT_NAME"] = self.shortcut_name.text() or "Update All"
         if hasattr(self, "shortcut_comment"):
-            self.config["SHORTCUT_COMMENT"] = (
+            new_config["SHORTCUT_COMMENT"] = (
                 self.shortcut_comment.text()
                 or "Ein-Klick-Update für CachyOS + AUR + Cursor + AdGuard + Flatpak"
             )
 
         # GUI Language
-        self.config["GUI_LANGUAGE"] = self.gui_language.itemData(
+        new_config["GUI_LANGUAGE"] = self.gui_language.itemData(
             self.gui_language.currentIndex()
         )
 
         # GUI Theme
-        self.config["GUI_THEME"] = self.gui_theme.itemData(
+        new_config["GUI_THEME"] = self.gui_theme.itemData(
             self.gui_theme.currentIndex()
         )
 
-        # Pacman
-        self.config["PACMAN_SYNC"] = str(self.pacman_sync.isChecked()).lower()
-        self.config["PACMAN_REFRESH"] = str(self.pacman_refresh.isChecked()).lower()
-        self.config["PACMAN_UPGRADE"] = str(self.pacman_upgrade.isChecked()).lower()
-        self.config["PACMAN_NOCONFIRM"] = str(self.pacman_noconfirm.isChecked()).lower()
+        return new_config
 
-        # Cleanup Settings
-        if hasattr(self, "cleanup_aggressiveness"):
-            aggressiveness_map = {0: "safe", 1: "moderate", 2: "aggressive"}
-            self.config["CLEANUP_AGGRESSIVENESS"] = aggressiveness_map.get(
-                self.cleanup_aggressiveness.currentIndex(), "moderate"
-            )
+    def _read_config(self) -> dict:
+        """Load config.conf without the encrypted sudo password
 
-        if hasattr(self, "cleanup_timing"):
-            timing_map = {0: "after_updates", 1: "manual", 2: "never"}
-            self.config["CLEANUP_TIMING"] = timing_map.get(
-                self.cleanup_timing.currentIndex(), "after_updates"
-            )
-
-        if hasattr(self, "cleanup_orphans"):
-            self.config["CLEANUP_ORPHANS"] = str(
-                self.cleanup_orphans.isChecked()
-            ).lower()
-
-        if hasattr(self, "cleanup_cache"):
-            self.config["CLEANUP_CACHE"] = str(self.cleanup_cache.isChecked()).lower()
-
-        if hasattr(self, "cleanup_temp"):
-            self.config["CLEANUP_TEMP_FILES"] = str(
-                self.cleanup_temp.isChecked()
-            ).lower()
-
-        if hasattr(self, "icon_cache_update"):
-            icon_cache_map = {
-                0: "both",
-                1: "after_shortcut",
-                2: "after_updates",
-                3: "manual",
-            }
-            self.config["ICON_CACHE_UPDATE"] = icon_cache_map.get(
-                self.icon_cache_update.currentIndex(), "both"
-            )
-
-        return self.config_manager.save_config(self.config)
+        PasswordManager stores SUDO_PASSWORD_ENCRYPTED in config.conf itself.
+        Leaving it out of the dialog's copy means saving keeps that line as it
+        is on disk, instead of writing back the token from when the dialog
+        was opened.
+        """
+        config = self.config_manager.load_config()
+        config.pop("SUDO_PASSWORD_ENCRYPTED", None)
+        return config
 
     def reset_to_defaults(self):
         """Reset to default values"""
@@ -1652,7 +1707,7 @@ class ConfigDialog(QDialog):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.config = self.config_manager.load_config()
+            self.config = self._read_config()
             self.load_config()
 
     def on_icon_selection_changed(self, index):
@@ -1686,22 +1741,17 @@ class ConfigDialog(QDialog):
     def update_icon_preview(self):
         """Update icon preview"""
         # Update preview border color based on theme
-        try:
-            from ..ui.theme_manager import ThemeManager
-        except ImportError:
-            from gui.ui.theme_manager import ThemeManager
-
         theme_mode = self.config_manager.get("GUI_THEME", "auto")
         if theme_mode == "auto":
             actual_theme = ThemeManager.detect_system_theme()
         else:
             actual_theme = theme_mode
 
-        border_color = "#555555" if actual_theme == "dark" else "#cccccc"
-        bg_color = "#2b2b2b" if actual_theme == "dark" else "#f0f0f0"
-        self.icon_preview.setStyleSheet(
-            f"border: 1px solid {border_color}; border-radius: 4px; background-color: {bg_color};"
-        )
+        if actual_theme != self._preview_style_theme:
+            self.icon_preview.setStyleSheet(
+                self._PREVIEW_STYLES[actual_theme == "dark"]
+            )
+            self._preview_style_theme = actual_theme
 
         icon_data = self.desktop_icon.itemData(self.desktop_icon.currentIndex())
 
@@ -1722,71 +1772,75 @@ class ConfigDialog(QDialog):
         else:
             # Try to load system icon
             icon_name = icon_data if icon_data else "system-software-update"
-
-            # Try multiple methods to load the icon
-            icon = QIcon.fromTheme(icon_name)
-            if icon.isNull():
-                # Try with different icon name variations
-                icon_variations = [
-                    icon_name,
-                    icon_name.replace("-", "_"),
-                    icon_name.replace("_", "-"),
-                    f"applications-{icon_name}",
-                    f"system-{icon_name}",
-                ]
-                for var_name in icon_variations:
-                    icon = QIcon.fromTheme(var_name)
-                    if not icon.isNull():
-                        break
-
-            if not icon.isNull():
-                pixmap = icon.pixmap(96, 96)
-                if not pixmap.isNull():
-                    self.icon_preview.clear()  # Clear any text first
-                    self.icon_preview.setPixmap(pixmap)
-                    return
-
-            # Try to find icon in standard paths
-            from PyQt6.QtCore import QStandardPaths
-
-            icon_paths = QStandardPaths.standardLocations(
-                QStandardPaths.StandardLocation.IconThemePath
-            )
-            for icon_path in icon_paths:
-                # Try different sizes and formats
-                for size in ["64x64", "48x48", "32x32", "scalable"]:
-                    for ext in ["png", "svg", "xpm"]:
-                        test_path = f"{icon_path}/{icon_name}/{size}/icon.{ext}"
-                        if os.path.exists(test_path):
-                            pixmap = QPixmap(test_path)
-                            if not pixmap.isNull():
-                                pixmap = pixmap.scaled(
-                                    96,
-                                    96,
-                                    Qt.AspectRatioMode.KeepAspectRatio,
-                                    Qt.TransformationMode.SmoothTransformation,
-                                )
-                                self.icon_preview.clear()
-                                self.icon_preview.setPixmap(pixmap)
-                                return
+            if actual_theme != self._icon_cache_theme:
+                self._icon_pixmap_cache.clear()
+                self._icon_cache_theme = actual_theme
+            if icon_name not in self._icon_pixmap_cache:
+                self._icon_pixmap_cache[icon_name] = self._resolve_system_icon(
+                    icon_name
+                )
+            pixmap = self._icon_pixmap_cache[icon_name]
+            if pixmap is not None:
+                self.icon_preview.clear()  # Clear any text first
+                self.icon_preview.setPixmap(pixmap)
+                return
 
         # Fallback: show text (only if no icon could be loaded)
         self.icon_preview.clear()  # Clear pixmap first
         self.icon_preview.setText(t("gui_icon_preview", "Preview"))
 
+    def _resolve_system_icon(self, icon_name: str) -> Optional[QPixmap]:
+        """Resolve a system icon name to a 96x96 preview pixmap
+
+        Returns:
+            QPixmap or None if the icon could not be found
+        """
+        # Try the theme with the name and its common variations
+        for var_name in _icon_variations(icon_name):
+            icon = QIcon.fromTheme(var_name)
+            if not icon.isNull():
+                break
+
+        if not icon.isNull():
+            pixmap = icon.pixmap(96, 96)
+            if not pixmap.isNull():
+                return pixmap
+
+        # Try to find icon in icon theme search paths (different sizes and formats)
+        # (one directory listing per level instead of probing every combination)
+        for icon_path in self._icon_search_paths:
+            base = os.path.join(icon_path, icon_name)
+            size_dirs = _list_dir_names(base)
+            for size in _ICON_PREVIEW_SIZES:
+                if size not in size_dirs:
+                    continue
+                size_dir = os.path.join(base, size)
+                files = _list_dir_names(size_dir)
+                for file_name in _ICON_PREVIEW_FILES:
+                    if file_name not in files:
+                        continue
+                    pixmap = QPixmap(os.path.join(size_dir, file_name))
+                    if not pixmap.isNull():
+                        return pixmap.scaled(
+                            96,
+                            96,
+                            Qt.AspectRatioMode.KeepAspectRatio,
+                            Qt.TransformationMode.SmoothTransformation,
+                        )
+        return None
+
     def create_desktop_shortcut(self):
         """Create desktop shortcut"""
         self.logger.info("create_desktop_shortcut() called")
         try:
-            script_dir = Path(self.script_dir)
-            script_path = script_dir / "update-all.sh"
+            script_path = self._script_abs
             self.logger.debug(f"Script path: {script_path}")
 
             if not script_path.exists():
                 self.logger.error(f"Script not found: {script_path}")
                 QMessageBox.critical(
                     self,
-                    t("gui_error", "Error"),
+                    self._strings()["error"],
                     t("gui_script_not_found", "update-all.sh not found!"),
                 )
                 return
@@ -1809,7 +1863,7 @@ class ConfigDialog(QDialog):
                     self.logger.error(f"Custom icon file not found: {icon_value}")
                     QMessageBox.warning(
                         self,
-                        t("gui_error", "Error"),
+                        self._strings()["error"],
                         t("gui_icon_not_found", "Please select a valid icon file!"),
                     )
                     return
@@ -1817,44 +1871,18 @@ class ConfigDialog(QDialog):
                 icon_value = icon_data if icon_data else "system-software-update"
                 self.logger.debug(f"Using system icon: {icon_value}")
 
-            # Determine target directories
+            # Determine target directories (desktop directory detected in __init__)
             app_dir = Path.home() / ".local" / "share" / "applications"
-            desktop_dir = None
-
-            # Try to find desktop directory
-            desktop_paths = [
-                Path.home() / "Desktop",
-                Path.home() / "Schreibtisch",
-                Path.home() / "desktop",
-            ]
-            for path in desktop_paths:
-                if path.exists() and path.is_dir():
-                    desktop_dir = path
-                    break
+            desktop_dir = self._desktop_dir
 
             # Create directories if needed
             if self.shortcut_app_menu.isChecked():
                 app_dir.mkdir(parents=True, exist_ok=True)
 
-            # Create desktop entry content
-            script_abs_path = script_path.absolute()
-
             # Helper function to escape desktop entry values
             def escape_desktop_entry_value(value: str) -> str:
                 """Escape value for desktop entry file according to Desktop Entry Specification"""
-                if not value:
-                    return ""
-                # Escape according to Desktop Entry Specification
-                # Order matters: backslash must be escaped first!
-                return (
-                    value.replace("\\", "\\\\")  # Backslash first!
-                    .replace("\n", "\\n")
-                    .replace("\r", "\\r")
-                    .replace("=", "\\=")
-                    .replace("[", "\\[")
-                    .replace("]", "\\]")
-                    .replace(";", "\\;")
-                )
+                return value.translate(_DESKTOP_ENTRY_ESCAPES) if value else ""
 
             # Determine which version to use (Console or GUI)
             # Always use GUI version (console/gui selection removed)
@@ -1862,15 +1890,14 @@ class ConfigDialog(QDialog):
 
             if use_gui:
                 # GUI version
-                gui_script = script_dir / "gui" / "main.py"
-                if gui_script.exists():
+                if self._gui_script_exists:
                     # Use shlex.quote() for shell injection protection
-                    exec_cmd = f"python3 {shlex.quote(str(gui_script.absolute()))}"
+                    exec_cmd = f"python3 {shlex.quote(str(self._gui_script_abs))}"
                     terminal = "false"
                 else:
                     QMessageBox.warning(
                         self,
-                        t("gui_error", "Error"),
+                        self._strings()["error"],
                         t(
                             "gui_gui_not_found",
                             "GUI script not found! Using console version instead.",
@@ -1880,14 +1907,14 @@ class ConfigDialog(QDialog):
 
             if not use_gui:
                 # Console version
-                wrapper_script = script_dir / "run-update.sh"
+                wrapper_script = self._script_abs.parent / "run-update.sh"
                 if wrapper_script.exists():
                     # Use shlex.quote() for shell injection protection
                     exec_cmd = f"konsole --hold -e {shlex.quote(str(wrapper_script.absolute()))}"
                 else:
                     # Use shlex.quote() for shell injection protection
                     exec_cmd = (
-                        f"konsole --hold -e bash {shlex.quote(str(script_abs_path))}"
+                        f"konsole --hold -e bash {shlex.quote(str(self._script_abs))}"
                     )
                 terminal = "true"
 
@@ -1911,16 +1938,23 @@ Categories=System;
 """
 
             # Create desktop files based on selected locations
-            locations = []
-
+            targets = []
             # Application Menu (always create if checked)
             if self.shortcut_app_menu.isChecked():
-                app_desktop_file = app_dir / "update-all.desktop"
-                with open(app_desktop_file, "w", encoding="utf-8") as f:
-                    f.write(desktop_entry)
-                os.chmod(app_desktop_file, 0o755)
-                locations.append(str(app_desktop_file))
-                # Update desktop database to refresh application menu
+                targets.append(app_dir / "update-all.desktop")
+            # Desktop (create if checked)
+            if self.shortcut_desktop.isChecked() and desktop_dir:
+                targets.append(desktop_dir / "update-all.desktop")
+
+            # Same content for every location - encode once
+            payload = desktop_entry.encode("utf-8")
+            for target in targets:
+                target.write_bytes(payload)
+                target.chmod(EXECUTABLE_PERMISSIONS)
+            locations = [str(target) for target in targets]
+
+            # Update desktop database once to refresh application menu
+            if self.shortcut_app_menu.isChecked():
                 try:
                     subprocess.run(
                         ["update-desktop-database", str(app_dir)],
@@ -1931,14 +1965,6 @@ Categories=System;
                 except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
                     pass  # Non-critical - menu will refresh on next login
 
-            # Desktop (create if checked)
-            if self.shortcut_desktop.isChecked() and desktop_dir:
-                desktop_file_copy = desktop_dir / "update-all.desktop"
-                with open(desktop_file_copy, "w", encoding="utf-8") as f:
-                    f.write(desktop_entry)
-                os.chmod(desktop_file_copy, 0o755)
-                locations.append(str(desktop_file_copy))
-
             if locations:
                 QMessageBox.information(
                     self,
@@ -1959,7 +1985,7 @@ Categories=System;
         except Exception as e:
             QMessageBox.critical(
                 self,
-                t("gui_error", "Error"),
+                self._strings()["error"],
                 t("gui_shortcut_failed", "Failed to create desktop shortcut:")
                 + f"\n{str(e)}",
             )
@@ -2038,40 +2064,28 @@ Categories=System;
 
         # Get last 3 versions from git tags
         try:
-            import subprocess
-
-            result = subprocess.run(
-                ["git", "tag", "-l", "v*"],
-                capture_output=True,
-                text=True,
-                timeout=2,
-                cwd=str(Path(self.script_dir).parent),
-            )
-            if result.returncode == 0:
-                tags = sorted(
-                    result.stdout.strip().split("\n"),
-                    key=lambda x: [int(i) for i in x.replace("v", "").split(".")],
-                )[-3:]
-                for tag in tags:
-                    version = tag.replace("v", "")
-                    self.version_combo.addItem(version)
-        except Exception:
-            pass
+            tags = _list_version_tags(Path(self.script_dir).parent / ".git")
+            for tag in sorted(tags, key=lambda x: tuple(map(int, x[1:].split("."))))[
+                -3:
+            ]:
+                self.version_combo.addItem(tag[1:])
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.debug(f"Failed to read git tags: {e}")
 
         # Set default to one version before current (if we can determine current version)
         try:
             root_dir = Path(self.script_dir).parent
             version_file = root_dir / "VERSION"
             if version_file.exists():
-                with open(version_file, "r", encoding="utf-8") as f:
-                    current_version = f.read().strip()
-                    # Try to calculate previous version
-                    parts = [int(x) for x in current_version.split(".")]
-                    if parts[2] > 0:
-                        parts[2] -= 1
-                        prev_version = ".".join(map(str, parts))
-                        self.version_combo.setCurrentText(prev_version)
-        except Exception:
+                current_version = version_file.read_text(encoding="utf-8").strip()
+                # Try to calculate previous version
+                major, minor, patch = current_version.split(".")
+                patch_num = int(patch)
+                if patch_num > 0:
+                    self.version_combo.setCurrentText(
+                        f"{major}.{minor}.{patch_num - 1}"
+                    )
+        except (OSError, UnicodeDecodeError, ValueError):
             pass
 
         version_input_layout.addWidget(self.version_combo)
@@ -2092,94 +2106,110 @@ Categories=System;
 
         return widget
 
-    def update_version_display(self):
-        """Update version display in update tab"""
-        import re
+    def get_local_version(self) -> str:
+        """Get local version from VERSION file (root), fallback to update-all.sh
 
-        root_dir = Path(self.script_dir).parent
-        version_file = root_dir / "VERSION"
-        local_version = "unknown"
-
-        if version_file.exists():
+        Parsed results are cached per file mtime, so repeated refreshes of
+        the info and update tabs cost one stat() per file.
+        """
+        candidates = (
+            (Path(self.script_dir).parent / "VERSION", _read_version_file),
+            (Path(self.script_dir) / "update-all.sh", _read_script_version),
+        )
+        for path, reader in candidates:
             try:
-                with open(version_file, "r", encoding="utf-8") as f:
-                    version = f.read().strip()
-                    if re.match(r"^\d+\.\d+\.\d+$", version):
-                        local_version = version
-            except Exception:
-                pass
+                version = reader(str(path), os.stat(path).st_mtime_ns)
+            except FileNotFoundError:
+                continue
+            except (OSError, UnicodeDecodeError) as e:
+                self.logger.debug(f"Failed to read version from {path.name}: {e}")
+                continue
+            if version != "unknown":
+                return version
+        return "unknown"
+
+    def _get_checker(self) -> VersionChecker:
+        """Get the dialog's VersionChecker, recreated when GITHUB_REPO changes"""
+        github_repo = self.config.get(
+            "GITHUB_REPO", "benjarogit/sc-cachyos-multi-updater"
+        )
+        checker = self._version_checker
+        if checker is None or checker.github_repo != github_repo:
+            checker = VersionChecker(str(self.script_dir), github_repo)
+            self._version_checker = checker
+        return checker
 
-        # Fallback to update-all.sh
-        if local_version == "unknown":
-            script_path = Path(self.script_dir) / "update-all.sh"
-            if script_path.exists():
-                try:
-                    with open(script_path, "r", encoding="utf-8") as f:
-                        for line in f:
-                            if "readonly SCRIPT_VERSION=" in line:
-                                match = re.search(r'["\']([0-9.]+)["\']', line)
-                                if match:
-                                    local_version = match.group(1)
-                                    break
-                except Exception:
-                    pass
+    def get_latest_version(
+        self, force: bool = False
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Get latest GitHub version, reusing a result younger than the TTL
+
+        Args:
+            force: Bypass the cache (explicit "Check for Updates" click)
 
+        Returns:
+            Tuple of (latest_version, error_message)
+        """
+        github_repo = self.config.get(
+            "GITHUB_REPO", "benjarogit/sc-cachyos-multi-updater"
+        )
+        cache_key = (github_repo, str(self.script_dir))
+        cached = self._version_cache
+        if (
+            not force
+            and cached is not None
+            and cached[0] == cache_key
+            and time.monotonic() - cached[1] < VERSION_CHECK_CACHE_TTL_SECONDS
+        ):
+            return cached[2], cached[3]
+
+        latest, error = self._get_checker().check_latest_version()
+        self._version_cache = (cache_key, time.monotonic(), latest, error)
+        return latest, error
+
+    def update_version_display(self, force: bool = False):
+        """Update version display in update tab
+
+        Args:
+            force: Query GitHub even if a recent result is cached
+        """
+        local_version = self.get_local_version()
         self.update_local_version_label.setText(f"v{local_version}")
 
         # Check GitHub version
-        try:
-            from ..utils.version_checker import VersionChecker
-        except ImportError:
-            VersionChecker = None
+        latest, error = self.get_latest_version(force=force)
 
-        if VersionChecker:
-            github_repo = self.config.get(
-                "GITHUB_REPO", "benjarogit/sc-cachyos-multi-updater"
-            )
-            checker = VersionChecker(str(self.script_dir), github_repo)
-            latest, error = checker.check_latest_version()
-
-            if latest and not error:
-                self.update_github_version_label.setText(f"v{latest}")
-                comparison = checker.compare_versions(local_version, latest)
+        if latest and not error:
+            self.update_github_version_label.setText(f"v{latest}")
+            comparison = self._get_checker().compare_versions(local_version, latest)
 
-                if comparison < 0:
-                    # Update available
-                    self.update_status_label.setText(
-                        t("gui_update_available", "Update available!")
-                    )
-                    self.update_status_label.setStyleSheet(
-                        "color: #dc3545; font-weight: bold;"
-                    )
-                    self.start_update_btn.setEnabled(True)
-                elif comparison == 0:
-                    # Up to date
-                    self.update_status_label.setText(
-                        t("gui_version_up_to_date", "Up to date")
-                    )
-                    self.update_status_label.setStyleSheet("color: #28a745;")
-                    self.start_update_btn.setEnabled(False)
-                else:
-                    # Local is newer
-                    self.update_status_label.setText(
-                        t("gui_version_dev", "Development version (local is newer)")
-                    )
-                    self.update_status_label.setStyleSheet("color: #28a745;")
-                    self.start_update_btn.setEnabled(False)
-            else:
-                self.update_github_version_label.setText(
-                    t("gui_version_check_failed", "Version check failed")
+            if comparison < 0:
+                # Update available
+                self.update_status_label.setText(self._strings()["update_available"])
+                self.update_status_label.setStyleSheet(
+                    "color: #dc3545; font-weight: bold;"
                 )
-                self.update_status_label.setText("")
+                self.start_update_btn.setEnabled(True)
+            elif comparison == 0:
+                # Up to date
+                self.update_status_label.setText(self._strings()["version_up_to_date"])
+                self.update_status_label.setStyleSheet("color: #28a745;")
+                self.start_update_btn.setEnabled(False)
+            else:
+                # Local is newer
+                self.update_status_label.setText(self._strings()["version_dev"])
+                self.update_status_label.setStyleSheet("color: #28a745;")
                 self.start_update_btn.setEnabled(False)
         else:
-            self.update_github_version_label.setText("unavailable")
+            self.update_github_version_label.setText(
+                self._strings()["version_check_failed"]
+            )
             self.update_status_label.setText("")
             self.start_update_btn.setEnabled(False)
 
     def check_tool_version(self):
         """Check for tool version updates"""
-        self.update_version_display()
+        self.update_version_display(force=True)
         QMessageBox.information(
             self,
             t("gui_version_check_complete", "Version Check Complete"),
@@ -2199,7 +2229,7 @@ Categories=System;
             except ImportError:
                 QMessageBox.warning(
                     self,
-                    t("gui_update_failed", "Update Failed"),
+                    self._strings()["update_failed"],
                     t(
                         "gui_update_dialog_not_found",
                         "Update dialog not found. Please update manually.",
@@ -2208,41 +2238,26 @@ Categories=System;
                 return
 
         # Get versions
-        import re
-
-        root_dir = Path(self.script_dir).parent
-        version_file = root_dir / "VERSION"
-        local_version = "unknown"
-
-        if version_file.exists():
-            try:
-                with open(version_file, "r", encoding="utf-8") as f:
-                    version = f.read().strip()
-                    if re.match(r"^\d+\.\d+\.\d+$", version):
-                        local_version = version
-            except Exception:
-                pass
+        local_version = self.get_local_version()
 
-        # Get GitHub version
-        from ..utils.version_checker import VersionChecker
-
-        github_repo = self.config.get(
-            "GITHUB_REPO", "benjarogit/sc-cachyos-multi-updater"
-        )
-        checker = VersionChecker(str(self.script_dir), github_repo)
-        latest, error = checker.check_latest_version()
+        # Get GitHub version (always fresh before updating)
+        latest, error = self.get_latest_version(force=True)
 
         if not latest or error:
             QMessageBox.warning(
                 self,
-                t("gui_update_failed", "Update Failed"),
-                t("gui_version_check_failed", "Version check failed"),
+                self._strings()["update_failed"],
+                self._strings()["version_check_failed"],
             )
             return
 
         # Open update dialog
         dialog = UpdateDialog(
-            str(self.script_dir), local_version, latest, checker, parent=self
+            str(self.script_dir),
+            local_version,
+            latest,
+            self._get_checker(),
+            parent=self,
         )
         if dialog.exec() == QDialog.DialogCode.Accepted:
             # Update was performed, refresh display
@@ -2254,20 +2269,18 @@ Categories=System;
         version_text = self.version_combo.currentText().strip()
 
         if not version_text:
-            QMessageBox.warning(
-                self,
-                t("gui_error", "Error"),
+            self._show_message(
+                QMessageBox.Icon.Warning,
+                self._strings()["error"],
                 t("gui_version_empty", "Version cannot be empty"),
             )
             return
 
         # Validate version format
-        import re
-
-        if not re.match(r"^\d+\.\d+\.\d+$", version_text):
-            QMessageBox.warning(
-                self,
-                t("gui_error", "Error"),
+        if not _VERSION_RE.match(version_text):
+            self._show_message(
+                QMessageBox.Icon.Warning,
+                self._strings()["error"],
                 t(
                     "gui_version_invalid",
                     "Invalid version format. Use format: X.Y.Z (e.g., 1.0.15)",
@@ -2295,11 +2308,10 @@ Categories=System;
         version_file = root_dir / "VERSION"
 
         try:
-            with open(version_file, "w", encoding="utf-8") as f:
-                f.write(version_text)
+            write_file_atomic(version_file, version_text.encode("utf-8"))
 
-            QMessageBox.information(
-                self,
+            self._show_message(
+                QMessageBox.Icon.Information,
                 t("gui_success", "Success"),
                 t("gui_version_set_success", "Version set to {version}").format(
                     version=version_text
@@ -2310,22 +2322,59 @@ Categories=System;
             self.update_version_display()
             self.version_combo.setCurrentText("")
         except Exception as e:
-            QMessageBox.critical(
-                self,
-                t("gui_error", "Error"),
+            self._show_message(
+                QMessageBox.Icon.Critical,
+                self._strings()["error"],
                 t("gui_version_set_failed", "Failed to set version:\n\n{error}").format(
                     error=str(e)
                 ),
             )
 
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str):
+        """Show a modal message using the dialog's preallocated QMessageBox"""
+        self._msgbox.setIcon(icon)
+        self._msgbox.setWindowTitle(title)
+        self._msgbox.setText(text)
+        self._msgbox.exec()
 
     def save_and_close(self):
-        """Save config and close dialog"""
-        if self.save_config():
+        """Save config and close dialog
+
+        The file is written on a ConfigSaveThread; the dialog is accepted once
+        the write has finished, so callers reloading the config see the change.
+        """
+        if self._save_thread is not None:
+            return
+
+        new_config = self._collect_config()
+        if not self._config_needs_write(new_config):
+            self.accept()
+            return
+
+        self.save_btn.setEnabled(False)
+        self._save_thread = ConfigSaveThread(self.config_manager, new_config, self)
+        self._save_thread.finished.connect(
+            lambda success: self._on_config_saved(success, new_config)
+        )
+        self._save_thread.start()
+
+    def _on_config_saved(self, success: bool, new_config: dict):
+        """Handle the end of a background config write"""
+        self._save_thread.wait()
+        self._save_thread = None
+        self.save_btn.setEnabled(True)
+        if success:
+            self.config = new_config
             self.accept()
         else:
-            QMessageBox.warning(
-                self,
-                t("gui_error", "Error"),
+            self._show_message(
+                QMessageBox.Icon.Warning,
+                self._strings()["error"],
                 t("gui_config_save_failed", "Failed to save configuration"),
             )
+
+    def reject(self):
+        """Close without saving (ignored while a save is still being written)"""
+        if self._save_thread is not None:
+            return
+        super().reject()
@@ -4,28 +4,171 @@ CachyOS Multi-Updater - Migration Dialog
 Dialog for showing migration hints from manual/portable to AUR installations
 """
 
-import subprocess
+import functools
+import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QPushButton,
-    QTextEdit,
+    QPlainTextEdit,
     QMessageBox,
     QScrollArea,
     QWidget,
 )
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
 
 # Import from new structure
-from ..core.i18n import t
-from ..widgets import get_fa_icon, apply_fa_font
+from ..core.i18n import t, current_language
+from ..widgets import create_fa_button
 from ..utils import get_logger
 
 
+# AUR helper suggested per component when none is installed
+_AUR_HELPER_FALLBACK = {"cursor": "yay", "adguard": "paru"}
+
+_AUR_HELPER_INSTALL = (
+    "# Install {aur_helper} (recommended)\n"
+    "git clone https://aur.archlinux.org/{aur_helper}.git\n"
+    "cd {aur_helper}\n"
+    "makepkg -si"
+)
+
+# Migration steps as (translation key, default title, command template);
+# "{aur_helper}" is filled in when the dialog is built
+_CURSOR_STOP = (
+    "gui_migration_step_stop",
+    "Stop Cursor",
+    "killall cursor electron 2>/dev/null || pkill -f cursor",
+)
+_CURSOR_BACKUP = (
+    "gui_migration_step_backup",
+    "Backup Data",
+    "mkdir -p ~/Backup-Cursor-Alt\n"
+    "cp -r ~/.config/Cursor ~/Backup-Cursor-Alt/\n"
+    "cp -r ~/.cursor ~/Backup-Cursor-Alt/ 2>/dev/null || true",
+)
+_CURSOR_REMOVE_MANUAL = (
+    "gui_migration_step_remove",
+    "Remove Old Installation",
+    "sudo rm -rf /usr/share/cursor /opt/cursor /opt/Cursor\n"
+    "sudo rm -f /usr/bin/cursor /usr/local/bin/cursor\n"
+    "sudo rm -f /usr/share/applications/cursor*.desktop",
+)
+_CURSOR_REMOVE_PORTABLE = (
+    "gui_migration_step_remove",
+    "Remove Old Installation",
+    "# Remove portable installation\n"
+    "rm -f ~/.local/bin/cursor ~/.local/bin/cursor.AppImage\n"
+    "rm -f ~/Applications/cursor.AppImage ~/Apps/cursor.AppImage\n"
+    "rm -f ~/Applications/Cursor.AppImage ~/Apps/Cursor.AppImage",
+)
+_CURSOR_INSTALL = (
+    "gui_migration_step_install",
+    "Install AUR Package",
+    "{aur_helper} -S cursor-bin",
+)
+_CURSOR_START = ("gui_migration_step_start", "Start Cursor", "cursor")
+
+_ADGUARD_STEPS = (
+    (
+        "gui_migration_step_stop",
+        "Stop AdGuard Home",
+        "sudo systemctl stop AdGuardHome || systemctl --user stop AdGuardHome",
+    ),
+    (
+        "gui_migration_step_backup",
+        "Backup Data",
+        "sudo cp -a ~/AdGuardHome ~/AdGuardHome.old-backup 2>/dev/null || true",
+    ),
+    (
+        "gui_migration_step_install",
+        "Install AUR Package",
+        "{aur_helper} -S adguardhome",
+    ),
+    (
+        "gui_migration_step_migrate",
+        "Migrate Configuration",
+        "sudo mkdir -p /etc/AdGuardHome /var/lib/AdGuardHome\n"
+        "sudo cp -a ~/AdGuardHome/AdGuardHome.yaml /etc/AdGuardHome/ 2>/dev/null || true\n"
+        "sudo cp -a ~/AdGuardHome/data /var/lib/AdGuardHome/ 2>/dev/null || true\n"
+        "# Set permissions (user may vary: adguard or adguardhome)\n"
+        "sudo chown -R adguard:adguard /etc/AdGuardHome /var/lib/AdGuardHome 2>/dev/null || \\\n"
+        "sudo chown -R adguardhome:adguardhome /etc/AdGuardHome /var/lib/AdGuardHome 2>/dev/null || true",
+    ),
+    (
+        "gui_migration_step_start",
+        "Start AdGuard Home",
+        "sudo systemctl daemon-reload\n"
+        "sudo systemctl enable --now AdGuardHome",
+    ),
+)
+
+# (component, installation type) -> steps; None is the fallback for other types
+_MIGRATION_TEMPLATES = {
+    ("cursor", "manual"): (
+        _CURSOR_STOP,
+        _CURSOR_BACKUP,
+        _CURSOR_REMOVE_MANUAL,
+        _CURSOR_INSTALL,
+        _CURSOR_START,
+    ),
+    ("cursor", "portable"): (
+        _CURSOR_STOP,
+        _CURSOR_BACKUP,
+        _CURSOR_REMOVE_PORTABLE,
+        _CURSOR_INSTALL,
+        _CURSOR_START,
+    ),
+    ("cursor", None): (_CURSOR_STOP, _CURSOR_BACKUP, _CURSOR_INSTALL, _CURSOR_START),
+    ("adguard", None): _ADGUARD_STEPS,
+}
+
+
+_AUR_HELPERS = ("yay", "paru", "pikaur", "aurman")
+
+
+@functools.lru_cache(maxsize=1)
+def _find_aur_helper() -> Optional[str]:
+    """First AUR helper found on PATH (looked up once per process)"""
+    return next((helper for helper in _AUR_HELPERS if shutil.which(helper)), None)
+
+
+@functools.lru_cache(maxsize=16)
+def _build_migration_steps(
+    component: str,
+    installation_type: str,
+    aur_helper: Optional[str],
+    language: Optional[str],
+) -> Tuple[Tuple[str, str], ...]:
+    """Build the numbered migration steps (cached; language is part of the key)"""
+    templates = _MIGRATION_TEMPLATES.get(
+        (component, installation_type)
+    ) or _MIGRATION_TEMPLATES.get((component, None))
+    if not templates:
+        return ()
+
+    steps = []
+    if not aur_helper:
+        aur_helper = _AUR_HELPER_FALLBACK[component]
+        steps.append(
+            (
+                t("gui_migration_step_aur_helper", "Install AUR Helper"),
+                _AUR_HELPER_INSTALL.format(aur_helper=aur_helper),
+            )
+        )
+    steps.extend(
+        (t(key, title), body.format(aur_helper=aur_helper))
+        for key, title, body in templates
+    )
+    return tuple(
+        (f"{i}. {title}", command) for i, (title, command) in enumerate(steps, 1)
+    )
+
+
 class MigrationDialog(QDialog):
     """Dialog for showing migration instructions"""
 
@@ -90,18 +233,24 @@ class MigrationDialog(QDialog):
         scroll_layout = QVBoxLayout()
         scroll_layout.setSpacing(8)
 
-        # Generate migration commands
+        # Generate migration commands (one shared font for all command boxes)
+        command_font = QFont("Monospace")
+        command_font.setStyleHint(QFont.StyleHint.TypeWriter)
         commands = self._generate_migration_commands()
-        for i, (step_title, command) in enumerate(commands, 1):
-            step_label = QLabel(f"{i}. {step_title}")
+        for step_title, command in commands:
+            step_label = QLabel(step_title)
             step_label.setWordWrap(True)
             scroll_layout.addWidget(step_label)
 
-            command_text = QTextEdit()
-            command_text.setPlainText(command)
+            # Plain text view: no rich-text document for shell commands
+            command_text = QPlainTextEdit()
             command_text.setReadOnly(True)
+            command_text.setUndoRedoEnabled(False)
+            command_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
             command_text.setMaximumHeight(80)
-            command_text.setFont(step_label.font())
+            command_text.setFont(command_font)
+            command_text.document().setDocumentMargin(2)
+            command_text.setPlainText(command)
             scroll_layout.addWidget(command_text)
 
         scroll_widget.setLayout(scroll_layout)
@@ -123,167 +272,26 @@ class MigrationDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addStretch()
 
-        icon, text = get_fa_icon("times", t("gui_close", "Close"))
-        close_btn = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(close_btn)
-        close_btn.clicked.connect(self.accept)
+        close_btn = create_fa_button("times", t("gui_close", "Close"), self.accept)
         button_layout.addWidget(close_btn)
 
         layout.addLayout(button_layout)
         self.setLayout(layout)
 
-    def _generate_migration_commands(self) -> list[tuple[str, str]]:
-        """Generate migration commands based on component and installation type"""
-        commands: list[tuple[str, str]] = []
-
-        if self.component == "cursor":
-            # Detect AUR helper
-            aur_helper = self._detect_aur_helper()
-            if not aur_helper:
-                commands.append(
-                    (
-                        t("gui_migration_step_aur_helper", "Install AUR Helper"),
-                        "# Install yay (recommended)\n"
-                        "git clone https://aur.archlinux.org/yay.git\n"
-                        "cd yay\n"
-                        "makepkg -si",
-                    )
-                )
-                aur_helper = "yay"
-
-            # Step 1: Stop Cursor
-            commands.append(
-                (
-                    t("gui_migration_step_stop", "Stop Cursor"),
-                    "killall cursor electron 2>/dev/null || pkill -f cursor",
-                )
-            )
-
-            # Step 2: Backup
-            commands.append(
-                (
-                    t("gui_migration_step_backup", "Backup Data"),
-                    "mkdir -p ~/Backup-Cursor-Alt\n"
-                    "cp -r ~/.config/Cursor ~/Backup-Cursor-Alt/\n"
-                    "cp -r ~/.cursor ~/Backup-Cursor-Alt/ 2>/dev/null || true",
-                )
-            )
-
-            # Step 3: Remove old installation
-            if self.installation_type == "manual":
-                commands.append(
-                    (
-                        t("gui_migration_step_remove", "Remove Old Installation"),
-                        "sudo rm -rf /usr/share/cursor /opt/cursor /opt/Cursor\n"
-                        "sudo rm -f /usr/bin/cursor /usr/local/bin/cursor\n"
-                        "sudo rm -f /usr/share/applications/cursor*.desktop",
-                    )
-                )
-            elif self.installation_type == "portable":
-                commands.append(
-                    (
-                        t("gui_migration_step_remove", "Remove Old Installation"),
-                        "# Remove portable installation\n"
-                        "rm -f ~/.local/bin/cursor ~/.local/bin/cursor.AppImage\n"
-                        "rm -f ~/Applications/cursor.AppImage ~/Apps/cursor.AppImage\n"
-                        "rm -f ~/Applications/Cursor.AppImage ~/Apps/Cursor.AppImage",
-                    )
-                )
-
-            # Step 4: Install AUR package
-            commands.append(
-                (
-                    t("gui_migration_step_install", "Install AUR Package"),
-                    f"{aur_helper} -S cursor-bin",
-                )
-            )
-
-            # Step 5: Start Cursor
-            commands.append(
-                (
-                    t("gui_migration_step_start", "Start Cursor"),
-                    "cursor",
-                )
-            )
-
-        elif self.component == "adguard":
-            # Detect AUR helper
-            aur_helper = self._detect_aur_helper()
-            if not aur_helper:
-                commands.append(
-                    (
-                        t("gui_migration_step_aur_helper", "Install AUR Helper"),
-                        "# Install paru (recommended)\n"
-                        "git clone https://aur.archlinux.org/paru.git\n"
-                        "cd paru\n"
-                        "makepkg -si",
-                    )
-                )
-                aur_helper = "paru"
-
-            # Step 1: Stop service
-            commands.append(
-                (
-                    t("gui_migration_step_stop", "Stop AdGuard Home"),
-                    "sudo systemctl stop AdGuardHome || systemctl --user stop AdGuardHome",
-                )
-            )
-
-            # Step 2: Backup
-            commands.append(
-                (
-                    t("gui_migration_step_backup", "Backup Data"),
-                    "sudo cp -a ~/AdGuardHome ~/AdGuardHome.old-backup 2>/dev/null || true",
-                )
-            )
-
-            # Step 3: Install AUR package
-            commands.append(
-                (
-                    t("gui_migration_step_install", "Install AUR Package"),
-                    f"{aur_helper} -S adguardhome",
-                )
-            )
-
-            # Step 4: Migrate config
-            commands.append(
-                (
-                    t("gui_migration_step_migrate", "Migrate Configuration"),
-                    "sudo mkdir -p /etc/AdGuardHome /var/lib/AdGuardHome\n"
-                    "sudo cp -a ~/AdGuardHome/AdGuardHome.yaml /etc/AdGuardHome/ 2>/dev/null || true\n"
-                    "sudo cp -a ~/AdGuardHome/data /var/lib/AdGuardHome/ 2>/dev/null || true\n"
-                    "# Set permissions (user may vary: adguard or adguardhome)\n"
-                    "sudo chown -R adguard:adguard /etc/AdGuardHome /var/lib/AdGuardHome 2>/dev/null || \\\n"
-                    "sudo chown -R adguardhome:adguardhome /etc/AdGuardHome /var/lib/AdGuardHome 2>/dev/null || true",
-                )
-            )
-
-            # Step 5: Start service
-            commands.append(
-                (
-                    t("gui_migration_step_start", "Start AdGuard Home"),
-                    "sudo systemctl daemon-reload\n"
-                    "sudo systemctl enable --now AdGuardHome",
-                )
-            )
-
-        return commands
+    def _generate_migration_commands(self) -> Tuple[Tuple[str, str], ...]:
+        """Generate migration commands based on component and installation type
+
+        Returns:
+            Tuple of (numbered step title, command) pairs
+        """
+        return _build_migration_steps(
+            self.component,
+            self.installation_type,
+            self._detect_aur_helper(),
+            current_language(),
+        )
 
     def _detect_aur_helper(self) -> Optional[str]:
         """Detect available AUR helper"""
-        helpers = ["yay", "paru", "pikaur", "aurman"]
-        for helper in helpers:
-            try:
-                result = subprocess.run(
-                    ["which", helper],
-                    capture_output=True,
-                    text=True,
-                    timeout=2,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    return helper
-            except Exception:
-                continue
-        return None
+        return _find_aur_helper()
 
@@ -4,21 +4,21 @@ CachyOS Multi-Updater - Sudo Password Dialog
 Dialog for entering sudo password
 """
 
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QPushButton,
     QCheckBox,
     QMessageBox,
 )
 
 
 # Import from new structure
-from ..core.i18n import t
-from ..widgets import get_fa_icon, apply_fa_font
+from ..core.i18n import t, t_many
+from ..widgets import create_fa_button
 from ..utils import get_logger
 
 # Try to import FACheckBox
@@ -30,6 +30,15 @@ except ImportError:
     HAS_FA_CHECKBOX = False
     FACheckBox = None
 
+# init_ui() labels, translated in one t_many() call
+_UI_STRINGS = (
+    ("gui_sudo_password_info", "Sudo password is required to perform system updates."),
+    ("gui_password", "Password:"),
+    ("gui_save_password", "Save password in settings (encrypted)"),
+    ("gui_cancel", "Cancel"),
+    ("gui_ok", "OK"),
+)
+
 
 class SudoDialog(QDialog):
     """Dialog for sudo password input"""
@@ -41,6 +50,7 @@ class SudoDialog(QDialog):
         self.password = None
         self.save_to_config = save_to_config
         self.save_password = False
+        self.save_checkbox = None  # Created in init_ui() if save_to_config
         self.setWindowTitle(t("gui_sudo_password_required", "Sudo Password Required"))
         self.setMinimumWidth(400)
         self.init_ui()
@@ -48,38 +58,35 @@ class SudoDialog(QDialog):
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
+        info_text, password_text, save_text, cancel_text, ok_text = t_many(
+            _UI_STRINGS
+        )
 
         # Info label
-        info_label = QLabel(
-            t(
-                "gui_sudo_password_info",
-                "Sudo password is required to perform system updates.",
-            )
-        )
+        info_label = QLabel(info_text)
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
 
         # Password input
-        password_label = QLabel(t("gui_password", "Password:"))
+        password_label = QLabel(password_text)
         layout.addWidget(password_label)
 
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password_input.returnPressed.connect(self.accept_dialog)
+        # Queued so the key event returns before the dialog closes or warns
+        self.password_input.returnPressed.connect(
+            self.accept_dialog, Qt.ConnectionType.QueuedConnection
+        )
         layout.addWidget(self.password_input)
 
         # Save to config checkbox (always show if save_to_config is True)
         if self.save_to_config:
             if HAS_FA_CHECKBOX and FACheckBox:
-                self.save_checkbox = FACheckBox(
-                    t("gui_save_password", "Save password in settings (encrypted)")
-                )
+                self.save_checkbox = FACheckBox(save_text)
                 # Ensure checkbox is visible and properly initialized
                 self.save_checkbox.setChecked(False)  # Default: don't save
             else:
-                self.save_checkbox = QCheckBox(
-                    t("gui_save_password", "Save password in settings (encrypted)")
-                )
+                self.save_checkbox = QCheckBox(save_text)
                 self.save_checkbox.setChecked(False)  # Default: don't save
             layout.addWidget(self.save_checkbox)
 
@@ -87,19 +94,10 @@ class SudoDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addStretch()
 
-        icon, text = get_fa_icon("times", t("gui_cancel", "Cancel"))
-        cancel_btn = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(cancel_btn)
-        cancel_btn.clicked.connect(self.reject)
+        cancel_btn = create_fa_button("times", cancel_text, self.reject)
         button_layout.addWidget(cancel_btn)
 
-        icon, text = get_fa_icon("check", t("gui_ok", "OK"))
-        ok_btn = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(ok_btn)
-        ok_btn.clicked.connect(self.accept_dialog)
-        ok_btn.setDefault(True)
+        ok_btn = create_fa_button("check", ok_text, self.accept_dialog, default=True)
         button_layout.addWidget(ok_btn)
 
         layout.addLayout(button_layout)
@@ -112,25 +110,28 @@ class SudoDialog(QDialog):
         """Accept dialog and return password"""
         password = self.password_input.text()
         if not password:
-            QMessageBox.warning(
-                self,
-                t("gui_error", "Error"),
-                t("gui_password_empty", "Password cannot be empty!"),
-            )
+            QTimer.singleShot(0, self._warn_empty_password)
             return
 
         self.password = password
         # Check if user wants to save password (only if checkbox exists and is checked)
-        if self.save_to_config and hasattr(self, "save_checkbox"):
-            self.save_password = self.save_checkbox.isChecked()
-        else:
-            self.save_password = False
+        self.save_password = bool(
+            self.save_checkbox is not None and self.save_checkbox.isChecked()
+        )
         self.accept()
 
+    def _warn_empty_password(self):
+        """Show the empty password warning outside of the input event"""
+        QMessageBox.warning(
+            self,
+            t("gui_error", "Error"),
+            t("gui_password_empty", "Password cannot be empty!"),
+        )
+
     def get_password(self):
         """Get entered password"""
         return self.password
 
     def should_save_password(self):
         """Check if password should be saved"""
-        return self.save_password if hasattr(self, "save_password") else False
+        return self.save_password
@@ -4,14 +4,25 @@ CachyOS Multi-Updater - Update Confirmation Dialog
 Dialog shown after check-updates to confirm starting real updates
 """
 
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel
 from PyQt6.QtCore import Qt
 
 # Import from new structure
-from ..core.i18n import t
-from ..widgets import get_fa_icon, apply_fa_font
+from ..core.i18n import t, t_many
+from ..widgets import create_fa_button
 from ..utils import get_logger
 
+# init_ui() labels, translated in one t_many() call
+_UI_STRINGS = (
+    (
+        "gui_start_updates_now",
+        "Updates are available. Do you want to start the update process now?",
+    ),
+    ("gui_exit", "Exit GUI"),
+    ("gui_no", "No"),
+    ("gui_yes", "Yes"),
+)
+
 
 class UpdateConfirmationDialog(QDialog):
     """Dialog to confirm starting updates after check"""
@@ -31,14 +42,10 @@ class UpdateConfirmationDialog(QDialog):
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
+        info_text, exit_text, no_text, yes_text = t_many(_UI_STRINGS)
 
         # Info label
-        info_label = QLabel(
-            t(
-                "gui_start_updates_now",
-                "Updates are available. Do you want to start the update process now?",
-            )
-        )
+        info_label = QLabel(info_text)
         info_label.setWordWrap(True)
         info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(info_label)
@@ -50,30 +57,17 @@ class UpdateConfirmationDialog(QDialog):
         button_layout = QHBoxLayout()
 
         # Close button (left) - closes entire GUI
-        icon, text = get_fa_icon("window-close", t("gui_exit", "Exit GUI"))
-        close_btn = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(close_btn)
-        close_btn.clicked.connect(self.close_gui)
+        close_btn = create_fa_button("window-close", exit_text, self.close_gui)
         button_layout.addWidget(close_btn)
 
         button_layout.addStretch()
 
         # No button (middle)
-        icon, text = get_fa_icon("times", t("gui_no", "No"))
-        no_btn = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(no_btn)
-        no_btn.clicked.connect(self.accept_no)
+        no_btn = create_fa_button("times", no_text, self.accept_no)
         button_layout.addWidget(no_btn)
 
         # Yes button (right)
-        icon, text = get_fa_icon("check", t("gui_yes", "Yes"))
-        yes_btn = QPushButton(icon, text) if icon else QPushButton(text)
-        if not icon:
-            apply_fa_font(yes_btn)
-        yes_btn.clicked.connect(self.accept)
-        yes_btn.setDefault(True)
+        yes_btn = create_fa_button("check", yes_text, self.accept, default=True)
         button_layout.addWidget(yes_btn)
 
         layout.addLayout(button_layout)
@@ -4,11 +4,20 @@ CachyOS Multi-Updater - Update Dialog
 Dialog for updating the tool itself
 """
 
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import io
+import json
+import os
 import tempfile
+import threading
+import time
 import shutil
 import zipfile
 import subprocess
+import requests
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -24,38 +33,532 @@ from PyQt6.QtWidgets import (
     QComboBox,
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from urllib.request import urlretrieve
+from urllib.parse import unquote, urlsplit
 
 # Import from new structure
-from ..core.i18n import t
+from ..core.config_manager import write_file_atomic
+from ..core.i18n import t, t_many
 from ..utils import VersionChecker, get_logger
 
+# Segmented download: up to this many parallel Range requests, each at least
+# _MIN_SEGMENT_SIZE bytes (smaller files are fetched with a single request)
+_SEGMENT_WORKERS = 8
+_MIN_SEGMENT_SIZE = 1024 * 1024
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_DOWNLOAD_TIMEOUT = 30
+_USER_AGENT = "CachyOS-Multi-Updater-GUI"
+# Emit progress at most ~30 times per second (and only when it changed)
+_PROGRESS_INTERVAL = 0.033
+
+# Downloads are kept here until installed, so a failed download can resume
+_DOWNLOAD_CACHE_DIR = Path.home() / ".cache" / "cachyos-multi-updater" / "downloads"
+
+# Extract straight from the remote ZIP if the needed entries make up at most
+# this fraction of it; reads are buffered in blocks of _REMOTE_BUFFER_SIZE
+_REMOTE_EXTRACT_MAX_FRACTION = 0.5
+_REMOTE_BUFFER_SIZE = 256 * 1024
+
+# Extraction directories are created in the install's parent directory (so
+# the extracted tree can be renamed into place), hidden by the leading dot
+_TEMP_DIR_PREFIX = ".cachyos-updater-"
+
+# Release assets listing "<sha256>  <file name>" lines for the other assets
+_CHECKSUM_ASSET_NAMES = ("checksums.txt", "SHA256SUMS")
+
+# Parallel extraction: members per task (amortizes per-task overhead), and
+# the read buffer for each task's archive handle (default is 8 KiB)
+_EXTRACT_BATCH_SIZE = 32
+_EXTRACT_BUFFER_SIZE = 1024 * 1024
+
+
+# init_ui() labels, translated in one t_many() call
+_UI_STRINGS = (
+    ("gui_version_info", "Version Information"),
+    ("gui_local_version", "Local Version"),
+    ("gui_github_version", "GitHub Version"),
+    ("gui_update_method", "Update Method"),
+    ("gui_auto_update", "Automatic Update (ZIP Download)"),
+    ("gui_select_asset", "Select release asset to download"),
+    ("gui_manual_update", "Manual Update (Select ZIP File)"),
+    ("gui_git_pull_update", "Git Pull Update"),
+    ("gui_start_update", "Start Update"),
+    ("gui_cancel", "Cancel"),
+)
+
+
+class _RangeNotSupported(Exception):
+    """Server answered a Range request with the full body (200 instead of 206)"""
+
+
+def _update_members(names: List[str]) -> List[str]:
+    """Return the archive members that make up the cachyos-multi-updater directory
+
+    Falls back to all members if the archive has an unexpected layout, so
+    install_from_zip() can report it.
+    """
+    for name in names:
+        top, _, rest = name.partition("/")
+        if not top.startswith("sc-cachyos-multi-updater"):
+            continue
+        if rest == "cachyos-multi-updater/update-all.sh":
+            prefix = f"{top}/cachyos-multi-updater/"
+            break
+        if rest == "update-all.sh":
+            prefix = f"{top}/"
+            break
+    else:
+        return names
+    return [name for name in names if name.startswith(prefix)]
+
+
+def _format_size(size: int) -> str:
+    """Format a byte count for display (B, KB or MB)"""
+    if size > 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    if size > 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} B"
+
+
+def _extract_parallel(zip_path: Path, members: List[str], destination: Path) -> None:
+    """Extract ZIP members with a thread pool, one ZipFile per task
+
+    ZipFile objects must not be shared between threads, and zipfile creates
+    missing parent directories without exist_ok, so they are created here
+    first (with the same path sanitizing zipfile applies).
+    """
+    for name in members:
+        parts = os.path.splitdrive(name.replace("/", os.path.sep))[1].split(os.path.sep)
+        parts = [part for part in parts[:-1] if part not in ("", os.curdir, os.pardir)]
+        if parts:
+            os.makedirs(destination.joinpath(*parts), exist_ok=True)
+
+    def extract_batch(batch: List[str]):
+        with open(zip_path, "rb", buffering=_EXTRACT_BUFFER_SIZE) as f:
+            with zipfile.ZipFile(f, "r") as zip_ref:
+                for name in batch:
+                    zip_ref.extract(name, destination)
+
+    batches = [
+        members[i : i + _EXTRACT_BATCH_SIZE]
+        for i in range(0, len(members), _EXTRACT_BATCH_SIZE)
+    ]
+    workers = min(len(batches), os.cpu_count() or 1)
+    if workers <= 1:
+        for batch in batches:
+            extract_batch(batch)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Iterate to re-raise the first extraction error
+        for _ in pool.map(extract_batch, batches):
+            pass
+
+
+class _HttpRangeReader(io.RawIOBase):
+    """Seekable, read-only view of a remote file that reads with Range requests
+
+    Wrap it in io.BufferedReader so zipfile's small header reads share one
+    request per buffer.
+    """
+
+    def __init__(self, session: requests.Session, url: str, size: int):
+        super().__init__()
+        self._session = session
+        self._url = url
+        self._size = size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._pos = offset
+        return offset
+
+    def readinto(self, buffer) -> int:
+        end = min(self._pos + len(buffer), self._size)
+        if end <= self._pos:
+            return 0
+        response = self._session.get(
+            self._url,
+            headers={"Range": f"bytes={self._pos}-{end - 1}"},
+            timeout=_DOWNLOAD_TIMEOUT,
+        )
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise _RangeNotSupported()
+        data = response.content
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
 
 class UpdateDownloadThread(QThread):
-    """Thread for downloading update ZIP"""
+    """Thread for downloading update ZIP
+
+    The ZIP is stored in cache_dir under a name derived from the URL. For
+    segmented downloads, the progress of every segment is saved next to it
+    (.meta), together with the server's ETag/Last-Modified, so a later
+    attempt only fetches what is missing if the file has not changed.
+
+    If the update files are only a small part of the archive, they are
+    extracted into extract_dir straight from the server instead, and
+    finished reports that directory in place of the ZIP.
+
+    If checksums_url is given, the whole ZIP is always downloaded and
+    checked against its SHA-256 entry there, and downloaded once more from
+    scratch on mismatch.
+    """
 
     progress = pyqtSignal(int)
-    finished = pyqtSignal(str, str)  # zip_path, error
+    finished = pyqtSignal(str, str)  # zip_path (or extract_dir), error
 
-    def __init__(self, url: str, temp_dir: Path):
+    def __init__(
+        self,
+        url: str,
+        cache_dir: Path,
+        extract_dir: Path,
+        checksums_url: Optional[str] = None,
+    ):
         super().__init__()
         self.url = url
-        self.temp_dir = temp_dir
-        self.zip_path = temp_dir / "update.zip"
+        self.extract_dir = extract_dir
+        self.checksums_url = checksums_url
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        self.zip_path = cache_dir / f"{key}.zip"
+        self.meta_path = cache_dir / f"{key}.meta"
+        self._session: Optional[requests.Session] = None
+        self._last_pct = -1
+        self._last_emit = 0.0
 
     def run(self):
         """Download ZIP file"""
         try:
+            # One session for all requests, so they reuse kept-alive connections
+            with requests.Session() as self._session:
+                self._session.headers["User-Agent"] = _USER_AGENT
+                path = self._fetch()
+            self.finished.emit(path, "")
+        except Exception as e:
+            self.finished.emit("", str(e))
+
+    def _fetch(self) -> str:
+        """Download (or remotely extract) the update; returns the path to report"""
+        self.zip_path.parent.mkdir(parents=True, exist_ok=True)
+        url, total, validators = self._probe_ranges()
+        if total:
+            try:
+                # A partial download in the cache is cheaper to finish,
+                # and only a whole archive can be checked against the
+                # published checksums
+                resumable = self._load_segments(total, validators) is not None
+                if (
+                    not resumable
+                    and not self.checksums_url
+                    and self._extract_remote(url, total)
+                ):
+                    return str(self.extract_dir)
+            except _RangeNotSupported:
+                total = 0
+
+        self._download(url, total, validators)
+        if self.checksums_url:
+            expected = self._expected_checksum()
+            if expected and self._file_checksum() != expected:
+                # Corrupt (e.g. resumed from a bad partial file): start over
+                self.clear_cache()
+                self._download(url, total, validators)
+                if self._file_checksum() != expected:
+                    raise ValueError(f"Checksum mismatch for {self._file_name()}")
+        return str(self.zip_path)
+
+    def _download(self, url: str, total: int, validators: Dict[str, str]):
+        """Download the ZIP to zip_path, in segments if the server allows it"""
+        if total:
+            try:
+                self._download_segments(url, total, validators)
+                return
+            except _RangeNotSupported:
+                pass  # Fall back to a single sequential download
+
+        # A sequential download always starts over
+        self.meta_path.unlink(missing_ok=True)
+
+        with self._session.get(
+            self.url, stream=True, timeout=_DOWNLOAD_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            try:
+                size = int(response.headers.get("Content-Length", 0))
+            except ValueError:
+                size = 0
+            received = 0
+            with open(self.zip_path, "wb") as f:
+                for block in response.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                    f.write(block)
+                    received += len(block)
+                    if size > 0:
+                        self._report_progress(received * 100 // size)
+        self._report_progress(100)
+
+    def _file_name(self) -> str:
+        """Name of the downloaded file, as listed in the checksums asset"""
+        return unquote(urlsplit(self.url).path).rsplit("/", 1)[-1]
+
+    def _expected_checksum(self) -> Optional[str]:
+        """Return the file's SHA-256 from the checksums asset (None if unlisted)"""
+        response = self._session.get(self.checksums_url, timeout=_DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        name = self._file_name()
+        for line in response.text.splitlines():
+            parts = line.strip().split(None, 1)
+            if len(parts) == 2 and parts[1].lstrip("*") == name:
+                return parts[0].lower()
+        return None
+
+    def _file_checksum(self) -> str:
+        """SHA-256 of the downloaded file"""
+        with open(self.zip_path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    def _report_progress(self, percent: int):
+        """Emit progress if it changed, throttled (100% is always emitted)"""
+        percent = min(percent, 100)
+        if percent == self._last_pct:
+            return
+        now = time.monotonic()
+        if percent < 100 and now - self._last_emit < _PROGRESS_INTERVAL:
+            return
+        self._last_pct = percent
+        self._last_emit = now
+        self.progress.emit(percent)
+
+    def clear_cache(self):
+        """Remove the downloaded file and its resume data"""
+        self.zip_path.unlink(missing_ok=True)
+        self.meta_path.unlink(missing_ok=True)
+
+    def _probe_ranges(self):
+        """Return (final URL, size, validators) for a segmented download
+
+        The size is 0 if the server does not advertise byte ranges, does not
+        report a length, or the file is too small to be worth splitting.
+        """
+        try:
+            response = self._session.head(
+                self.url, allow_redirects=True, timeout=_DOWNLOAD_TIMEOUT
+            )
+            response.raise_for_status()
+            total = int(response.headers.get("Content-Length", 0))
+        except (requests.RequestException, ValueError):
+            return self.url, 0, {}
+        if response.headers.get("Accept-Ranges", "").lower() != "bytes":
+            return self.url, 0, {}
+        if total < 2 * _MIN_SEGMENT_SIZE:
+            return self.url, 0, {}
+        validators = {
+            name: response.headers[name]
+            for name in ("ETag", "Last-Modified")
+            if name in response.headers
+        }
+        return response.url, total, validators
+
+    def _extract_remote(self, url: str, total: int) -> bool:
+        """Extract the update files from the remote ZIP without downloading it
+
+        Returns False (nothing extracted) if the files make up too much of the
+        archive for this to save anything over a full download, or if the
+        archive cannot be read remotely.
+        """
+        reader = io.BufferedReader(
+            _HttpRangeReader(self._session, url, total), _REMOTE_BUFFER_SIZE
+        )
+        try:
+            zip_ref = zipfile.ZipFile(reader)
+        except zipfile.BadZipFile:
+            return False  # Let the full download report any real problem
+        with zip_ref:
+            names = set(_update_members(zip_ref.namelist()))
+            members = [info for info in zip_ref.infolist() if info.filename in names]
+            needed = sum(info.compress_size for info in members)
+            if needed > total * _REMOTE_EXTRACT_MAX_FRACTION:
+                return False
+            extracted = 0
+            for info in members:
+                zip_ref.extract(info, self.extract_dir)
+                extracted += info.compress_size
+                self._report_progress(extracted * 100 // max(needed, 1))
+        return True
+
+    def _load_segments(
+        self, total: int, validators: Dict[str, str]
+    ) -> Optional[List[List[int]]]:
+        """Return the saved [offset, end] segments if the download can resume"""
+        if not validators or not self.zip_path.exists():
+            return None  # Without validators a changed file would go unnoticed
+        try:
+            meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+            if meta["size"] != total or meta["validators"] != validators:
+                return None
+            return [[int(offset), int(end)] for offset, end in meta["segments"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_segments(
+        self, total: int, validators: Dict[str, str], segments: List[List[int]]
+    ):
+        """Save segment progress so a later attempt can resume"""
+        meta = {"size": total, "validators": validators, "segments": segments}
+        write_file_atomic(self.meta_path, json.dumps(meta).encode("utf-8"))
+
+    def _download_segments(self, url: str, total: int, validators: Dict[str, str]):
+        """Fetch the file with parallel Range requests into one preallocated file"""
+        segments = self._load_segments(total, validators)
+        resuming = segments is not None
+        if not resuming:
+            segment_size = max(_MIN_SEGMENT_SIZE, -(-total // _SEGMENT_WORKERS))
+            segments = [
+                [start, min(start + segment_size, total) - 1]
+                for start in range(0, total, segment_size)
+            ]
+        received = [total - sum(end + 1 - offset for offset, end in segments)]
+        lock = threading.Lock()
+        abort = threading.Event()
+        # Only resume if the file is still the one the saved segments belong to
+        if_range = validators.get("ETag") or validators.get("Last-Modified")
+
+        def fetch_segment(segment: List[int]):
+            headers = {"Range": f"bytes={segment[0]}-{segment[1]}"}
+            if resuming:
+                headers["If-Range"] = if_range
+            with self._session.get(
+                url, headers=headers, stream=True, timeout=_DOWNLOAD_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise _RangeNotSupported()
+                for block in response.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                    if abort.is_set():
+                        return
+                    os.pwrite(fd, block, segment[0])
+                    segment[0] += len(block)
+                    with lock:
+                        received[0] += len(block)
+            if segment[0] != segment[1] + 1:
+                raise IOError(f"Incomplete download: bytes {segment[0]}-{segment[1]}")
+
+        flags = os.O_RDWR | os.O_CREAT | (0 if resuming else os.O_TRUNC)
+        fd = os.open(self.zip_path, flags, 0o644)
+        try:
+            os.ftruncate(fd, total)
+            with ThreadPoolExecutor(max_workers=len(segments)) as pool:
+                pending = {
+                    pool.submit(fetch_segment, segment)
+                    for segment in segments
+                    if segment[0] <= segment[1]
+                }
+                try:
+                    while pending:
+                        done, pending = wait(
+                            pending, timeout=0.1, return_when=FIRST_EXCEPTION
+                        )
+                        for future in done:
+                            future.result()
+                        self._report_progress(received[0] * 100 // total)
+                except BaseException:
+                    abort.set()
+                    raise
+        finally:
+            os.close(fd)
+            self._save_segments(total, validators, segments)
+        self._report_progress(100)
 
-            def report_hook(blocknum, blocksize, totalsize):
-                if totalsize > 0:
-                    percent = int((blocknum * blocksize * 100) / totalsize)
-                    self.progress.emit(min(percent, 100))
 
-            urlretrieve(self.url, str(self.zip_path), report_hook)
-            self.finished.emit(str(self.zip_path), "")
+class GitPullThread(QThread):
+    """Thread for resetting the git checkout to origin/main"""
+
+    progress = pyqtSignal(str)  # git progress line
+    finished = pyqtSignal(bool, str)  # success, error
+
+    def __init__(self, root_dir: Path):
+        super().__init__()
+        self.root_dir = root_dir
+        self._process: Optional[subprocess.Popen] = None
+        self._cancelled = False
+
+    def run(self):
+        """Fetch origin/main and reset to it"""
+        try:
+            # A shallow clone only needs the tip, as the checkout is reset to
+            # it anyway; a full clone keeps its history (--depth would make
+            # it shallow)
+            fetch = ["git", "fetch", "--progress", "origin", "main"]
+            if (self.root_dir / ".git" / "shallow").exists():
+                fetch.insert(2, "--depth=1")
+            for command in (
+                fetch,
+                ["git", "reset", "--hard", "origin/main"],
+            ):
+                if self._cancelled:
+                    break
+                error = self._run_git(command)
+                if self._cancelled:
+                    break
+                if error is not None:
+                    self.finished.emit(False, error)
+                    return
+            if self._cancelled:
+                self.finished.emit(False, "")
+            else:
+                self.finished.emit(True, "")
         except Exception as e:
-            self.finished.emit("", str(e))
+            self.finished.emit(False, str(e))
+
+    def cancel(self):
+        """Stop the running git command"""
+        self._cancelled = True
+        process = self._process
+        if process and process.poll() is None:
+            process.terminate()
+
+    def _run_git(self, command: List[str]) -> Optional[str]:
+        """Run a git command, emitting its progress lines
+
+        Returns:
+            None on success, otherwise git's error output
+        """
+        # Text mode splits on "\r" too, so each progress update is one line.
+        # GIT_TERMINAL_PROMPT=0: fail instead of waiting for credentials
+        # on a terminal nobody is looking at.
+        self._process = subprocess.Popen(
+            command,
+            cwd=str(self.root_dir),
+            env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        output = []
+        for line in self._process.stderr:
+            line = line.strip()
+            if line:
+                output.append(line)
+                self.progress.emit(line)
+        if self._process.wait() == 0:
+            return None
+        return "\n".join(output[-10:]) or f"{' '.join(command)} failed"
 
 
 class UpdateDialog(QDialog):
@@ -87,22 +590,33 @@ class UpdateDialog(QDialog):
         # Check if .git exists
         self.has_git = (self.root_dir / ".git").exists()
 
+        # (display text, download URL) of the release's ZIP assets, once loaded
+        self._zip_asset_items: Optional[List[Tuple[str, str]]] = None
+
         self.init_ui()
 
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
+        (
+            version_info_text,
+            local_version_text,
+            github_version_text,
+            update_method_text,
+            auto_update_text,
+            select_asset_text,
+            manual_update_text,
+            git_pull_text,
+            start_update_text,
+            cancel_text,
+        ) = t_many(_UI_STRINGS)
 
         # Version info
-        version_group = QGroupBox(t("gui_version_info", "Version Information"))
+        version_group = QGroupBox(version_info_text)
         version_layout = QVBoxLayout()
 
-        local_label = QLabel(
-            f"{t('gui_local_version', 'Local Version')}: v{self.local_version}"
-        )
-        github_label = QLabel(
-            f"{t('gui_github_version', 'GitHub Version')}: v{self.github_version}"
-        )
+        local_label = QLabel(f"{local_version_text}: v{self.local_version}")
+        github_label = QLabel(f"{github_version_text}: v{self.github_version}")
 
         version_layout.addWidget(local_label)
         version_layout.addWidget(github_label)
@@ -110,15 +624,13 @@ class UpdateDialog(QDialog):
         layout.addWidget(version_group)
 
         # Update method selection
-        method_group = QGroupBox(t("gui_update_method", "Update Method"))
+        method_group = QGroupBox(update_method_text)
         method_layout = QVBoxLayout()
 
         self.button_group = QButtonGroup()
 
         # Automatic ZIP update (default)
-        self.radio_zip = QRadioButton(
-            t("gui_auto_update", "Automatic Update (ZIP Download)")
-        )
+        self.radio_zip = QRadioButton(auto_update_text)
         self.radio_zip.setChecked(True)
         self.button_group.addButton(self.radio_zip, 0)
         method_layout.addWidget(self.radio_zip)
@@ -126,9 +638,7 @@ class UpdateDialog(QDialog):
         # Asset selection (if multiple assets available)
         self.asset_combo = QComboBox()
         self.asset_combo.setVisible(False)
-        self.asset_combo.setToolTip(
-            t("gui_select_asset", "Select release asset to download")
-        )
+        self.asset_combo.setToolTip(select_asset_text)
         method_layout.addWidget(self.asset_combo)
 
         # Check for assets when ZIP is selected
@@ -136,15 +646,13 @@ class UpdateDialog(QDialog):
         self.on_zip_selected(True)  # Initial check
 
         # Manual file selection
-        self.radio_manual = QRadioButton(
-            t("gui_manual_update", "Manual Update (Select ZIP File)")
-        )
+        self.radio_manual = QRadioButton(manual_update_text)
         self.button_group.addButton(self.radio_manual, 1)
         method_layout.addWidget(self.radio_manual)
 
         # Git Pull (only if .git exists)
         if self.has_git:
-            self.radio_git = QRadioButton(t("gui_git_pull_update", "Git Pull Update"))
+            self.radio_git = QRadioButton(git_pull_text)
             self.button_group.addButton(self.radio_git, 2)
             method_layout.addWidget(self.radio_git)
         else:
@@ -157,11 +665,11 @@ class UpdateDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.addStretch()
 
-        self.update_button = QPushButton(t("gui_start_update", "Start Update"))
+        self.update_button = QPushButton(start_update_text)
         self.update_button.clicked.connect(self.start_update)
         button_layout.addWidget(self.update_button)
 
-        self.cancel_button = QPushButton(t("gui_cancel", "Cancel"))
+        self.cancel_button = QPushButton(cancel_text)
         self.cancel_button.clicked.connect(self.reject)
         button_layout.addWidget(self.cancel_button)
 
@@ -175,39 +683,28 @@ class UpdateDialog(QDialog):
             self.asset_combo.setVisible(False)
             return
 
-        # Check for release assets
-        assets = self.version_checker.get_release_assets(self.github_version)
-
-        # Filter for ZIP files
-        zip_assets = [a for a in assets if a.get("name", "").endswith(".zip")]
-
-        if len(zip_assets) > 0:
-            # Multiple assets available - show combo box
-            self.asset_combo.clear()
-            self.asset_combo.addItem(
-                t("gui_use_archive", "Use archive (recommended)"),
-                None,  # None means use archive URL
-            )
-            for asset in zip_assets:
-                asset_name = asset.get("name", "unknown")
-                asset_size = asset.get("size", 0)
-                # Format size
-                if asset_size > 1024 * 1024:
-                    size_str = f"{asset_size / (1024 * 1024):.1f} MB"
-                elif asset_size > 1024:
-                    size_str = f"{asset_size / 1024:.1f} KB"
-                else:
-                    size_str = f"{asset_size} B"
-
-                display_text = f"{asset_name} ({size_str})"
+        # Build the asset list once; later toggles just show it again
+        if self._zip_asset_items is None:
+            assets = self.version_checker.get_release_assets(self.github_version)
+            self._zip_asset_items = [
+                (
+                    f"{asset.get('name', 'unknown')} "
+                    f"({_format_size(asset.get('size', 0))})",
+                    asset.get("browser_download_url"),
+                )
+                for asset in assets
+                if asset.get("name", "").endswith(".zip")
+            ]
+            if self._zip_asset_items:
                 self.asset_combo.addItem(
-                    display_text, asset.get("browser_download_url")
+                    t("gui_use_archive", "Use archive (recommended)"),
+                    None,  # None means use archive URL
                 )
+                for display_text, url in self._zip_asset_items:
+                    self.asset_combo.addItem(display_text, url)
 
-            self.asset_combo.setVisible(True)
-        else:
-            # No assets or single asset - hide combo box
-            self.asset_combo.setVisible(False)
+        # Show the combo box only if there are ZIP assets to choose from
+        self.asset_combo.setVisible(bool(self._zip_asset_items))
 
     def start_update(self):
         """Start the update process"""
@@ -246,12 +743,22 @@ class UpdateDialog(QDialog):
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setValue(0)
 
-        # Create temp directory
-        temp_dir = Path(tempfile.mkdtemp(prefix="cachyos-updater-"))
+        # Release assets can be verified against a published checksums file
+        checksums_url = None
+        if selected_asset_url:
+            for asset in self.version_checker.get_release_assets(self.github_version):
+                if asset.get("name") in _CHECKSUM_ASSET_NAMES:
+                    checksums_url = asset.get("browser_download_url")
+                    break
+
+        # Create temp directory (for extraction; the ZIP goes to the cache)
+        temp_dir = self._make_temp_dir()
 
         try:
             # Download ZIP
-            download_thread = UpdateDownloadThread(str(zip_url), temp_dir)
+            download_thread = UpdateDownloadThread(
+                str(zip_url), _DOWNLOAD_CACHE_DIR, temp_dir, checksums_url
+            )
 
             def update_progress(value):
                 progress.setValue(value)
@@ -270,11 +777,17 @@ class UpdateDialog(QDialog):
                     shutil.rmtree(temp_dir, ignore_errors=True)
                     return
 
-                # Extract and install
-                self.install_from_zip(Path(zip_path), temp_dir)
+                # Extract and install; keep the download if that fails
+                if self.install_from_zip(Path(zip_path), temp_dir):
+                    download_thread.clear_cache()
 
-            download_thread.progress.connect(update_progress)
-            download_thread.finished.connect(download_finished)
+            # Queued: the thread never waits for the GUI to handle a signal
+            download_thread.progress.connect(
+                update_progress, Qt.ConnectionType.QueuedConnection
+            )
+            download_thread.finished.connect(
+                download_finished, Qt.ConnectionType.QueuedConnection
+            )
             download_thread.start()
 
             # Show progress dialog
@@ -315,15 +828,11 @@ class UpdateDialog(QDialog):
             return
 
         # Create temp directory for extraction
-        temp_dir = Path(tempfile.mkdtemp(prefix="cachyos-updater-"))
+        temp_dir = self._make_temp_dir()
 
         try:
-            # Copy ZIP to temp directory
-            temp_zip = temp_dir / "update.zip"
-            shutil.copy2(zip_path, temp_zip)
-
-            # Install from ZIP
-            self.install_from_zip(temp_zip, temp_dir)
+            # Install from ZIP (it is only read, so no copy is needed)
+            self.install_from_zip(zip_path, temp_dir)
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -372,36 +881,20 @@ class UpdateDialog(QDialog):
         )
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setValue(0)
-        progress.show()
 
-        try:
-            # Change to root directory
-            import os
+        # git runs in a thread (in root_dir), so the dialog stays responsive
+        git_thread = GitPullThread(self.root_dir)
+        label = progress.labelText()
 
-            old_cwd = os.getcwd()
-            os.chdir(self.root_dir)
-
-            try:
-                # Fetch and reset
-                subprocess.run(
-                    ["git", "fetch", "origin", "main"],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-
-                subprocess.run(
-                    ["git", "reset", "--hard", "origin/main"],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
+        def show_git_progress(line):
+            progress.setLabelText(f"{label}\n{line}")
 
+        def git_pull_finished(success, error):
+            progress.close()
+            if success:
                 # Update VERSION file
                 self._update_version_file()
 
-                progress.close()
-
                 QMessageBox.information(
                     self,
                     t("gui_update_success", "Update Successful"),
@@ -412,31 +905,46 @@ class UpdateDialog(QDialog):
                 )
 
                 self.accept()
+            elif error:
+                QMessageBox.critical(
+                    self,
+                    t("gui_update_failed", "Update Failed"),
+                    t("gui_git_pull_failed", "Git Pull failed:\n\n{error}").format(
+                        error=error
+                    ),
+                )
 
-            finally:
-                os.chdir(old_cwd)
+        git_thread.progress.connect(
+            show_git_progress, Qt.ConnectionType.QueuedConnection
+        )
+        git_thread.finished.connect(
+            git_pull_finished, Qt.ConnectionType.QueuedConnection
+        )
+        progress.canceled.connect(git_thread.cancel)
+        # Keep a reference: the thread may outlive this call if cancelled
+        self.git_thread = git_thread
+        git_thread.start()
 
-        except subprocess.CalledProcessError as e:
-            progress.close()
-            QMessageBox.critical(
-                self,
-                t("gui_update_failed", "Update Failed"),
-                t("gui_git_pull_failed", "Git Pull failed:\n\n{error}").format(
-                    error=e.stderr or str(e)
-                ),
-            )
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
-                self,
-                t("gui_update_failed", "Update Failed"),
-                t("gui_update_error", "Error during update:\n\n{error}").format(
-                    error=str(e)
-                ),
-            )
+        progress.exec()
+
+    def _make_temp_dir(self) -> Path:
+        """Create an extraction directory in root_dir
+
+        Directories left behind by an update that crashed are removed first.
+        """
+        for stale in self.root_dir.glob(f"{_TEMP_DIR_PREFIX}*"):
+            shutil.rmtree(stale, ignore_errors=True)
+        return Path(tempfile.mkdtemp(prefix=_TEMP_DIR_PREFIX, dir=self.root_dir))
+
+    def install_from_zip(self, zip_path: Path, temp_dir: Path) -> bool:
+        """Install update from ZIP file
+
+        zip_path may also be temp_dir itself, if the download thread has
+        already extracted the update files there.
 
-    def install_from_zip(self, zip_path: Path, temp_dir: Path):
-        """Install update from ZIP file"""
+        Returns:
+            True if the update was installed
+        """
         progress = QProgressDialog(
             t("gui_installing_update", "Installing update..."),
             t("gui_cancel", "Cancel"),
@@ -449,49 +957,57 @@ class UpdateDialog(QDialog):
         progress.show()
 
         target_dir = self.root_dir / "cachyos-multi-updater"
+        staging_dir = self.root_dir / "cachyos-multi-updater.new"
         backup_dir = None
 
         try:
-            # Create backup
-            if target_dir.exists():
-                backup_dir = (
-                    self.root_dir
-                    / f"cachyos-multi-updater.backup-{int(__import__('time').time())}"
-                )
-                shutil.copytree(target_dir, backup_dir)
-
-            # Extract ZIP
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(temp_dir)
+            # Extract ZIP (only the cachyos-multi-updater directory)
+            if zip_path.is_file():
+                with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                    members = _update_members(zip_ref.namelist())
+                _extract_parallel(zip_path, members, temp_dir)
 
             # Find cachyos-multi-updater directory in extracted files
+            # (scandir's entry types avoid a stat() per top-level entry)
+            with os.scandir(temp_dir) as entries:
+                candidates = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.startswith("sc-cachyos-multi-updater")
+                    and entry.is_dir()
+                ]
             extracted_dir = None
-            for item in temp_dir.iterdir():
-                if item.is_dir() and item.name.startswith("sc-cachyos-multi-updater"):
-                    # Check if it contains update-all.sh
-                    if (item / "cachyos-multi-updater" / "update-all.sh").exists():
-                        extracted_dir = item / "cachyos-multi-updater"
-                        break
-                    elif (item / "update-all.sh").exists():
-                        extracted_dir = item
-                        break
+            for item in candidates:
+                # Check if it contains update-all.sh
+                if (item / "cachyos-multi-updater" / "update-all.sh").exists():
+                    extracted_dir = item / "cachyos-multi-updater"
+                    break
+                elif (item / "update-all.sh").exists():
+                    extracted_dir = item
+                    break
 
             if not extracted_dir:
                 raise Exception("cachyos-multi-updater directory not found in ZIP")
 
-            # Remove old directory
+            # Stage the new directory next to the old one (temp_dir is in
+            # root_dir, so this is a rename), then swap them with two renames;
+            # the old directory is kept as backup until the update succeeded
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            shutil.move(str(extracted_dir), str(staging_dir))
             if target_dir.exists():
-                shutil.rmtree(target_dir)
-
-            # Copy new directory
-            shutil.copytree(extracted_dir, target_dir)
+                old_dir = (
+                    self.root_dir / f"cachyos-multi-updater.backup-{int(time.time())}"
+                )
+                os.replace(target_dir, old_dir)
+                backup_dir = old_dir
+            os.replace(staging_dir, target_dir)
 
             # Update VERSION file
             self._update_version_file()
 
             # Cleanup backup
-            if backup_dir and backup_dir.exists():
-                shutil.rmtree(backup_dir)
+            if backup_dir:
+                shutil.rmtree(backup_dir, ignore_errors=True)
 
             progress.close()
 
@@ -505,16 +1021,17 @@ class UpdateDialog(QDialog):
             )
 
             self.accept()
+            return True
 
         except Exception as e:
             progress.close()
 
-            # Rollback: restore backup
+            # Rollback: move the old directory back
             if backup_dir and backup_dir.exists():
                 try:
                     if target_dir.exists():
                         shutil.rmtree(target_dir)
-                    shutil.copytree(backup_dir, target_dir)
+                    os.replace(backup_dir, target_dir)
                 except Exception:
                     pass
 
@@ -525,9 +1042,11 @@ class UpdateDialog(QDialog):
                     error=str(e)
                 ),
             )
+            return False
         finally:
-            # Cleanup temp directory
+            # Cleanup temp and staging directories
             shutil.rmtree(temp_dir, ignore_errors=True)
+            shutil.rmtree(staging_dir, ignore_errors=True)
 
     def _update_version_file(self):
         """Update VERSION file with GitHub version"""
@@ -9,23 +9,29 @@ import sys
 import os
 from pathlib import Path
 
-# Suppress Qt QDBus warnings (harmless but annoying)
-os.environ.setdefault("QT_LOGGING_RULES", "qt.qpa.services.debug=false")
 
-# Get the project root directory (parent of gui/)
-project_root = Path(__file__).parent.parent.absolute()
+def __getattr__(name):
+    """Resolve main lazily, so importing this module does not load Qt"""
+    if name == "main":
+        from .core.main import main
 
-# Change to project root so imports work correctly
-os.chdir(project_root)
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Add project root to Python path
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
 
 # Execute core/main.py as a module
 if __name__ == "__main__":
+    # Suppress Qt QDBus warnings (harmless but annoying)
+    os.environ.setdefault("QT_LOGGING_RULES", "qt.qpa.services.debug=false")
+
+    # Add project root (parent of gui/) to Python path so the gui package imports;
+    # the script directory is resolved from __file__, so no chdir is needed
+    project_root = str(Path(__file__).resolve().parent.parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
     # Import and run main from core/main.py
     # We need to import it as a module from the gui package
     from gui.core.main import main
-    main()
 
+    main()
@@ -4,24 +4,13 @@ Pytest configuration and fixtures for GUI tests
 """
 
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
-from typing import Generator
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for tests"""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
-
-
-@pytest.fixture
-def script_dir(temp_dir: Path) -> Path:
+def script_dir(tmp_path: Path) -> Path:
     """Create a script directory structure for tests"""
-    script_path = temp_dir / "cachyos-multi-updater"
+    script_path = tmp_path / "cachyos-multi-updater"
     script_path.mkdir()
 
     # Create lang directory
@@ -29,12 +18,12 @@ def script_dir(temp_dir: Path) -> Path:
     lang_dir.mkdir()
 
     # Create minimal lang files
-    (lang_dir / "en.sh").write_text('TRANSLATIONS_EN["test_key"]="Test Value"\n')
-    (lang_dir / "de.sh").write_text('TRANSLATIONS_DE["test_key"]="Test Wert"\n')
+    (lang_dir / "en.sh").write_bytes(b'TRANSLATIONS_EN["test_key"]="Test Value"\n')
+    (lang_dir / "de.sh").write_bytes(b'TRANSLATIONS_DE["test_key"]="Test Wert"\n')
 
     # Create config.conf.example
-    (script_path / "config.conf.example").write_text(
-        "# Example config\nENABLE_SYSTEM_UPDATE=true\n"
+    (script_path / "config.conf.example").write_bytes(
+        b"# Example config\nENABLE_SYSTEM_UPDATE=true\n"
     )
 
     return script_path
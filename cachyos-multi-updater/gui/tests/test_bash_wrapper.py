@@ -49,6 +49,12 @@ def test_run_bash_function_invalid_name(script_dir: Path, update_script: Path):
     assert returncode == 1
     assert stdout == ""
 
+    # Trailing newline must not slip through the name check
+    stdout, returncode = wrapper._run_bash_function("check_update\n")
+
+    assert returncode == 1
+    assert stdout == ""
+
 
 def test_run_bash_function_with_args(script_dir: Path, update_script: Path):
     """Test running a bash function with arguments"""
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for ConfigDialog
+"""
+
+from pathlib import Path
+
+import pytest
+from gui.core import i18n
+from gui.core.config_manager import ConfigManager
+from gui.dialogs.config_dialog import ConfigDialog
+from gui.utils.password_manager import PasswordManager
+
+pytestmark = pytest.mark.usefixtures("qapp")
+
+_STORED_PASSWORD_CONFIG = (
+    "SUDO_PASSWORD_STORED=true\n"
+    "SUDO_PASSWORD_METHOD=encrypted\n"
+    "SUDO_PASSWORD_ENCRYPTED=gAAAAAold\n"
+)
+
+
+def test_save_keeps_password_token(script_dir: Path):
+    """Test that saving doesn't overwrite a password token stored meanwhile"""
+    config_path = script_dir / "config.conf"
+    config_path.write_text(_STORED_PASSWORD_CONFIG)
+    dialog = ConfigDialog(str(script_dir))
+
+    # Written by PasswordManager while the dialog is open
+    ConfigManager(str(script_dir)).set("SUDO_PASSWORD_ENCRYPTED", "gAAAAAnew")
+    dialog.max_log_files.setValue(dialog.max_log_files.value() + 1)
+
+    assert dialog.save_config()
+    assert "SUDO_PASSWORD_ENCRYPTED=gAAAAAnew\n" in config_path.read_text()
+
+
+def test_strings_follow_language_change(script_dir: Path, monkeypatch):
+    """Test the shared dialog strings are rebuilt after a language change"""
+    lang_dir = script_dir / "lang"
+    (lang_dir / "en.sh").write_text('TRANSLATIONS_EN["gui_error"]="Error"\n')
+    (lang_dir / "de.sh").write_text('TRANSLATIONS_DE["gui_error"]="Fehler"\n')
+    (script_dir / "config.conf").write_text("GUI_LANGUAGE=en\n")
+    monkeypatch.setattr(i18n, "_i18n_instance", None)
+    i18n.init_i18n(str(script_dir))
+
+    assert ConfigDialog._strings()["error"] == "Error"
+    i18n._i18n_instance.set_language("de")
+    assert ConfigDialog._strings()["error"] == "Fehler"
+
+
+def test_save_after_delete_password(script_dir: Path):
+    """Test that saving the dialog doesn't restore a deleted password token"""
+    config_path = script_dir / "config.conf"
+    config_path.write_text(_STORED_PASSWORD_CONFIG)
+    dialog = ConfigDialog(str(script_dir))
+
+    PasswordManager(str(script_dir)).delete_password()
+    dialog.max_log_files.setValue(dialog.max_log_files.value() + 1)
+
+    assert dialog.save_config()
+    assert "SUDO_PASSWORD_ENCRYPTED" not in config_path.read_text()
+
+
+def test_save_unchecked_password_removes_token(script_dir: Path):
+    """Test that unchecking "save password" removes the token from the file"""
+    config_path = script_dir / "config.conf"
+    config_path.write_text(_STORED_PASSWORD_CONFIG)
+    dialog = ConfigDialog(str(script_dir))
+
+    dialog.save_sudo_password.setChecked(False)
+    dialog.sudo_password.clear()
+
+    assert dialog.save_config()
+    content = config_path.read_text()
+    assert "SUDO_PASSWORD_ENCRYPTED" not in content
+    assert "SUDO_PASSWORD_STORED" not in content
@@ -150,3 +150,23 @@ def test_config_preserves_comments(script_dir: Path):
     content = config_file.read_text()
     assert "# This is a comment" in content
     assert "# Another comment" in content
+
+
+def test_update_method(config_file: Path, script_dir: Path):
+    """Test update rewrites only the given keys in one write"""
+    config_file.write_text("# Comment\nENABLE_SYSTEM_UPDATE=true\nOLD_KEY=old\n")
+
+    manager = ConfigManager(str(script_dir))
+    manager.load_config()
+
+    result = manager.update(
+        {"ENABLE_SYSTEM_UPDATE": "false", "NEW_KEY": "new", "OLD_KEY": None}
+    )
+    assert result is True
+
+    assert config_file.read_text() == (
+        "# Comment\nENABLE_SYSTEM_UPDATE=false\nNEW_KEY=new\n"
+    )
+    # Cache was invalidated
+    assert manager.get("ENABLE_SYSTEM_UPDATE") == "false"
+    assert manager.get("OLD_KEY") is None
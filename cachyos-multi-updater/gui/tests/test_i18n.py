@@ -113,3 +113,15 @@ def test_translation_unescaping(script_dir: Path):
         # Translation not loaded - this is acceptable for this test
         # The important thing is that the function doesn't crash
         assert value == "default"
+
+
+def test_t_many(script_dir: Path):
+    """Test translating several keys at once"""
+    i18n = GUIi18n(str(script_dir))
+    i18n.load_translations()
+
+    values = i18n.t_many((("test_key", None), ("non_existing_key", "default")))
+
+    assert values[0] in ("Test Value", "Test Wert")
+    assert values[1] == "default"
+    assert values == (i18n.t("test_key"), i18n.t("non_existing_key", "default"))
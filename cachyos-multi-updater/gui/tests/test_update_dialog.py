@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Tests for the update download helpers
+"""
+
+import hashlib
+import io
+import random
+import zipfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import requests
+from gui.dialogs.update_dialog import (
+    UpdateDialog,
+    UpdateDownloadThread,
+    _MIN_SEGMENT_SIZE,
+    _extract_parallel,
+    _update_members,
+)
+
+_URL = "https://example.com/releases/download/v1.0.0/update.zip"
+_CHECKSUMS_URL = "https://example.com/releases/download/v1.0.0/checksums.txt"
+_TOP = "sc-cachyos-multi-updater-1.0.0"
+
+
+class _Response:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, url, status_code, headers, content=b"", broken=False):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.broken = broken
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        # A broken response stops halfway, like a dropped connection
+        end = len(self.content) // 2 if self.broken else len(self.content)
+        for offset in range(0, end, chunk_size):
+            yield self.content[offset : min(offset + chunk_size, end)]
+        if self.broken:
+            raise requests.ConnectionError("Connection reset by peer")
+
+
+class _RangeServer:
+    """Fake server for data that supports byte ranges like GitHub's CDN
+
+    It stands in for the requests.Session of the download thread. The
+    Range and If-Range headers of every GET request are recorded in
+    requests. Other URLs can be served from files.
+    """
+
+    def __init__(self, data: bytes, accept_ranges: bool = True):
+        self.data = data
+        self.accept_ranges = accept_ranges
+        self.etag = '"abc"'
+        self.fail_at = set()  # Range starts whose next request breaks off
+        self.requests = []
+        self.files = {}
+        self.headers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def head(self, url, **kwargs):
+        headers = {"Content-Length": str(len(self.data)), "ETag": self.etag}
+        if self.accept_ranges:
+            headers["Accept-Ranges"] = "bytes"
+        return _Response(url, 200, headers)
+
+    def get(self, url, headers=None, **kwargs):
+        if url in self.files:
+            return _Response(url, 200, {}, self.files[url])
+        headers = headers or {}
+        byte_range = headers.get("Range")
+        if_range = headers.get("If-Range")
+        self.requests.append((byte_range, if_range))
+        if not (byte_range and self.accept_ranges and if_range in (None, self.etag)):
+            return _Response(url, 200, {}, self.data)
+        start, end = (int(n) for n in byte_range[len("bytes=") :].split("-"))
+        broken = start in self.fail_at
+        self.fail_at.discard(start)
+        return _Response(url, 206, {}, self.data[start : end + 1], broken)
+
+
+def _serve(monkeypatch, server: _RangeServer):
+    """Send the requests of the download thread to server"""
+    monkeypatch.setattr(requests, "Session", lambda: server)
+
+
+def _make_thread(tmp_path: Path, checksums_url=None) -> UpdateDownloadThread:
+    """Create a download thread for _URL with its cache in tmp_path"""
+    thread = UpdateDownloadThread(
+        _URL, tmp_path / "cache", tmp_path / "extract", checksums_url
+    )
+    thread.zip_path.parent.mkdir(parents=True, exist_ok=True)
+    return thread
+
+
+def _make_archive(files: dict) -> bytes:
+    """Create a release archive with the given {name: content} files"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_ref:
+        for name, content in files.items():
+            zip_ref.writestr(f"{_TOP}/{name}", content)
+    return buffer.getvalue()
+
+
+def _collect_results(thread: UpdateDownloadThread) -> list:
+    """Return a list that collects the (path, error) of every finished signal"""
+    results = []
+    thread.finished.connect(lambda path, error: results.append((path, error)))
+    return results
+
+
+def test_segmented_download(tmp_path: Path, monkeypatch):
+    """Test a large file is assembled from parallel Range requests"""
+    data = random.Random(0).randbytes(4 * _MIN_SEGMENT_SIZE + 123)
+    server = _RangeServer(data)
+    _serve(monkeypatch, server)
+    thread = _make_thread(tmp_path)
+    results = _collect_results(thread)
+
+    thread.run()
+
+    assert results == [(str(thread.zip_path), "")]
+    assert thread.zip_path.read_bytes() == data
+    assert all(byte_range for byte_range, _ in server.requests)
+
+
+def test_resume_after_failed_segment(tmp_path: Path, monkeypatch):
+    """Test a failed download resumes where its segments stopped"""
+    data = random.Random(0).randbytes(4 * _MIN_SEGMENT_SIZE)
+    server = _RangeServer(data)
+    server.fail_at.add(2 * _MIN_SEGMENT_SIZE)
+    _serve(monkeypatch, server)
+    thread = _make_thread(tmp_path)
+    results = _collect_results(thread)
+
+    thread.run()
+    server.requests.clear()
+    thread.run()
+
+    assert results[0] == ("", "Connection reset by peer")
+    assert results[1] == (str(thread.zip_path), "")
+    assert thread.zip_path.read_bytes() == data
+    # Only resumed if the file is unchanged, from where the segment broke off
+    assert all(if_range == server.etag for _, if_range in server.requests)
+    resumed = f"bytes={5 * _MIN_SEGMENT_SIZE // 2}-{3 * _MIN_SEGMENT_SIZE - 1}"
+    assert (resumed, server.etag) in server.requests
+
+
+def test_resume_changed_file(tmp_path: Path, monkeypatch):
+    """Test a failed download starts over if the file changed on the server"""
+    data = random.Random(0).randbytes(4 * _MIN_SEGMENT_SIZE)
+    server = _RangeServer(data)
+    server.fail_at.add(2 * _MIN_SEGMENT_SIZE)
+    _serve(monkeypatch, server)
+    thread = _make_thread(tmp_path)
+    results = _collect_results(thread)
+
+    thread.run()
+    server.data = data = random.Random(1).randbytes(len(data))
+    server.etag = '"def"'
+    thread.run()
+
+    assert results[1] == (str(thread.zip_path), "")
+    assert thread.zip_path.read_bytes() == data
+
+
+def test_segments_round_trip(tmp_path: Path):
+    """Test saved segments are loaded back for the same file"""
+    thread = _make_thread(tmp_path)
+    thread.zip_path.write_bytes(b"partial")
+    validators = {"ETag": '"abc"'}
+    segments = [[0, 99], [150, 199]]
+
+    thread._save_segments(200, validators, segments)
+
+    assert thread._load_segments(200, validators) == segments
+
+
+def test_segments_rejected_on_mismatch(tmp_path: Path):
+    """Test saved segments are ignored if the file on the server changed"""
+    thread = _make_thread(tmp_path)
+    thread.zip_path.write_bytes(b"partial")
+    thread._save_segments(200, {"ETag": '"abc"'}, [[0, 199]])
+
+    assert thread._load_segments(200, {"ETag": '"def"'}) is None
+    assert thread._load_segments(300, {"ETag": '"abc"'}) is None
+    assert thread._load_segments(200, {}) is None
+
+
+def test_segments_rejected_without_zip(tmp_path: Path):
+    """Test saved segments are ignored once the partial file is gone"""
+    thread = _make_thread(tmp_path)
+    thread._save_segments(200, {"ETag": '"abc"'}, [[0, 199]])
+
+    assert thread._load_segments(200, {"ETag": '"abc"'}) is None
+
+
+def test_extract_remote(tmp_path: Path, monkeypatch):
+    """Test a small share of update files is extracted from the server directly"""
+    archive = _make_archive(
+        {
+            "cachyos-multi-updater/update-all.sh": "#!/bin/bash\n",
+            "cachyos-multi-updater/gui/main.py": "print()\n",
+            "screenshots/main.png": random.Random(0).randbytes(3 * _MIN_SEGMENT_SIZE),
+        }
+    )
+    server = _RangeServer(archive)
+    _serve(monkeypatch, server)
+    thread = _make_thread(tmp_path)
+    results = _collect_results(thread)
+
+    thread.run()
+
+    assert results == [(str(thread.extract_dir), "")]
+    update_dir = thread.extract_dir / _TOP / "cachyos-multi-updater"
+    assert (update_dir / "update-all.sh").read_text() == "#!/bin/bash\n"
+    assert (update_dir / "gui" / "main.py").read_text() == "print()\n"
+    assert not (thread.extract_dir / _TOP / "screenshots").exists()
+    assert not thread.zip_path.exists()
+    # The archive is read with a few buffered Range requests
+    assert all(byte_range for byte_range, _ in server.requests)
+    assert len(server.requests) < 10
+
+
+def test_extract_remote_large_share(tmp_path: Path, monkeypatch):
+    """Test the whole archive is downloaded if it is mostly update files"""
+    archive = _make_archive(
+        {
+            "cachyos-multi-updater/update-all.sh": "#!/bin/bash\n",
+            "cachyos-multi-updater/gui/icon.png": random.Random(0).randbytes(
+                3 * _MIN_SEGMENT_SIZE
+            ),
+        }
+    )
+    _serve(monkeypatch, _RangeServer(archive))
+    thread = _make_thread(tmp_path)
+    results = _collect_results(thread)
+
+    thread.run()
+
+    assert results == [(str(thread.zip_path), "")]
+    assert thread.zip_path.read_bytes() == archive
+    assert not thread.extract_dir.exists()
+
+
+def _checksums(data: bytes) -> bytes:
+    """Create a checksums asset listing data as update.zip"""
+    return f"{hashlib.sha256(data).hexdigest()}  update.zip\n".encode("utf-8")
+
+
+def test_checksum_mismatch_redownloads(tmp_path: Path, monkeypatch):
+    """Test a corrupt file in the cache is discarded and downloaded again"""
+    data = random.Random(0).randbytes(4 * _MIN_SEGMENT_SIZE)
+    server = _RangeServer(data)
+    server.files[_CHECKSUMS_URL] = _checksums(data)
+    _serve(monkeypatch, server)
+    thread = _make_thread(tmp_path, _CHECKSUMS_URL)
+    results = _collect_results(thread)
+    # A finished download in the cache, but with the wrong content
+    thread.zip_path.write_bytes(bytes(len(data)))
+    thread._save_segments(len(data), {"ETag": server.etag}, [[len(data), -1]])
+
+    thread.run()
+
+    assert results == [(str(thread.zip_path), "")]
+    assert thread.zip_path.read_bytes() == data
+
+
+def test_checksum_mismatch_reported(tmp_path: Path, monkeypatch):
+    """Test a download that stays corrupt is reported as an error"""
+    data = random.Random(0).randbytes(4 * _MIN_SEGMENT_SIZE)
+    server = _RangeServer(data)
+    server.files[_CHECKSUMS_URL] = _checksums(b"other")
+    _serve(monkeypatch, server)
+    thread = _make_thread(tmp_path, _CHECKSUMS_URL)
+    results = _collect_results(thread)
+
+    thread.run()
+
+    assert results == [("", "Checksum mismatch for update.zip")]
+    assert len(server.requests) == 8  # Downloaded twice, in 4 segments each
+
+
+def test_checksum_skips_remote_extraction(tmp_path: Path, monkeypatch):
+    """Test an archive with checksums is downloaded whole to be verified"""
+    archive = _make_archive(
+        {
+            "cachyos-multi-updater/update-all.sh": "#!/bin/bash\n",
+            "screenshots/main.png": random.Random(0).randbytes(3 * _MIN_SEGMENT_SIZE),
+        }
+    )
+    server = _RangeServer(archive)
+    server.files[_CHECKSUMS_URL] = _checksums(archive)
+    _serve(monkeypatch, server)
+    thread = _make_thread(tmp_path, _CHECKSUMS_URL)
+    results = _collect_results(thread)
+
+    thread.run()
+
+    assert results == [(str(thread.zip_path), "")]
+    assert thread.zip_path.read_bytes() == archive
+    assert not thread.extract_dir.exists()
+
+
+def _probe(tmp_path: Path, server: _RangeServer):
+    """Run the HEAD probe of a download thread against server"""
+    thread = _make_thread(tmp_path)
+    thread._session = server
+    return thread._probe_ranges()
+
+
+def test_probe_ranges(tmp_path: Path):
+    """Test a large file on a server with byte ranges is downloaded in segments"""
+    size = 4 * _MIN_SEGMENT_SIZE
+    server = _RangeServer(bytes(size))
+
+    assert _probe(tmp_path, server) == (_URL, size, {"ETag": '"abc"'})
+
+
+def test_probe_ranges_without_accept_ranges(tmp_path: Path):
+    """Test the probe falls back if the server does not advertise byte ranges"""
+    server = _RangeServer(bytes(4 * _MIN_SEGMENT_SIZE), accept_ranges=False)
+
+    assert _probe(tmp_path, server) == (_URL, 0, {})
+
+
+def test_probe_ranges_small_file(tmp_path: Path):
+    """Test the probe falls back for files too small to split"""
+    server = _RangeServer(bytes(1000))
+
+    assert _probe(tmp_path, server) == (_URL, 0, {})
+
+
+def test_probe_ranges_request_error(tmp_path: Path):
+    """Test the probe falls back if the HEAD request fails"""
+    server = _RangeServer(bytes(4 * _MIN_SEGMENT_SIZE))
+
+    def head(url, **kwargs):
+        raise requests.ConnectionError()
+
+    server.head = head
+
+    assert _probe(tmp_path, server) == (_URL, 0, {})
+
+def test_make_temp_dir_removes_stale(tmp_path: Path, qapp):
+    """Test extraction directories left behind by a crashed update are removed"""
+    stale = tmp_path / ".cachyos-updater-old"
+    (stale / _TOP).mkdir(parents=True)
+    version_checker = MagicMock()
+    version_checker.get_release_assets.return_value = []
+    dialog = UpdateDialog(
+        str(tmp_path / "cachyos-multi-updater"), "1.0.0", "1.0.1", version_checker
+    )
+
+    temp_dir = dialog._make_temp_dir()
+
+    assert temp_dir.parent == tmp_path
+    assert temp_dir.name.startswith(".cachyos-updater-")
+    assert not stale.exists()
+
+
+def test_update_members_nested_layout():
+    """Test only the cachyos-multi-updater directory of the repo is selected"""
+    names = [
+        "sc-cachyos-multi-updater-1.0.0/",
+        "sc-cachyos-multi-updater-1.0.0/README.md",
+        "sc-cachyos-multi-updater-1.0.0/cachyos-multi-updater/",
+        "sc-cachyos-multi-updater-1.0.0/cachyos-multi-updater/update-all.sh",
+        "sc-cachyos-multi-updater-1.0.0/cachyos-multi-updater/gui/main.py",
+    ]
+
+    assert _update_members(names) == names[2:]
+
+
+def test_update_members_flat_layout():
+    """Test an archive with update-all.sh at the top level is used as a whole"""
+    names = [
+        "sc-cachyos-multi-updater-1.0.0/",
+        "sc-cachyos-multi-updater-1.0.0/update-all.sh",
+        "sc-cachyos-multi-updater-1.0.0/gui/main.py",
+    ]
+
+    assert _update_members(names) == names
+
+
+def test_update_members_unexpected_layout():
+    """Test all members are returned if the layout is not recognized"""
+    names = ["other/", "other/file.txt"]
+
+    assert _update_members(names) == names
+
+
+def test_extract_parallel(tmp_path: Path):
+    """Test extracting members of a real ZIP in several batches"""
+    zip_path = tmp_path / "update.zip"
+    files = {f"top/dir{i % 3}/file{i}.txt": f"content {i}" for i in range(100)}
+    with zipfile.ZipFile(zip_path, "w") as zip_ref:
+        zip_ref.writestr("top/skipped.txt", "not extracted")
+        for name, content in files.items():
+            zip_ref.writestr(name, content)
+    destination = tmp_path / "out"
+
+    _extract_parallel(zip_path, list(files), destination)
+
+    for name, content in files.items():
+        assert (destination / name).read_text() == content
+    assert not (destination / "top" / "skipped.txt").exists()
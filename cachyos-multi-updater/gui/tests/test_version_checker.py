@@ -134,3 +134,28 @@ def test_compare_versions_invalid(script_dir: Path):
     # Invalid version should return 0 (equal)
     result = checker.compare_versions("invalid", "1.0.0")
     assert result == 0
+
+
+def test_get_release_assets_revalidates_with_etag(script_dir: Path, tmp_path: Path):
+    """Test release assets are cached with their ETag and reused on 304"""
+    assets = [{"name": "update.zip", "size": 1}]
+    ok = MagicMock(status_code=200, headers={"ETag": '"abc"'})
+    ok.json.return_value = {"assets": assets}
+    not_modified = MagicMock(status_code=304, headers={})
+
+    with patch(
+        "gui.utils.version_checker._RELEASE_CACHE_FILE", tmp_path / "releases.json"
+    ):
+        checker = VersionChecker(str(script_dir))
+        with patch.object(checker._session, "get", return_value=ok) as mock_get:
+            assert checker.get_release_assets("1.0.1") == assets
+            # Same checker: served from memory
+            assert checker.get_release_assets("1.0.1") == assets
+        assert mock_get.call_count == 1
+
+        checker = VersionChecker(str(script_dir))
+        with patch.object(
+            checker._session, "get", return_value=not_modified
+        ) as mock_get:
+            assert checker.get_release_assets("1.0.1") == assets
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
@@ -4,22 +4,16 @@ Tests for custom widgets
 """
 
 import pytest
-from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
-from PyQt6.QtTest import QTest
 from gui.widgets.widgets import ClickableLabel, FlatButton
+from gui.widgets.fa_icons import create_fa_button
+from gui.widgets.fa_checkbox import FACheckBox
+from gui.ui.toast_notification import ToastNotification
 
+pytestmark = pytest.mark.usefixtures("qapp")
 
-@pytest.fixture(scope="session")
-def qapp():
-    """Create QApplication for tests"""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    return app
 
-
-def test_clickable_label_init(qapp):
+def test_clickable_label_init():
     """Test ClickableLabel initialization"""
     label = ClickableLabel("Test", None)
 
@@ -27,60 +21,126 @@ def test_clickable_label_init(qapp):
     assert label.cursor().shape() == Qt.CursorShape.PointingHandCursor
 
 
-def test_clickable_label_signal(qapp):
-    """Test ClickableLabel clicked signal"""
+@pytest.mark.parametrize(
+    "button, expected",
+    [(Qt.MouseButton.LeftButton, True), (Qt.MouseButton.RightButton, False)],
+)
+def test_clickable_label_click(qtbot, button, expected):
+    """Test ClickableLabel emits clicked for left clicks only"""
     label = ClickableLabel("Test", None)
+    qtbot.addWidget(label)
+    clicked = []
+    label.clicked.connect(lambda: clicked.append(True))
+
+    qtbot.mouseClick(label, button)
+
+    assert bool(clicked) is expected
+
+
+def test_flat_button_init():
+    """Test FlatButton initialization"""
+    button = FlatButton("Test", None)
+
+    assert button.text() == "Test"
+    assert button.isFlat() is True
+    assert button.cursor().shape() == Qt.CursorShape.PointingHandCursor
+
+
+@pytest.mark.parametrize(
+    "button, expected",
+    [(Qt.MouseButton.LeftButton, True), (Qt.MouseButton.RightButton, False)],
+)
+def test_flat_button_click(qtbot, button, expected):
+    """Test FlatButton emits clicked for left clicks only"""
+    flat_button = FlatButton("Test", None)
+    qtbot.addWidget(flat_button)
+    clicked = []
+    flat_button.clicked.connect(lambda: clicked.append(True))
+
+    qtbot.mouseClick(flat_button, button)
+
+    assert bool(clicked) is expected
+
+
+def test_create_fa_button(qtbot):
+    """Test create_fa_button connects slot and sets default"""
     clicked = False
 
     def on_clicked():
         nonlocal clicked
         clicked = True
 
-    label.clicked.connect(on_clicked)
+    button = create_fa_button("check", "OK", on_clicked, default=True)
+    qtbot.addWidget(button)
 
-    # Simulate mouse click
-    QTest.mouseClick(label, Qt.MouseButton.LeftButton)
+    assert "OK" in button.text()
+    assert button.isDefault() is True
+
+    qtbot.mouseClick(button, Qt.MouseButton.LeftButton)
 
     assert clicked is True
 
 
-def test_clickable_label_right_click_no_signal(qapp):
-    """Test that right click doesn't emit signal"""
-    label = ClickableLabel("Test", None)
-    clicked = False
+def test_create_fa_button_unknown_icon():
+    """Test create_fa_button keeps plain text for unknown icons"""
+    button = create_fa_button("does-not-exist", "Plain")
 
-    def on_clicked():
-        nonlocal clicked
-        clicked = True
+    assert button.text() == "Plain"
+    assert button.isDefault() is False
 
-    label.clicked.connect(on_clicked)
 
-    # Simulate right mouse click
-    QTest.mouseClick(label, Qt.MouseButton.RightButton)
+def test_fa_checkbox_click_signals(qtbot):
+    """Test FACheckBox click emits toggled then clicked with final state"""
+    checkbox = FACheckBox("Test")
+    qtbot.addWidget(checkbox)
+    events = []
 
-    assert clicked is False
+    checkbox.toggled.connect(lambda checked: events.append(("toggled", checked)))
+    checkbox.clicked.connect(lambda: events.append(("clicked", checkbox.isChecked())))
 
+    qtbot.mouseClick(checkbox, Qt.MouseButton.LeftButton)
 
-def test_flat_button_init(qapp):
-    """Test FlatButton initialization"""
-    button = FlatButton("Test", None)
+    assert events == [("toggled", True), ("clicked", True)]
 
-    assert button.text() == "Test"
-    assert button.isFlat() is True
-    assert button.cursor().shape() == Qt.CursorShape.PointingHandCursor
 
+def test_fa_checkbox_set_checked_emits_only_on_change():
+    """Test FACheckBox.setChecked emits toggled only when the state changes"""
+    checkbox = FACheckBox("Test")
+    toggled = []
+    checkbox.toggled.connect(toggled.append)
 
-def test_flat_button_click(qapp):
-    """Test FlatButton click"""
-    button = FlatButton("Test", None)
-    clicked = False
+    checkbox.setChecked(True)
+    checkbox.setChecked(True)
+    checkbox.setChecked(False)
 
-    def on_clicked():
-        nonlocal clicked
-        clicked = True
+    assert toggled == [True, False]
 
-    button.clicked.connect(on_clicked)
 
-    QTest.mouseClick(button, Qt.MouseButton.LeftButton)
+def test_clickable_toast_keeps_label_style(qtbot):
+    """Test a clickable toast uses a styled ClickableLabel and emits clicked"""
+    toast = ToastNotification("Update available", clickable=True)
+    qtbot.addWidget(toast)
+    clicks = []
+    toast.clicked.connect(lambda: clicks.append(True))
 
-    assert clicked is True
+    qtbot.mouseClick(toast.label, Qt.MouseButton.LeftButton)
+
+    assert isinstance(toast.label, ClickableLabel)
+    assert toast.label.objectName() == "toast_label"
+    assert clicks == [True]
+
+
+def test_toast_fallback_style(qapp, qtbot):
+    """Test toasts style themselves only without the application rule"""
+    qapp.setStyleSheet("")
+    toast = ToastNotification("No theme")
+    qtbot.addWidget(toast)
+    assert "#toast_label" in toast.label.styleSheet()
+
+    qapp.setStyleSheet("QLabel#toast_label { color: #ffffff; }")
+    try:
+        themed = ToastNotification("Themed")
+        qtbot.addWidget(themed)
+        assert themed.label.styleSheet() == ""
+    finally:
+        qapp.setStyleSheet("")
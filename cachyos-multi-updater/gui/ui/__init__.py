@@ -2,14 +2,18 @@
 UI helper classes for CachyOS Multi-Updater GUI
 """
 
-from .theme_manager import ThemeManager
-from .animations import (
-    AnimationHelper,
-    animate_button_hover,
-    animate_dialog_show,
-    animate_dialog_hide,
-)
-from .toast_notification import show_toast, ToastNotification
+import importlib
+
+# Exported name -> submodule; submodules are imported on first access
+_LAZY = {
+    "ThemeManager": ".theme_manager",
+    "AnimationHelper": ".animations",
+    "animate_button_hover": ".animations",
+    "animate_dialog_show": ".animations",
+    "animate_dialog_hide": ".animations",
+    "show_toast": ".toast_notification",
+    "ToastNotification": ".toast_notification",
+}
 
 __all__ = [
     "ThemeManager",
@@ -20,3 +24,13 @@ __all__ = [
     "show_toast",
     "ToastNotification",
 ]
+
+
+def __getattr__(name):
+    """Import exported names from their submodule on first access"""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
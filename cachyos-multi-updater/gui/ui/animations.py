@@ -11,7 +11,7 @@ from PyQt6.QtCore import (
     QParallelAnimationGroup,
     QSequentialAnimationGroup,
 )
-from PyQt6.QtWidgets import QWidget
+from PyQt6.QtWidgets import QGraphicsDropShadowEffect, QWidget
 from typing import Optional, Callable
 
 
@@ -94,16 +94,21 @@ class AnimationHelper:
 def animate_button_hover(
     widget: QWidget, hover: bool = True, duration: int = AnimationHelper.DURATION_FAST
 ):
-    """Animate button hover effect"""
-    if hover:
-        # Scale up slightly
-        # Note: Actual implementation would require custom widget with scale property
-        # For now, we'll use opacity and style changes
-        widget.setStyleSheet(widget.styleSheet() + " transform: scale(1.05);")
-    else:
-        widget.setStyleSheet(
-            widget.styleSheet().replace(" transform: scale(1.05);", "")
-        )
+    """Animate button hover effect
+
+    Attaches a drop shadow effect on first use and only toggles it afterwards,
+    so hovering never touches the stylesheet or repolishes the widget.
+    """
+    effect = getattr(widget, "_hover_fx", None)
+    if effect is None:
+        if not hover:
+            return
+        effect = QGraphicsDropShadowEffect(widget)
+        effect.setBlurRadius(12)
+        effect.setOffset(0, 2)
+        widget.setGraphicsEffect(effect)
+        widget._hover_fx = effect
+    effect.setEnabled(hover)
 
 
 def animate_dialog_show(
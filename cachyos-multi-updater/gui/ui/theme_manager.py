@@ -4,298 +4,126 @@ Theme Manager for CachyOS Multi-Updater GUI
 Handles dark/light mode themes with system detection
 """
 
+import functools
+import string
+from types import MappingProxyType
 from typing import Optional
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QPalette
 
-# Handle imports for both direct execution and module import
+# Handle imports for both direct execution and module import (resolved once)
 try:
-    from .debug_logger import get_logger
+    from ..utils.debug_logger import get_logger as _get_debug_logger
 except ImportError:
     try:
-        from debug_logger import get_logger
+        from debug_logger import get_logger as _get_debug_logger
     except ImportError:
+        _get_debug_logger = None
 
-        def get_logger():
-            class DummyLogger:
-                def debug(self, *args, **kwargs):
-                    pass
 
-                def info(self, *args, **kwargs):
-                    pass
+class _DummyLogger:
+    def debug(self, *args, **kwargs):
+        pass
 
-                def warning(self, *args, **kwargs):
-                    pass
+    def info(self, *args, **kwargs):
+        pass
 
-                def error(self, *args, **kwargs):
-                    pass
+    def warning(self, *args, **kwargs):
+        pass
 
-                def exception(self, *args, **kwargs):
-                    pass
+    def error(self, *args, **kwargs):
+        pass
 
-            return DummyLogger()
+    def exception(self, *args, **kwargs):
+        pass
 
 
-class ThemeManager:
-    """Manages application themes"""
+_logger = None
 
-    # Cache for system theme detection (performance optimization)
-    _system_theme_cache: Optional[str] = None
 
-    DARK_STYLESHEET = """
-        QMainWindow {
-            background-color: #2b2b2b;
-            color: #ffffff;
-        }
-        QWidget {
-            background-color: #2b2b2b;
-            color: #ffffff;
-        }
-        QGroupBox {
-            border: 1px solid #555555;
-            border-radius: 5px;
-            margin-top: 10px;
-            padding-top: 16px;
-            padding: 16px;
-            font-weight: bold;
-            background-color: #2b2b2b;
-            color: #ffffff;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 8px;
-            color: #ffffff;
-        }
-        QPushButton {
-            background-color: #3c3c3c;
-            border: 1px solid #555555;
-            border-radius: 4px;
-            padding: 4px 10px;
-            color: #ffffff;
-            font-size: 12px;
-        }
-        QPushButton:hover {
-            background-color: #4a4a4a;
-            border: 1px solid #666666;
-            /* Note: Qt stylesheets don't support transform: scale(), using border-width instead for visual feedback */
-            border-width: 2px;
-        }
-        QPushButton:pressed {
-            background-color: #2a2a2a;
-            border-width: 1px;
-        }
-        QPushButton:disabled {
-            background-color: #2b2b2b;
-            color: #666666;
-            border: 1px solid #3c3c3c;
-        }
-        QCheckBox {
-            color: #ffffff;
-        }
-        QRadioButton {
-            color: #ffffff;
-        }
-        QLabel#fa_checkbox_indicator {
-            border-color: #555555;
-        }
-        QLabel#fa_checkbox_text {
-            color: #ffffff;
-        }
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-        }
-        QCheckBox::indicator:unchecked {
-            background-color: #3c3c3c;
-            border: 1px solid #555555;
-            border-radius: 3px;
-        }
-        QCheckBox::indicator:checked {
-            background-color: #00D9FF;
-            border: 1px solid #00D9FF;
-            border-radius: 3px;
-        }
-        QTextEdit {
-            background-color: #1e1e1e;
-            border: 1px solid #555555;
-            border-radius: 4px;
-            color: #ffffff;
-        }
-        QProgressBar {
-            border: 1px solid #555555;
-            border-radius: 4px;
-            text-align: center;
-            background-color: #1e1e1e;
-            color: #ffffff;
-        }
-        QProgressBar::chunk {
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 #00D9FF,
-                stop:0.5 #00A8CC,
-                stop:1 #00D9FF);
-            border-radius: 3px;
-        }
-        QLabel {
-            color: #ffffff;
-        }
-        QLineEdit {
-            background-color: #1e1e1e;
-            border: 1px solid #555555;
-            border-radius: 4px;
-            padding: 8px 12px;
-            color: #ffffff;
-            min-height: 20px;
-        }
-        QLineEdit:focus {
-            border: 2px solid #00D9FF;
-            background-color: #2b2b2b;
-        }
-        QLineEdit::placeholder {
-            color: #71757a;
-        }
-        QComboBox {
-            background-color: #1e1e1e;
-            border: 1px solid #555555;
-            border-radius: 4px;
-            padding: 4px;
-            color: #ffffff;
-        }
-        QComboBox:hover {
-            border: 1px solid #666666;
-        }
-        QComboBox::drop-down {
-            border: none;
-        }
-        QComboBox QAbstractItemView {
-            background-color: #2b2b2b;
-            border: 1px solid #555555;
-            selection-background-color: #00D9FF;
-            color: #ffffff;
-        }
-        QSpinBox {
-            background-color: #1e1e1e;
-            border: 1px solid #555555;
-            border-radius: 4px;
-            padding: 8px 12px;
-            color: #ffffff;
-            min-height: 20px;
-        }
-        QSpinBox:focus {
-            border: 2px solid #00D9FF;
-            background-color: #2b2b2b;
-        }
-        QTabWidget::pane {
-            border: 1px solid #555555;
-            background-color: #2b2b2b;
-        }
-        QTabBar::tab {
-            background-color: #3c3c3c;
-            color: #ffffff;
-            border: 1px solid #555555;
-            padding: 8px 16px;
-            margin-right: 2px;
-        }
-        QTabBar::tab:selected {
-            background-color: #2b2b2b;
-            border-bottom: 3px solid #00D9FF;
-            font-weight: bold;
-        }
-        QTabBar::tab:hover {
-            background-color: #4a4a4a;
-            border-bottom: 2px solid #00D9FF;
-        }
-        QDialog {
-            background-color: #2b2b2b;
-            color: #ffffff;
-        }
-        QMessageBox {
-            background-color: #2b2b2b;
-            color: #ffffff;
-        }
-        QToolTip {
-            background-color: #2b2b2b;
-            color: #ffffff;
-            border: 1px solid #555555;
-            border-radius: 4px;
-            padding: 8px 12px;
-            font-size: 12px;
-        }
-    """
+def get_logger():
+    """Get the GUI debug logger (created on first use, then cached)"""
+    global _logger
+    if _logger is None:
+        _logger = _get_debug_logger() if _get_debug_logger else _DummyLogger()
+    return _logger
+
 
-    LIGHT_STYLESHEET = """
+# Shared stylesheet; the theme palettes fill in the colors
+_QSS_TEMPLATE = string.Template(
+    """
         QMainWindow {
-            background-color: #ffffff;
-            color: #000000;
+            background-color: $bg;
+            color: $fg;
         }
         QWidget {
-            background-color: #ffffff;
-            color: #000000;
+            background-color: $bg;
+            color: $fg;
         }
         QHeaderView::section {
-            background-color: #f0f0f0;
-            border: 1px solid #cccccc;
+            background-color: $button_bg;
+            border: 1px solid $border;
             padding: 4px;
             font-weight: bold;
         }
         QGroupBox {
-            border: 1px solid #cccccc;
+            border: 1px solid $border;
             border-radius: 5px;
             margin-top: 10px;
             padding-top: 16px;
             padding: 16px;
             font-weight: bold;
-            background-color: #ffffff;
-            color: #000000;
+            background-color: $bg;
+            color: $fg;
         }
         QGroupBox::title {
             subcontrol-origin: margin;
             left: 10px;
             padding: 0 8px;
-            color: #000000;
+            color: $fg;
         }
         QPushButton {
-            background-color: #f0f0f0;
-            border: 1px solid #cccccc;
+            background-color: $button_bg;
+            border: 1px solid $border;
             border-radius: 4px;
             padding: 4px 10px;
-            color: #000000;
+            color: $fg;
             font-size: 12px;
         }
         QPushButton:hover {
-            background-color: #e0e0e0;
-            border: 1px solid #999999;
+            background-color: $hover_bg;
+            border: 1px solid $muted;
             /* Note: Qt stylesheets don't support transform: scale(), using border-width instead for visual feedback */
             border-width: 2px;
         }
         QPushButton:pressed {
-            background-color: #d0d0d0;
+            background-color: $pressed_bg;
             border-width: 1px;
         }
         QPushButton:disabled {
-            background-color: #f5f5f5;
-            color: #999999;
-            border: 1px solid #e0e0e0;
+            background-color: $disabled_bg;
+            color: $muted;
+            border: 1px solid $disabled_border;
         }
         QCheckBox {
-            color: #000000;
+            color: $fg;
         }
         QRadioButton {
-            color: #000000;
+            color: $fg;
         }
         QLabel#fa_checkbox_indicator {
-            border-color: #cccccc;
+            border-color: $border;
         }
         QLabel#fa_checkbox_text {
-            color: #000000;
+            color: $fg;
         }
         QCheckBox::indicator {
             width: 18px;
             height: 18px;
         }
         QCheckBox::indicator:unchecked {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
+            background-color: $indicator_bg;
+            border: 1px solid $border;
             border-radius: 3px;
         }
         QCheckBox::indicator:checked {
@@ -304,17 +132,17 @@ class ThemeManager:
             border-radius: 3px;
         }
         QTextEdit {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
+            background-color: $input_bg;
+            border: 1px solid $border;
             border-radius: 4px;
-            color: #000000;
+            color: $fg;
         }
         QProgressBar {
-            border: 1px solid #cccccc;
+            border: 1px solid $border;
             border-radius: 4px;
             text-align: center;
-            background-color: #f0f0f0;
-            color: #000000;
+            background-color: $progress_bg;
+            color: $fg;
         }
         QProgressBar::chunk {
             background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
@@ -324,91 +152,161 @@ class ThemeManager:
             border-radius: 3px;
         }
         QLabel {
-            color: #000000;
+            color: $fg;
+        }
+        QLabel#toast_label {
+            background-color: rgba(43, 43, 43, 240);
+            color: #ffffff;
+            padding: 8px 12px;
+            border-radius: 6px;
+            border: 1px solid #555555;
         }
         QLineEdit {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
+            background-color: $input_bg;
+            border: 1px solid $border;
             border-radius: 4px;
             padding: 8px 12px;
-            color: #000000;
+            color: $fg;
             min-height: 20px;
         }
         QLineEdit:focus {
             border: 2px solid #00D9FF;
-            background-color: #fafafa;
+            background-color: $focus_bg;
         }
         QLineEdit::placeholder {
             color: #71757a;
         }
         QComboBox {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
+            background-color: $input_bg;
+            border: 1px solid $border;
             border-radius: 4px;
             padding: 4px;
-            color: #000000;
+            color: $fg;
         }
         QComboBox:hover {
-            border: 1px solid #999999;
+            border: 1px solid $muted;
         }
         QComboBox::drop-down {
             border: none;
         }
         QComboBox QAbstractItemView {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
+            background-color: $bg;
+            border: 1px solid $border;
             selection-background-color: #00D9FF;
-            color: #000000;
+            color: $fg;
         }
         QSpinBox {
-            background-color: #ffffff;
-            border: 1px solid #cccccc;
+            background-color: $input_bg;
+            border: 1px solid $border;
             border-radius: 4px;
             padding: 8px 12px;
-            color: #000000;
+            color: $fg;
             min-height: 20px;
         }
         QSpinBox:focus {
             border: 2px solid #00D9FF;
-            background-color: #fafafa;
+            background-color: $focus_bg;
         }
         QTabWidget::pane {
-            border: 1px solid #cccccc;
-            background-color: #ffffff;
+            border: 1px solid $border;
+            background-color: $bg;
         }
         QTabBar::tab {
-            background-color: #f0f0f0;
-            color: #000000;
-            border: 1px solid #cccccc;
+            background-color: $button_bg;
+            color: $fg;
+            border: 1px solid $border;
             padding: 8px 16px;
             margin-right: 2px;
         }
         QTabBar::tab:selected {
-            background-color: #ffffff;
+            background-color: $bg;
             border-bottom: 3px solid #00D9FF;
             font-weight: bold;
         }
         QTabBar::tab:hover {
-            background-color: #e0e0e0;
+            background-color: $hover_bg;
             border-bottom: 2px solid #00D9FF;
         }
         QDialog {
-            background-color: #ffffff;
-            color: #000000;
+            background-color: $bg;
+            color: $fg;
         }
         QMessageBox {
-            background-color: #ffffff;
-            color: #000000;
+            background-color: $bg;
+            color: $fg;
         }
         QToolTip {
-            background-color: #ffffff;
-            color: #000000;
-            border: 1px solid #cccccc;
+            background-color: $bg;
+            color: $fg;
+            border: 1px solid $border;
             border-radius: 4px;
             padding: 8px 12px;
             font-size: 12px;
         }
     """
+)
+
+# Theme colors, read-only
+_DARK_PALETTE = MappingProxyType(
+    {
+        "bg": "#2b2b2b",
+        "fg": "#ffffff",
+        "border": "#555555",
+        "button_bg": "#3c3c3c",
+        "hover_bg": "#4a4a4a",
+        "pressed_bg": "#2a2a2a",
+        "muted": "#666666",
+        "disabled_bg": "#2b2b2b",
+        "disabled_border": "#3c3c3c",
+        "indicator_bg": "#3c3c3c",
+        "input_bg": "#1e1e1e",
+        "progress_bg": "#1e1e1e",
+        "focus_bg": "#2b2b2b",
+    }
+)
+
+_LIGHT_PALETTE = MappingProxyType(
+    {
+        "bg": "#ffffff",
+        "fg": "#000000",
+        "border": "#cccccc",
+        "button_bg": "#f0f0f0",
+        "hover_bg": "#e0e0e0",
+        "pressed_bg": "#d0d0d0",
+        "muted": "#999999",
+        "disabled_bg": "#f5f5f5",
+        "disabled_border": "#e0e0e0",
+        "indicator_bg": "#ffffff",
+        "input_bg": "#ffffff",
+        "progress_bg": "#f0f0f0",
+        "focus_bg": "#fafafa",
+    }
+)
+
+
+class ThemeManager:
+    """Manages application themes"""
+
+    # Cache for system theme detection (performance optimization),
+    # valid while the application palette is unchanged
+    _system_theme_cache: Optional[str] = None
+    _system_palette_key: Optional[int] = None
+    # Stylesheet currently set on the application ("dark" or "light")
+    _active_theme: Optional[str] = None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2)
+    def get_stylesheet(theme: str) -> str:
+        """Build the stylesheet for a theme (cached)
+
+        Args:
+            theme: "dark" or "light"
+
+        Returns:
+            Qt stylesheet string
+        """
+        palette = _DARK_PALETTE if theme == "dark" else _LIGHT_PALETTE
+        return _QSS_TEMPLATE.substitute(palette)
 
     @staticmethod
     def detect_system_theme(force_reload: bool = False) -> str:
@@ -420,16 +318,22 @@ class ThemeManager:
         Returns:
             "dark" or "light"
         """
-        # Use cache if available (performance optimization)
-        if not force_reload and ThemeManager._system_theme_cache is not None:
-            return ThemeManager._system_theme_cache
-
         app = QApplication.instance()
         if app is None:
             ThemeManager._system_theme_cache = "light"
+            ThemeManager._system_palette_key = None
             return "light"  # Default to light if no app instance
 
         palette = app.palette()
+        palette_key = palette.cacheKey()
+        # Use cache if available (performance optimization)
+        if (
+            not force_reload
+            and ThemeManager._system_theme_cache is not None
+            and ThemeManager._system_palette_key == palette_key
+        ):
+            return ThemeManager._system_theme_cache
+
         bg_color = palette.color(QPalette.ColorRole.Window)
         # Calculate brightness
         brightness = (bg_color.red() + bg_color.green() + bg_color.blue()) / 3
@@ -437,6 +341,7 @@ class ThemeManager:
         # If brightness is less than 128, it's likely dark mode
         theme = "dark" if brightness < 128 else "light"
         ThemeManager._system_theme_cache = theme
+        ThemeManager._system_palette_key = palette_key
         return theme
 
     @staticmethod
@@ -455,17 +360,16 @@ class ThemeManager:
 
         if theme_mode == "auto":
             # Detect system theme
-            system_theme = ThemeManager.detect_system_theme()
-            logger.debug(f"Auto theme detected: {system_theme}")
-            stylesheet = (
-                ThemeManager.DARK_STYLESHEET
-                if system_theme == "dark"
-                else ThemeManager.LIGHT_STYLESHEET
-            )
-        elif theme_mode == "dark":
-            stylesheet = ThemeManager.DARK_STYLESHEET
-        else:  # light
-            stylesheet = ThemeManager.LIGHT_STYLESHEET
-
-        app.setStyleSheet(stylesheet)
+            theme = ThemeManager.detect_system_theme()
+            logger.debug(f"Auto theme detected: {theme}")
+        else:
+            theme = "dark" if theme_mode == "dark" else "light"
+
+        # Setting a stylesheet makes Qt reparse it and repolish every widget
+        if theme == ThemeManager._active_theme:
+            logger.debug(f"Theme already active: {theme}")
+            return
+
+        app.setStyleSheet(ThemeManager.get_stylesheet(theme))
+        ThemeManager._active_theme = theme
         logger.info(f"Theme applied: {theme_mode}")
@@ -4,44 +4,81 @@ CachyOS Multi-Updater - Toast Notifications
 Provides toast-style notifications for the GUI
 """
 
-from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout
+from typing import Optional
+from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QVBoxLayout
 from PyQt6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, pyqtSignal
 from PyQt6.QtGui import QFont
 
-# Handle imports for both direct execution and module import
 try:
-    from .debug_logger import get_logger
+    from ..widgets.widgets import ClickableLabel
+except ImportError:
+    from widgets.widgets import ClickableLabel
+
+# Label style for when the application stylesheet has no QLabel#toast_label
+# rule (ThemeManager not applied yet, or not at all)
+_FALLBACK_LABEL_STYLE = """
+    QLabel#toast_label {
+        background-color: rgba(43, 43, 43, 240);
+        color: #ffffff;
+        padding: 8px 12px;
+        border-radius: 6px;
+        border: 1px solid #555555;
+    }
+"""
+
+# Handle imports for both direct execution and module import (resolved once)
+try:
+    from ..utils.debug_logger import get_logger as _get_debug_logger
 except ImportError:
     try:
-        from debug_logger import get_logger
+        from debug_logger import get_logger as _get_debug_logger
     except ImportError:
+        _get_debug_logger = None
+
 
-        def get_logger():
-            class DummyLogger:
-                def debug(self, *args, **kwargs):
-                    pass
+class _DummyLogger:
+    def debug(self, *args, **kwargs):
+        pass
 
-                def info(self, *args, **kwargs):
-                    pass
+    def info(self, *args, **kwargs):
+        pass
 
-                def warning(self, *args, **kwargs):
-                    pass
+    def warning(self, *args, **kwargs):
+        pass
 
-                def error(self, *args, **kwargs):
-                    pass
+    def error(self, *args, **kwargs):
+        pass
 
-                def exception(self, *args, **kwargs):
-                    pass
+    def exception(self, *args, **kwargs):
+        pass
 
-            return DummyLogger()
+
+_logger = None
+
+
+def get_logger():
+    """Get the GUI debug logger (created on first use, then cached)"""
+    global _logger
+    if _logger is None:
+        _logger = _get_debug_logger() if _get_debug_logger else _DummyLogger()
+    return _logger
 
 
 class ToastNotification(QWidget):
-    """Toast notification widget"""
+    """Toast notification widget
+
+    A clickable toast emits clicked when its message is clicked.
+    """
 
     closed = pyqtSignal()
+    clicked = pyqtSignal()
+
+    # Label font, shared by all toasts (setFont copies the value)
+    _label_font: Optional[QFont] = None
 
-    def __init__(self, message: str, duration: int = 3000, parent=None):
+    def __init__(
+        self, message: str, duration: int = 3000, parent=None, clickable: bool = False
+    ):
         super().__init__(parent)
         self.logger = get_logger()
         self.logger.debug(f"ToastNotification created: {message[:50]}...")
@@ -53,26 +90,25 @@ class ToastNotification(QWidget):
             | Qt.WindowType.Tool
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        # Toasts are shown once; free the widget when it closes
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
 
         # Create layout
         layout = QVBoxLayout()
         layout.setContentsMargins(12, 12, 12, 12)
 
         # Message label
-        self.label = QLabel(message)
+        if clickable:
+            self.label = ClickableLabel(message)
+            self.label.clicked.connect(self.clicked)
+        else:
+            self.label = QLabel(message)
         self.label.setWordWrap(True)
-        font = QFont()
-        font.setPointSize(10)
-        self.label.setFont(font)
-        self.label.setStyleSheet("""
-            QLabel {
-                background-color: rgba(43, 43, 43, 240);
-                color: #ffffff;
-                padding: 8px 12px;
-                border-radius: 6px;
-                border: 1px solid #555555;
-            }
-        """)
+        self.label.setFont(self._get_label_font())
+        # Styled by the application stylesheet (QLabel#toast_label, ThemeManager)
+        self.label.setObjectName("toast_label")
+        if "#toast_label" not in QApplication.instance().styleSheet():
+            self.label.setStyleSheet(_FALLBACK_LABEL_STYLE)
         layout.addWidget(self.label)
 
         self.setLayout(layout)
@@ -80,60 +116,84 @@ class ToastNotification(QWidget):
         # Adjust size
         self.adjustSize()
 
-        # Animation
-        self.fade_animation = None
+        # Animation (one fade animation, reused for fade in and fade out)
+        self.fade_animation = QPropertyAnimation(self, b"windowOpacity", self)
+        self.fade_animation.setDuration(200)
+        self.fade_animation.finished.connect(self._on_fade_finished)
+        self._fading_out = False
         self.slide_animation = None
 
+        # Auto-close timer
+        self._close_timer = QTimer(self)
+        self._close_timer.setSingleShot(True)
+        self._close_timer.timeout.connect(self.fade_out)
+
+    @classmethod
+    def _get_label_font(cls) -> QFont:
+        """Create the label font once and share it between all toasts"""
+        if cls._label_font is None:
+            font = QFont()
+            font.setPointSize(10)
+            cls._label_font = font
+        return cls._label_font
+
     def showEvent(self, event):
         """Show toast with animation"""
         super().showEvent(event)
 
-        # Position at top-right of parent
-        if self.parent():
-            parent_rect = self.parent().geometry()
-            self.move(parent_rect.right() - self.width() - 20, parent_rect.top() + 20)
+        # Position at top-right of parent, or of the usable screen area
+        # (excluding panels) if there is no parent
+        parent = self.parent()
+        if parent:
+            rect = parent.geometry()
         else:
-            # Center on screen if no parent
-            from PyQt6.QtWidgets import QApplication
-
-            screen = QApplication.primaryScreen().geometry()
-            self.move(screen.right() - self.width() - 20, screen.top() + 20)
+            screen = self.screen() or QApplication.primaryScreen()
+            rect = screen.availableGeometry()
+        self.move(rect.right() - self.width() - 20, rect.top() + 20)
 
         # Fade in animation
         self.setWindowOpacity(0.0)
-        self.fade_animation = QPropertyAnimation(self, b"windowOpacity")
-        self.fade_animation.setDuration(200)
-        self.fade_animation.setStartValue(0.0)
-        self.fade_animation.setEndValue(1.0)
-        self.fade_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self.fade_animation.start()
+        self._fading_out = False
+        self._fade(0.0, 1.0, QEasingCurve.Type.OutCubic)
 
         # Auto-close timer
-        QTimer.singleShot(self.duration, self.fade_out)
+        self._close_timer.start(self.duration)
 
     def fade_out(self):
         """Fade out and close"""
-        if self.fade_animation:
-            self.fade_animation.stop()
-
-        self.fade_animation = QPropertyAnimation(self, b"windowOpacity")
-        self.fade_animation.setDuration(200)
-        self.fade_animation.setStartValue(1.0)
-        self.fade_animation.setEndValue(0.0)
-        self.fade_animation.setEasingCurve(QEasingCurve.Type.InCubic)
-        self.fade_animation.finished.connect(self.close)
+        self._close_timer.stop()
+        self._fading_out = True
+        self._fade(1.0, 0.0, QEasingCurve.Type.InCubic)
+
+    def _fade(self, start: float, end: float, easing: QEasingCurve.Type):
+        """(Re)start the fade animation with new values"""
+        self.fade_animation.stop()
+        self.fade_animation.setStartValue(start)
+        self.fade_animation.setEndValue(end)
+        self.fade_animation.setEasingCurve(easing)
         self.fade_animation.start()
 
+    def _on_fade_finished(self):
+        """Close once the fade out has finished"""
+        if self._fading_out:
+            self.close()
+
     def closeEvent(self, event):
         """Handle close event"""
+        self._close_timer.stop()
+        self.fade_animation.stop()
+        try:
+            self.fade_animation.finished.disconnect(self._on_fade_finished)
+        except TypeError:
+            pass  # Already disconnected by an earlier close
         self.closed.emit()
         super().closeEvent(event)
 
 
 def show_toast(
-    parent: QWidget, message: str, duration: int = 3000
+    parent: QWidget, message: str, duration: int = 3000, clickable: bool = False
 ) -> ToastNotification:
     """Show a toast notification"""
-    toast = ToastNotification(message, duration, parent)
+    toast = ToastNotification(message, duration, parent, clickable)
     toast.show()
     return toast
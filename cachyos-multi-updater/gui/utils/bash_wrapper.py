@@ -17,6 +17,9 @@ import logging
 # Import from new structure
 from .debug_logger import get_logger
 
+# Valid bash function names (checked before building the bash command)
+_FUNCTION_NAME_RE = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*")
+
 
 @dataclass
 class UpdateCheckResult:
@@ -59,9 +62,7 @@ class BashWrapper:
             Tuple of (stdout, return_code)
         """
         # Security: Validate function_name to prevent command injection
-        if not function_name or not re.match(
-            r"^[a-zA-Z_][a-zA-Z0-9_]*$", function_name
-        ):
+        if not function_name or not _FUNCTION_NAME_RE.fullmatch(function_name):
             self.logger.error(f"Invalid function name: {function_name}")
             return "", 1
 
@@ -4,28 +4,79 @@ CachyOS Multi-Updater - Password Manager
 Handles secure storage and retrieval of sudo password using system keyring
 """
 
-import base64
+import functools
+import importlib.util
 import os
+from contextlib import suppress
 from pathlib import Path
 from typing import Optional
 
-# Try to use keyring (system keyring - most secure)
-try:
-    import keyring
+# System keyring (most secure), imported on first use
+_keyring = None
+_keyring_probed = False
 
-    HAS_KEYRING = True
-except ImportError:
-    HAS_KEYRING = False
+# Upper bound for reading the key file (a Fernet key is 44 bytes)
+_KEY_READ_SIZE = 128
 
-# Fallback: Use Fernet encryption (cryptography library)
-try:
-    from cryptography.fernet import Fernet
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+# Fernet tokens start with the 0x80 version byte, urlsafe base64 encoded
+_FERNET_TOKEN_PREFIX = "g"
 
-    HAS_CRYPTOGRAPHY = True
-except ImportError:
-    HAS_CRYPTOGRAPHY = False
+# Fallback: Use Fernet encryption (cryptography library), imported on first use
+_FERNET = None
+
+
+@functools.lru_cache(maxsize=1)
+def _has_keyring() -> bool:
+    """Check whether keyring is installed without importing it"""
+    return importlib.util.find_spec("keyring") is not None
+
+
+def _get_keyring():
+    """Import keyring once
+
+    Returns:
+        keyring module or None if not available
+    """
+    global _keyring, _keyring_probed
+    if not _keyring_probed:
+        _keyring_probed = True
+        try:
+            import keyring
+
+            _keyring = keyring
+        except ImportError:
+            _keyring = None
+    return _keyring
+
+
+@functools.lru_cache(maxsize=1)
+def _has_cryptography() -> bool:
+    """Check whether cryptography is installed without importing it"""
+    return importlib.util.find_spec("cryptography") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _storage_method() -> Optional[str]:
+    """Describe the storage backend that will be used (None if there is none)"""
+    if _has_keyring():
+        return "System Keyring (most secure)"
+    if _has_cryptography():
+        return "Fernet Encryption (secure)"
+    return None
+
+
+def _load_fernet():
+    """Import the Fernet class once
+
+    Returns:
+        cryptography.fernet.Fernet
+    """
+    global _FERNET
+    if _FERNET is None:
+        from cryptography.fernet import Fernet
+
+        _FERNET = Fernet
+    return _FERNET
 
 
 class PasswordManager:
@@ -43,6 +94,9 @@ class PasswordManager:
         """
         self.script_dir = Path(script_dir)
         self.key_file = self.script_dir / ".password-key"
+        self._config_manager = None
+        self._cached_key: Optional[bytes] = None
+        self._cached_fernet = None
 
         # Initialize logger
         try:
@@ -63,6 +117,25 @@ class PasswordManager:
                     handler = logging.NullHandler()
                     self.logger.addHandler(handler)
 
+    def _get_config_manager(self):
+        """
+        Get the ConfigManager for the script directory (created once)
+
+        Returns:
+            ConfigManager instance or None if not available
+        """
+        if self._config_manager is None:
+            # Import ConfigManager here to avoid circular imports
+            try:
+                from ..core.config_manager import ConfigManager
+            except ImportError:
+                try:
+                    from config_manager import ConfigManager
+                except ImportError:
+                    return None
+            self._config_manager = ConfigManager(self.script_dir)
+        return self._config_manager
+
     def _get_encryption_key(self) -> Optional[bytes]:
         """
         Get or generate encryption key for Fernet
@@ -70,14 +143,21 @@ class PasswordManager:
         Returns:
             Encryption key bytes or None if cryptography not available
         """
-        if not HAS_CRYPTOGRAPHY:
+        if not _has_cryptography():
             return None
+        if self._cached_key is not None:
+            return self._cached_key
 
         # Try to load existing key
         if self.key_file.exists():
             try:
-                with open(self.key_file, "rb") as f:
-                    return f.read()
+                # Single unbuffered read, the key is tiny
+                fd = os.open(str(self.key_file), os.O_RDONLY)
+                try:
+                    self._cached_key = os.read(fd, _KEY_READ_SIZE)
+                finally:
+                    os.close(fd)
+                return self._cached_key
             except (OSError, IOError) as e:
                 self.logger.debug(f"Failed to read key file: {e}")
             except Exception as e:
@@ -85,11 +165,18 @@ class PasswordManager:
 
         # Generate new key
         try:
+            Fernet = _load_fernet()
             key = Fernet.generate_key()
-            # Store key securely (only readable by owner)
-            with open(self.key_file, "wb") as f:
-                os.chmod(self.key_file, 0o600)  # rw-------
-                f.write(key)
+            # Store key securely: created with rw------- in one step, and never
+            # overwrite an existing key (O_EXCL)
+            fd = os.open(
+                str(self.key_file), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600
+            )
+            try:
+                os.write(fd, key)
+            finally:
+                os.close(fd)
+            self._cached_key = key
             return key
         except (OSError, IOError, PermissionError) as e:
             self.logger.error(f"Failed to write key file: {e}")
@@ -98,27 +185,20 @@ class PasswordManager:
             self.logger.warning(f"Unexpected error generating/writing key: {e}")
             return None
 
-    def _derive_key_from_password(self, password: str, salt: bytes) -> bytes:
+    def _get_fernet(self):
         """
-        Derive encryption key from password (for Fernet)
-
-        Args:
-            password: User password
-            salt: Salt bytes
+        Get the Fernet instance for the stored key (created once)
 
         Returns:
-            Derived key bytes
+            Fernet instance or None if no key is available
         """
-        if not HAS_CRYPTOGRAPHY:
-            return None
-
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+        if self._cached_fernet is None:
+            key = self._get_encryption_key()
+            if not key:
+                return None
+            Fernet = _load_fernet()
+            self._cached_fernet = Fernet(key)
+        return self._cached_fernet
 
     def save_password(self, password: str) -> bool:
         """
@@ -134,47 +214,36 @@ class PasswordManager:
             return False
 
         # Method 1: Use system keyring (most secure)
-        if HAS_KEYRING:
-            try:
+        keyring = _get_keyring()
+        if keyring is not None:
+            # Fallback to encryption if keyring fails
+            with suppress(Exception):
                 keyring.set_password(self.SERVICE_NAME, self.USERNAME, password)
                 return True
-            except Exception:
-                # Fallback to encryption if keyring fails
-                pass
 
         # Method 2: Use Fernet encryption (fallback)
-        if HAS_CRYPTOGRAPHY:
+        if _has_cryptography():
             try:
-                key = self._get_encryption_key()
-                if not key:
+                fernet = self._get_fernet()
+                if fernet is None:
                     return False
 
-                fernet = Fernet(key)
                 encrypted = fernet.encrypt(password.encode())
 
-                # Store encrypted password in config file (base64 encoded)
-                # We need to store it in the config file since we can't use keyring
-                encrypted_b64 = base64.b64encode(encrypted).decode()
+                # Store the token in the config file since we can't use keyring
+                # (Fernet tokens are already urlsafe base64)
+                encrypted_b64 = encrypted.decode("ascii")
 
                 # Store encrypted password in config file via ConfigManager
-                # Import ConfigManager here to avoid circular imports
-                try:
-                    from .config_manager import ConfigManager
-                except ImportError:
-                    try:
-                        from config_manager import ConfigManager
-                    except ImportError:
-                        self.logger.error(
-                            "ConfigManager not available for storing encrypted password"
-                        )
-                        return False
-
-                config_manager = ConfigManager(self.script_dir)
-                config = config_manager.load_config()
-                config["SUDO_PASSWORD_ENCRYPTED"] = encrypted_b64
-                config_manager.save_config(config)
+                config_manager = self._get_config_manager()
+                if config_manager is None:
+                    self.logger.error(
+                        "ConfigManager not available for storing encrypted password"
+                    )
+                    return False
 
-                return True
+                # Only this key is rewritten, in a single atomic write
+                return config_manager.update({"SUDO_PASSWORD_ENCRYPTED": encrypted_b64})
             except (ValueError, TypeError, AttributeError) as e:
                 self.logger.error(f"Failed to encrypt password: {e}")
                 return False
@@ -193,38 +262,35 @@ class PasswordManager:
             Decrypted password or None if not found/error
         """
         # Method 1: Try system keyring first
-        if HAS_KEYRING:
-            try:
+        keyring = _get_keyring()
+        if keyring is not None:
+            with suppress(Exception):
                 password = keyring.get_password(self.SERVICE_NAME, self.USERNAME)
                 if password:
                     return password
-            except Exception:
-                pass
 
         # Method 2: Try encrypted config (for Fernet fallback)
-        if HAS_CRYPTOGRAPHY:
+        if _has_cryptography():
             try:
-                # Import ConfigManager here to avoid circular imports
-                try:
-                    from .config_manager import ConfigManager
-                except ImportError:
-                    try:
-                        from config_manager import ConfigManager
-                    except ImportError:
-                        return None
+                config_manager = self._get_config_manager()
+                if config_manager is None:
+                    return None
 
-                config_manager = ConfigManager(self.script_dir)
                 config = config_manager.load_config()
                 encrypted_b64 = config.get("SUDO_PASSWORD_ENCRYPTED")
 
                 if encrypted_b64:
                     # Decrypt password
-                    key = self._get_encryption_key()
-                    if not key:
+                    fernet = self._get_fernet()
+                    if fernet is None:
                         return None
 
-                    fernet = Fernet(key)
-                    encrypted = base64.b64decode(encrypted_b64.encode())
+                    encrypted = encrypted_b64.encode("ascii")
+                    if not encrypted_b64.startswith(_FERNET_TOKEN_PREFIX):
+                        # Written by older versions with an extra base64 layer
+                        import base64
+
+                        encrypted = base64.b64decode(encrypted)
                     password = fernet.decrypt(encrypted).decode()
                     return password
             except Exception as e:
@@ -241,34 +307,28 @@ class PasswordManager:
             True if successful, False otherwise
         """
         # Method 1: Delete from keyring
-        if HAS_KEYRING:
+        keyring = _get_keyring()
+        if keyring is not None:
             try:
                 keyring.delete_password(self.SERVICE_NAME, self.USERNAME)
-            except keyring.errors.PasswordDeleteError:
-                # Password doesn't exist, that's OK
-                pass
-            except (keyring.errors.KeyringError, RuntimeError) as e:
-                self.logger.debug(f"Failed to delete password from keyring: {e}")
             except Exception as e:
-                self.logger.warning(
-                    f"Unexpected error deleting password from keyring: {e}"
-                )
+                # Classify by name so keyring.errors is never looked up
+                error_names = {cls.__name__ for cls in type(e).__mro__}
+                if "PasswordDeleteError" in error_names:
+                    # Password doesn't exist, that's OK
+                    pass
+                elif "KeyringError" in error_names or isinstance(e, RuntimeError):
+                    self.logger.debug(f"Failed to delete password from keyring: {e}")
+                else:
+                    self.logger.warning(
+                        f"Unexpected error deleting password from keyring: {e}"
+                    )
 
         # Method 2: Delete encrypted password from config (for Fernet)
         try:
-            try:
-                from .config_manager import ConfigManager
-            except ImportError:
-                try:
-                    from config_manager import ConfigManager
-                except ImportError:
-                    ConfigManager = None
-
-            if ConfigManager:
-                config_manager = ConfigManager(self.script_dir)
-                config = config_manager.load_config()
-                config.pop("SUDO_PASSWORD_ENCRYPTED", None)
-                config_manager.save_config(config)
+            config_manager = self._get_config_manager()
+            if config_manager is not None:
+                config_manager.update({"SUDO_PASSWORD_ENCRYPTED": None})
         except Exception as e:
             self.logger.debug(f"Failed to delete encrypted password from config: {e}")
 
@@ -290,7 +350,7 @@ class PasswordManager:
         Returns:
             True if keyring or cryptography is available
         """
-        return HAS_KEYRING or HAS_CRYPTOGRAPHY
+        return _storage_method() is not None
 
     def get_storage_method(self) -> str:
         """
@@ -299,9 +359,7 @@ class PasswordManager:
         Returns:
             Description string
         """
-        if HAS_KEYRING:
-            return "System Keyring (most secure)"
-        elif HAS_CRYPTOGRAPHY:
-            return "Fernet Encryption (secure)"
-        else:
+        method = _storage_method()
+        if method is None:
             return "Not available (install python-keyring or cryptography)"
+        return method
@@ -39,6 +39,16 @@ except ImportError:
             return DummyLogger()
 
 
+_VERSION_RE = re.compile(r"^[0-9]+\.[0-9]+\.[0-9]+$")
+_SCRIPT_VERSION_RE = re.compile(r'["\']([0-9.]+)["\']')
+_TAG_VERSION_RE = re.compile(r"v?([0-9.]+)$")
+
+# Release API responses with their ETag; revalidated with If-None-Match, and a
+# 304 reply does not count against GitHub's rate limit
+_RELEASE_CACHE_FILE = Path.home() / ".cache" / "cachyos-multi-updater" / "releases.json"
+_RELEASE_CACHE_ENTRIES = 8
+
+
 class VersionChecker:
     """Checks for updates from GitHub"""
 
@@ -51,6 +61,16 @@ class VersionChecker:
         self.logger.debug(f"VersionChecker initialized for {github_repo}")
         self.local_version = self.get_local_version()
         self.latest_version = None
+        # Assets of tagged releases fetched by this checker (API URL -> assets)
+        self._release_assets: Dict[str, List[Dict]] = {}
+        # One session per checker so repeated API calls reuse the connection
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "Accept": "application/vnd.github.v3+json",
+                "User-Agent": "CachyOS-Multi-Updater-GUI",
+            }
+        )
 
     def get_local_version(self) -> str:
         """Get local script version from VERSION file (root), fallback to update-all.sh"""
@@ -62,7 +82,7 @@ class VersionChecker:
             try:
                 with open(version_file, "r", encoding="utf-8") as f:
                     version = f.read().strip()
-                    if version and re.match(r"^[0-9]+\.[0-9]+\.[0-9]+$", version):
+                    if version and _VERSION_RE.match(version):
                         return version
             except (OSError, IOError, ValueError):
                 pass
@@ -74,7 +94,7 @@ class VersionChecker:
                 for line in f:
                     if "readonly SCRIPT_VERSION=" in line:
                         # Extract version from line like: readonly SCRIPT_VERSION="1.0.6"
-                        match = re.search(r'["\']([0-9.]+)["\']', line)
+                        match = _SCRIPT_VERSION_RE.search(line)
                         if match:
                             return match.group(1)
         except (OSError, IOError):
@@ -122,15 +142,7 @@ class VersionChecker:
 
         try:
             # Use requests library for secure HTTP requests with SSL verification
-            response = requests.get(
-                api_url,
-                headers={
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "CachyOS-Multi-Updater-GUI",
-                },
-                timeout=10,
-                verify=True,
-            )
+            response = self._session.get(api_url, timeout=10, verify=True)
             response.raise_for_status()
             data = response.json()
             tag_name = data.get("tag_name", "")
@@ -147,22 +159,14 @@ class VersionChecker:
 
         try:
             # Use requests library for secure HTTP requests with SSL verification
-            response = requests.get(
-                tags_url,
-                headers={
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "CachyOS-Multi-Updater-GUI",
-                },
-                timeout=10,
-                verify=True,
-            )
+            response = self._session.get(tags_url, timeout=10, verify=True)
             response.raise_for_status()
             data = response.json()
             versions = []
             for ref in data:
                 ref_name = ref.get("ref", "")
                 # Extract version from refs/tags/v1.0.6
-                match = re.search(r"v?([0-9.]+)$", ref_name)
+                match = _TAG_VERSION_RE.search(ref_name)
                 if match:
                     versions.append(match.group(1))
 
@@ -259,21 +263,61 @@ class VersionChecker:
         else:
             api_url = f"https://api.github.com/repos/{github_repo}/releases/latest"
 
+        if api_url in self._release_assets:
+            return self._release_assets[api_url]
+
+        cache = self._load_release_cache()
+        cached = cache.get(api_url)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+
         try:
             # Use requests library for secure HTTP requests with SSL verification
-            import requests
-            response = requests.get(
-                api_url,
-                headers={
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "CachyOS-Multi-Updater-GUI",
-                },
-                timeout=10,
-                verify=True,
+            response = self._session.get(
+                api_url, headers=headers, timeout=10, verify=True
             )
-            response.raise_for_status()
-            data = response.json()
-            assets = data.get("assets", [])
-            return assets
+            if response.status_code == 304 and cached:
+                assets = cached["assets"]
+            else:
+                response.raise_for_status()
+                data = response.json()
+                assets = data.get("assets", [])
+                etag = response.headers.get("ETag")
+                if etag:
+                    cache.pop(api_url, None)
+                    cache[api_url] = {"etag": etag, "assets": assets}
+                    self._save_release_cache(cache)
         except (RequestException, Timeout, RequestsHTTPError, json.JSONDecodeError, ValueError):
             return []
+
+        # A tag's release does not change; "latest" is revalidated every time
+        if version:
+            self._release_assets[api_url] = assets
+        return assets
+
+    def _load_release_cache(self) -> Dict[str, Dict]:
+        """Load cached release responses (API URL -> {"etag", "assets"})"""
+        try:
+            with open(_RELEASE_CACHE_FILE, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {
+            url: entry
+            for url, entry in cache.items()
+            if isinstance(entry, dict)
+            and isinstance(entry.get("etag"), str)
+            and isinstance(entry.get("assets"), list)
+        }
+
+    def _save_release_cache(self, cache: Dict[str, Dict]) -> None:
+        """Save cached release responses, keeping only the newest entries"""
+        while len(cache) > _RELEASE_CACHE_ENTRIES:
+            del cache[next(iter(cache))]
+        try:
+            _RELEASE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(_RELEASE_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+        except OSError:
+            pass  # Cache is optional
@@ -4,7 +4,7 @@ Custom Widgets for CachyOS Multi-Updater
 
 from .widgets import ClickableLabel, FlatButton
 from .fa_checkbox import FACheckBox
-from .fa_icons import get_fa_icon, apply_fa_font, FA_ICONS
+from .fa_icons import get_fa_icon, apply_fa_font, create_fa_button, FA_ICONS
 
 __all__ = [
     "ClickableLabel",
@@ -12,5 +12,6 @@ __all__ = [
     "FACheckBox",
     "get_fa_icon",
     "apply_fa_font",
+    "create_fa_button",
     "FA_ICONS",
 ]
@@ -7,7 +7,7 @@ Custom checkbox that uses Font Awesome check icon
 from typing import Optional
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QMouseEvent
+from PyQt6.QtGui import QMouseEvent, QPixmap
 
 try:
     from .fa_icons import get_fa_icon, apply_fa_font, FA_ICONS
@@ -21,10 +21,41 @@ class FACheckBox(QWidget):
     toggled = pyqtSignal(bool)
     clicked = pyqtSignal()
 
+    # Indicator stylesheets (checked uses the accent color)
+    _STYLE_CHECKED = """
+                QLabel#fa_checkbox_indicator {
+                    border: 2px solid #00D9FF;
+                    border-radius: 3px;
+                    background-color: #00D9FF;
+                    color: #ffffff;
+                }
+            """
+    _STYLE_UNCHECKED = {
+        "dark": """
+                QLabel#fa_checkbox_indicator {
+                    border: 2px solid #555555;
+                    border-radius: 3px;
+                    background-color: #3c3c3c;
+                }
+            """,
+        "light": """
+                QLabel#fa_checkbox_indicator {
+                    border: 2px solid #cccccc;
+                    border-radius: 3px;
+                    background-color: #ffffff;
+                }
+            """,
+    }
+
+    # Check icon pixmap shared by all instances (rendered on first use)
+    _check_pixmap: Optional[QPixmap] = None
+    _check_pixmap_ready = False
+
     def __init__(self, text: str = "", parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._checked = False
         self._text = text
+        self._applied_style: Optional[str] = None
 
         layout = QHBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -55,71 +86,85 @@ class FACheckBox(QWidget):
         """Update check icon based on checked state"""
         if self._checked:
             # Show Font Awesome check icon
-            icon, text = get_fa_icon("check", "", size=12, color="#ffffff")
-            if icon:
-                pixmap = icon.pixmap(14, 14)
+            pixmap = self._get_check_pixmap()
+            if pixmap is not None:
                 self.check_label.setPixmap(pixmap)
             else:
                 self.check_label.setText(FA_ICONS.get("check", "✓"))
                 apply_fa_font(self.check_label, size=12)
             # Use theme colors - checked state uses accent color
-            self.check_label.setStyleSheet("""
-                QLabel#fa_checkbox_indicator {
-                    border: 2px solid #00D9FF;
-                    border-radius: 3px;
-                    background-color: #00D9FF;
-                    color: #ffffff;
-                }
-            """)
+            style = self._STYLE_CHECKED
         else:
             # Empty checkbox - clear icon but set stylesheet for visibility
             self.check_label.clear()
-            # Set stylesheet for unchecked state - use theme colors
-            # Get theme from parent widget if available
-            try:
-                from ..ui.theme_manager import ThemeManager
-                # Try to detect theme from parent
-                parent = self.parent()
-                theme = "dark"  # Default
-                if parent:
-                    # Check if parent has theme info
-                    try:
-                        stylesheet = parent.styleSheet()
-                        if "background-color: #ffffff" in stylesheet or "background-color: #f" in stylesheet:
-                            theme = "light"
-                    except Exception:
-                        pass
-                else:
-                    theme = ThemeManager.detect_system_theme()
-            except Exception:
-                theme = "dark"
-            
-            # Set border color based on theme
-            border_color = "#555555" if theme == "dark" else "#cccccc"
-            bg_color = "#3c3c3c" if theme == "dark" else "#ffffff"
-            
-            self.check_label.setStyleSheet(f"""
-                QLabel#fa_checkbox_indicator {{
-                    border: 2px solid {border_color};
-                    border-radius: 3px;
-                    background-color: {bg_color};
-                }}
-            """)
+            style = self._STYLE_UNCHECKED[self._detect_theme()]
+
+        # Re-polishing is expensive; only apply the stylesheet when it changes
+        if style is not self._applied_style:
+            self.check_label.setStyleSheet(style)
+            self._applied_style = style
+
+    @classmethod
+    def _get_check_pixmap(cls) -> Optional[QPixmap]:
+        """Render the check icon once and share it between all checkboxes
+
+        Returns:
+            QPixmap, or None if the Unicode fallback has to be used
+        """
+        if not cls._check_pixmap_ready:
+            icon, _text = get_fa_icon("check", "", size=12, color="#ffffff")
+            cls._check_pixmap = icon.pixmap(14, 14) if icon else None
+            cls._check_pixmap_ready = True
+        return cls._check_pixmap
+
+    def _detect_theme(self) -> str:
+        """Get theme for the unchecked state ("dark" or "light")"""
+        # Get theme from parent widget if available
+        try:
+            from ..ui.theme_manager import ThemeManager
+            # Try to detect theme from parent
+            parent = self.parent()
+            theme = "dark"  # Default
+            if parent:
+                # Check if parent has theme info
+                try:
+                    stylesheet = parent.styleSheet()
+                    if "background-color: #ffffff" in stylesheet or "background-color: #f" in stylesheet:
+                        theme = "light"
+                except Exception:
+                    pass
+            else:
+                theme = ThemeManager.detect_system_theme()
+        except Exception:
+            theme = "dark"
+        return "light" if theme == "light" else "dark"
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """Handle mouse click"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.setChecked(not self._checked)
+            # Update state and indicator first, then notify once it is final
+            self._set_checked_state(not self._checked)
+            self.toggled.emit(self._checked)
             self.clicked.emit()
         super().mousePressEvent(event)
 
     def setChecked(self, checked: bool) -> None:
-        """Set checked state"""
-        if self._checked != checked:
-            self._checked = checked
-            self.update_check_icon()
+        """Set checked state (emits toggled on change, like QCheckBox)"""
+        if self._set_checked_state(checked):
             self.toggled.emit(checked)
 
+    def _set_checked_state(self, checked: bool) -> bool:
+        """Store checked state and refresh the indicator without emitting
+
+        Returns:
+            True if the state changed
+        """
+        if self._checked == checked:
+            return False
+        self._checked = checked
+        self.update_check_icon()
+        return True
+
     def isChecked(self) -> bool:
         """Get checked state"""
         return self._checked
@@ -4,8 +4,10 @@ Font Awesome Icons Helper
 Provides helper function to create Font Awesome icons for buttons
 """
 
-from typing import Optional, Tuple
-from PyQt6.QtWidgets import QWidget
+import functools
+from types import MappingProxyType
+from typing import Callable, Dict, Optional, Tuple
+from PyQt6.QtWidgets import QPushButton, QWidget
 from PyQt6.QtGui import QFont, QIcon
 
 # Try to import qtawesome for icons, fallback to Unicode if not available
@@ -16,27 +18,41 @@ try:
 except ImportError:
     HAS_QTAWESOME = False
 
-# Font Awesome icon Unicode codes (if qtawesome not available)
-FA_ICONS = {
-    "github": "\uf09b",  # fa-github
-    "search": "\uf002",  # fa-search
-    "play": "\uf04b",  # fa-play
-    "stop": "\uf04d",  # fa-stop
-    "cog": "\uf013",  # fa-cog
-    "file-text": "\uf15c",  # fa-file-text
-    "times": "\uf00d",  # fa-times
-    "check": "\uf00c",  # fa-check
-    "save": "\uf0c7",  # fa-save
-    "undo": "\uf0e2",  # fa-undo
-    "folder-open": "\uf07c",  # fa-folder-open
-    "window-close": "\uf2d3",  # fa-window-close
-    "sun": "\uf185",  # fa-sun (light mode)
-    "moon": "\uf186",  # fa-moon (dark mode)
-    "adjust": "\uf042",  # fa-adjust (auto/theme toggle)
-    "language": "\uf1ab",  # fa-language
-    "list-alt": "\uf022",  # fa-list-alt (changelog/release)
-    "terminal": "\uf120",  # fa-terminal
-}
+# Icon name -> (qtawesome name, Font Awesome 4 Unicode glyph), read-only
+_ICON_TABLE = MappingProxyType(
+    {
+        "github": ("fa.github", "\uf09b"),  # fa-github
+        "search": ("fa.search", "\uf002"),  # fa-search
+        "play": ("fa.play", "\uf04b"),  # fa-play
+        "stop": ("fa.stop", "\uf04d"),  # fa-stop
+        "cog": ("fa.cog", "\uf013"),  # fa-cog
+        "file-text": ("fa.file-text", "\uf15c"),  # fa-file-text
+        "times": ("fa.times", "\uf00d"),  # fa-times
+        "check": ("fa.check", "\uf00c"),  # fa-check
+        "save": ("fa.save", "\uf0c7"),  # fa-save
+        "undo": ("fa.undo", "\uf0e2"),  # fa-undo
+        "folder-open": ("fa.folder-open", "\uf07c"),  # fa-folder-open
+        "window-close": ("fa.window-close", "\uf2d3"),  # fa-window-close
+        "sun": ("fa.sun", "\uf185"),  # fa-sun (light mode)
+        "moon": ("fa.moon", "\uf186"),  # fa-moon (dark mode)
+        "adjust": ("fa.adjust", "\uf042"),  # fa-adjust (auto/theme toggle)
+        "language": ("fa.language", "\uf1ab"),  # fa-language
+        "list-alt": ("fa.list-alt", "\uf022"),  # fa-list-alt (changelog/release)
+        "terminal": ("fa.terminal", "\uf120"),  # fa-terminal
+    }
+)
+
+# Unicode glyphs (used when qtawesome is not available), read-only
+FA_ICONS = MappingProxyType({name: glyph for name, (_, glyph) in _ICON_TABLE.items()})
+
+# FontAwesome fonts for apply_fa_font, by point size (setFont copies the value)
+_FA_FONTS: Dict[int, QFont] = {}
+
+
+@functools.lru_cache(maxsize=128)
+def _qta_icon(qta_name: str, color: str) -> QIcon:
+    """Build a qtawesome icon (cached, QIcon is implicitly shared)"""
+    return qta.icon(qta_name, color=color)
 
 
 def get_fa_icon(
@@ -48,32 +64,14 @@ def get_fa_icon(
         tuple: (icon, text) where icon is QIcon if qtawesome available, None otherwise
                text contains Unicode icon if qtawesome not available
     """
+    entry = _ICON_TABLE.get(icon_name)
+    if entry is None:
+        return None, text
+    qta_name, glyph = entry
+
     if HAS_QTAWESOME:
         try:
-            icon_map = {
-                "github": "fa.github",
-                "search": "fa.search",
-                "play": "fa.play",
-                "stop": "fa.stop",
-                "cog": "fa.cog",
-                "file-text": "fa.file-text",
-                "times": "fa.times",
-                "check": "fa.check",
-                "save": "fa.save",
-                "undo": "fa.undo",
-                "folder-open": "fa.folder-open",
-                "window-close": "fa.window-close",
-                "sun": "fa.sun",
-                "moon": "fa.moon",
-                "adjust": "fa.adjust",
-                "language": "fa.language",
-                "list-alt": "fa.list-alt",
-                "terminal": "fa.terminal",
-            }
-            if icon_name in icon_map:
-                icon_color = color or "#000000"
-                icon = qta.icon(icon_map[icon_name], color=icon_color)
-                return icon, text
+            return _qta_icon(qta_name, color or "#000000"), text
         except (ImportError, AttributeError, KeyError):
             # qtawesome not available or icon not found - fallback to Unicode
             pass
@@ -82,12 +80,37 @@ def get_fa_icon(
             pass
 
     # Fallback to Unicode
-    if icon_name in FA_ICONS:
-        return None, f"{FA_ICONS[icon_name]} {text}".strip()
-    return None, text
+    return None, f"{glyph} {text}".strip()
 
 
 def apply_fa_font(button: QWidget, size: int = 12) -> None:
     """Apply Font Awesome font to button if using Unicode icons"""
-    fa_font = QFont("FontAwesome", size)
+    fa_font = _FA_FONTS.get(size)
+    if fa_font is None:
+        fa_font = _FA_FONTS[size] = QFont("FontAwesome", size)
     button.setFont(fa_font)
+
+
+def create_fa_button(
+    icon_name: str, text: str, slot: Optional[Callable] = None, default: bool = False
+) -> QPushButton:
+    """Create a push button with a Font Awesome icon
+
+    Uses the qtawesome icon if available, otherwise the Unicode glyph with the
+    FontAwesome font.
+
+    Args:
+        icon_name: Key in FA_ICONS
+        text: Button text
+        slot: Optional callable connected to clicked
+        default: Make this the dialog's default button
+    """
+    icon, text = get_fa_icon(icon_name, text)
+    button = QPushButton(icon, text) if icon else QPushButton(text)
+    if not icon:
+        apply_fa_font(button)
+    if slot is not None:
+        button.clicked.connect(slot)
+    if default:
+        button.setDefault(True)
+    return button